@@ -14,6 +14,7 @@ import os
 import re
 import sys
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -864,7 +865,7 @@ async def generate_module_index(output_path: Path | None = None):
             )
 
         # Sort by downloads (descending)
-        filtered_modules.sort(key=lambda x: x["downloads"], reverse=True)
+        filtered_modules.sort(key=itemgetter("downloads"), reverse=True)
 
         print(f"\nFiltered to {len(filtered_modules)} modules")
 
@@ -0,0 +1,173 @@
+"""
+Shared fixtures and lightweight stand-ins for the TIM-MCP API clients.
+
+The fakes implement just the client methods the search and module details
+tools call, as plain coroutines, and record the lookups they serve. The
+fixtures install a fresh fake into the tool module that uses the client.
+"""
+
+from typing import Any
+
+import pytest
+
+from tim_mcp.clients.github_client import GitHubClient
+from tim_mcp.exceptions import ModuleNotFoundError
+from tim_mcp.tools import details, search
+
+DEFAULT_REPO_INFO = {
+    "default_branch": "main",
+    "size": 100,
+    "archived": False,
+    "topics": ["core-team", "terraform", "ibm-cloud", "terraform-module"],
+}
+
+
+class AsyncContextFake:
+    """Base class for fakes used as ``async with`` client context managers."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class FakeTerraformClient(AsyncContextFake):
+    """
+    Terraform Registry client fake serving canned search pages in order.
+
+    Search arguments are recorded in ``calls``, version lookups in
+    ``version_lookups`` and details lookups in ``details_lookups``; setting
+    ``exc`` makes the next searches raise it instead of returning a page.
+    Each module's listed version is served as its only stable version unless
+    ``versions`` maps the module name to other versions, and ``details`` maps
+    (name, version) pairs to the details served for them.
+    """
+
+    def __init__(self, responses: list[dict[str, Any]] | None = None):
+        self.responses = list(responses or [])
+        self.versions: dict[str, list[str]] = {}
+        self.details: dict[tuple[str, str], dict[str, Any]] = {}
+        self.calls: list[dict[str, Any]] = []
+        self.version_lookups: list[tuple[str, str, str]] = []
+        self.details_lookups: list[tuple[str, str, str, str]] = []
+        self.exc: Exception | None = None
+        self._listed_versions: dict[tuple[str, str, str], str] = {}
+
+    async def search_modules(self, **kwargs) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        if self.exc is not None:
+            raise self.exc
+        response = self.responses.pop(0)
+        # Remember each module's listed version; malformed entries are left
+        # for the search tool to reject
+        for module in response.get("modules", []):
+            key = (module.get("namespace"), module.get("name"), module.get("provider"))
+            self._listed_versions[key] = module.get("version")
+        return response
+
+    async def get_module_versions(
+        self, namespace: str, name: str, provider: str
+    ) -> list[str]:
+        self.version_lookups.append((namespace, name, provider))
+        if name in self.versions:
+            return self.versions[name]
+        version = self._listed_versions.get((namespace, name, provider))
+        return [version] if version else []
+
+    async def get_module_details(
+        self, namespace: str, name: str, provider: str, version: str = "latest"
+    ) -> dict[str, Any]:
+        self.details_lookups.append((namespace, name, provider, version))
+        return self.details.get((name, version), {})
+
+
+class FakeModuleDetailsClient(AsyncContextFake):
+    """
+    Terraform Registry client fake serving preset module details and versions.
+
+    Details lookups are recorded in ``calls``; setting ``exc`` makes them raise
+    it instead of returning ``details``.
+    """
+
+    def __init__(
+        self,
+        details: dict[str, Any] | None = None,
+        versions: list[str] | None = None,
+    ):
+        self.details = details or {}
+        self.versions = list(versions or [])
+        self.calls: list[dict[str, Any]] = []
+        self.exc: Exception | None = None
+
+    async def get_module_details(self, **kwargs) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        if self.exc is not None:
+            raise self.exc
+        return self.details
+
+    async def get_module_versions(self, **kwargs) -> list[str]:
+        return self.versions
+
+
+class FakeGitHubClient(AsyncContextFake):
+    """
+    GitHub client fake reporting repository info, valid by default.
+
+    ``repos`` maps (owner, repo) pairs to the info served for them instead of
+    ``repo_info``, or to None for repositories that do not exist. Single
+    lookups are recorded in ``lookups`` and batched ones in ``batch_lookups``;
+    setting ``exc`` or ``batch_exc`` makes them raise it instead.
+    """
+
+    parse_github_url = GitHubClient.parse_github_url
+
+    def __init__(self, repo_info: dict[str, Any] | None = None):
+        self.repo_info = DEFAULT_REPO_INFO if repo_info is None else repo_info
+        self.repos: dict[tuple[str, str], dict[str, Any] | None] = {}
+        self.lookups: list[tuple[str, str]] = []
+        self.batch_lookups: list[list[tuple[str, str]]] = []
+        self.exc: Exception | None = None
+        self.batch_exc: Exception | None = None
+
+    async def get_repository_info(self, owner: str, repo: str) -> dict[str, Any]:
+        self.lookups.append((owner, repo))
+        if self.exc is not None:
+            raise self.exc
+        info = self.repos.get((owner, repo), self.repo_info)
+        if info is None:
+            raise ModuleNotFoundError(f"{owner}/{repo}")
+        return info
+
+    async def batch_get_repository_info(
+        self, repos: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        self.batch_lookups.append(list(repos))
+        if self.batch_exc is not None:
+            raise self.batch_exc
+        results = {key: self.repos.get(key, self.repo_info) for key in repos}
+        return {key: info for key, info in results.items() if info is not None}
+
+
+@pytest.fixture
+def fake_terraform_client(monkeypatch):
+    """Patch the search tool's TerraformClient to enter a fresh fake client."""
+    client = FakeTerraformClient()
+    monkeypatch.setattr(search, "TerraformClient", lambda *args, **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def fake_github_client(monkeypatch):
+    """Patch the search tool's GitHubClient to enter a fresh fake client."""
+    client = FakeGitHubClient()
+    monkeypatch.setattr(search, "GitHubClient", lambda *args, **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def fake_details_client(monkeypatch):
+    """Patch the details tool's TerraformClient to enter a fresh fake client."""
+    client = FakeModuleDetailsClient()
+    monkeypatch.setattr(details, "TerraformClient", lambda *args, **kwargs: client)
+    return client
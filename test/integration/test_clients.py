@@ -2,19 +2,19 @@
 Tests for the clients module.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
 from tim_mcp.clients.github_client import GitHubClient
 from tim_mcp.clients.terraform_client import TerraformClient, is_prerelease_version
-from tim_mcp.exceptions import ModuleNotFoundError
+from tim_mcp.exceptions import GitHubError, ModuleNotFoundError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
-    """Create a test configuration."""
+    """Create a test configuration shared by all tests in this module."""
     from tim_mcp.config import Config
 
     return Config()
@@ -28,45 +28,50 @@ def mock_cache():
     return mock_cache
 
 
+def _json_response(body, status_code=200):
+    """Build a real HTTP response carrying ``body`` as JSON."""
+    return httpx.Response(
+        status_code,
+        json=body,
+        request=httpx.Request("GET", "https://example.invalid"),
+    )
+
+
 class TestTerraformClient:
     """Tests for the TerraformClient class."""
 
-    def test_is_prerelease_version_with_beta(self):
-        """Test identifying beta versions as pre-release."""
-        assert is_prerelease_version("1.0.0-beta") is True
-        assert is_prerelease_version("2.1.0-beta.1") is True
-
-    def test_is_prerelease_version_with_alpha(self):
-        """Test identifying alpha versions as pre-release."""
-        assert is_prerelease_version("1.0.0-alpha") is True
-        assert is_prerelease_version("3.2.1-alpha.2") is True
-
-    def test_is_prerelease_version_with_rc(self):
-        """Test identifying release candidate versions as pre-release."""
-        assert is_prerelease_version("1.0.0-rc") is True
-        assert is_prerelease_version("2.0.0-rc.1") is True
-
-    def test_is_prerelease_version_with_draft(self):
-        """Test identifying draft versions as pre-release."""
-        assert is_prerelease_version("2.0.1-draft") is True
-        assert (
-            is_prerelease_version("2.0.1-draft-addons") is True
-        )  # Real example from issue #20
-
-    def test_is_prerelease_version_stable(self):
-        """Test that stable versions are not identified as pre-release."""
-        assert is_prerelease_version("1.0.0") is False
-        assert is_prerelease_version("2.5.3") is False
-        assert is_prerelease_version("10.20.30") is False
-
-    def test_is_prerelease_version_edge_cases(self):
-        """Test edge cases for version identification."""
-        # Version with metadata but no pre-release identifier
-        assert is_prerelease_version("1.0.0+build.123") is False
-        # Empty string
-        assert is_prerelease_version("") is False
-        # Invalid format
-        assert is_prerelease_version("invalid") is False
+    @pytest.mark.parametrize(
+        "version",
+        [
+            "1.0.0-beta",
+            "2.1.0-beta.1",
+            "1.0.0-alpha",
+            "3.2.1-alpha.2",
+            "1.0.0-rc",
+            "2.0.0-rc.1",
+            "2.0.1-draft",
+            "2.0.1-draft-addons",  # Real example from issue #20
+        ],
+    )
+    def test_is_prerelease_version_true(self, version):
+        """Test identifying beta, alpha, rc and draft versions as pre-release."""
+        assert is_prerelease_version(version) is True
+
+    @pytest.mark.parametrize(
+        "version",
+        [
+            "1.0.0",
+            "2.5.3",
+            "10.20.30",
+            "1.0.0+build.123",  # Build metadata but no pre-release identifier
+            "",
+            "invalid",
+            "invalid-version",  # Hyphenated, but not a semantic version
+        ],
+    )
+    def test_is_prerelease_version_false(self, version):
+        """Test that stable and unrecognised versions are not pre-release."""
+        assert is_prerelease_version(version) is False
 
     @pytest.fixture
     def mock_session(self):
@@ -76,37 +81,43 @@ class TestTerraformClient:
 
     @pytest.fixture
     def terraform_client(self, config, mock_cache):
-        """Create a TerraformClient instance with a mock cache."""
-        with patch("httpx.AsyncClient") as mock_session_class:
-            mock_session = MagicMock()
-            mock_session_class.return_value = mock_session
-            client = TerraformClient(config=config, cache=mock_cache)
-            client.client = mock_session
-            return client
-
-    @pytest.mark.asyncio
+        """Create a TerraformClient with a mock cache and injected mock HTTP client."""
+        return TerraformClient(config=config, cache=mock_cache, http_client=MagicMock())
+
+    async def test_shared_http_client_left_open(self, config, mock_cache):
+        """Test that only HTTP clients created by the client are closed on exit."""
+        shared = httpx.AsyncClient()
+
+        async with TerraformClient(config, cache=mock_cache, http_client=shared):
+            pass
+        async with TerraformClient(config, cache=mock_cache) as owning_client:
+            owned = owning_client.client
+
+        assert not shared.is_closed
+        assert owned.is_closed
+        await shared.aclose()
+
     async def test_search_modules(self, terraform_client, mock_cache):
         """Test searching for modules."""
         # Setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "modules": [
-                {
-                    "id": "hashicorp/consul/aws",
-                    "owner": "hashicorp",
-                    "name": "consul",
-                    "provider": "aws",
-                },
-                {
-                    "id": "hashicorp/vault/aws",
-                    "owner": "hashicorp",
-                    "name": "vault",
-                    "provider": "aws",
-                },
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "modules": [
+                    {
+                        "id": "hashicorp/consul/aws",
+                        "owner": "hashicorp",
+                        "name": "consul",
+                        "provider": "aws",
+                    },
+                    {
+                        "id": "hashicorp/vault/aws",
+                        "owner": "hashicorp",
+                        "name": "vault",
+                        "provider": "aws",
+                    },
+                ]
+            }
+        )
         terraform_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -135,24 +146,22 @@ class TestTerraformClient:
             params={"q": "consul", "limit": 10, "offset": 0},
         )
 
-    @pytest.mark.asyncio
     async def test_get_module_versions(self, terraform_client, mock_cache):
         """Test getting module versions."""
         # Setup - use correct nested API structure
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "modules": [
-                {
-                    "versions": [
-                        {"version": "1.0.0"},
-                        {"version": "1.1.0"},
-                        {"version": "1.2.0"},
-                    ]
-                }
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "modules": [
+                    {
+                        "versions": [
+                            {"version": "1.0.0"},
+                            {"version": "1.1.0"},
+                            {"version": "1.2.0"},
+                        ]
+                    }
+                ]
+            }
+        )
         terraform_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -166,33 +175,31 @@ class TestTerraformClient:
             "/modules/hashicorp/consul/aws/versions"
         )
 
-    @pytest.mark.asyncio
     async def test_get_module_versions_filters_prerelease(
         self, terraform_client, mock_cache
     ):
         """Test that pre-release versions are filtered out."""
         # Setup - mix of stable and pre-release versions with correct nested structure
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "modules": [
-                {
-                    "versions": [
-                        {"version": "1.0.0"},
-                        {"version": "1.1.0-beta"},
-                        {"version": "1.2.0"},
-                        {"version": "2.0.0-draft"},
-                        {
-                            "version": "2.0.1-draft-addons"
-                        },  # Real example from issue #20
-                        {"version": "2.1.0-rc.1"},
-                        {"version": "2.2.0"},
-                        {"version": "3.0.0-alpha"},
-                    ]
-                }
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "modules": [
+                    {
+                        "versions": [
+                            {"version": "1.0.0"},
+                            {"version": "1.1.0-beta"},
+                            {"version": "1.2.0"},
+                            {"version": "2.0.0-draft"},
+                            {
+                                "version": "2.0.1-draft-addons"
+                            },  # Real example from issue #20
+                            {"version": "2.1.0-rc.1"},
+                            {"version": "2.2.0"},
+                            {"version": "3.0.0-alpha"},
+                        ]
+                    }
+                ]
+            }
+        )
         terraform_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -206,26 +213,24 @@ class TestTerraformClient:
             "/modules/terraform-ibm-modules/db2-cloud/ibm/versions"
         )
 
-    @pytest.mark.asyncio
     async def test_get_module_versions_all_prerelease(
         self, terraform_client, mock_cache
     ):
         """Test behavior when all versions are pre-release."""
         # Setup - only pre-release versions with correct nested structure
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "modules": [
-                {
-                    "versions": [
-                        {"version": "1.0.0-beta"},
-                        {"version": "1.1.0-alpha"},
-                        {"version": "2.0.0-rc.1"},
-                    ]
-                }
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "modules": [
+                    {
+                        "versions": [
+                            {"version": "1.0.0-beta"},
+                            {"version": "1.1.0-alpha"},
+                            {"version": "2.0.0-rc.1"},
+                        ]
+                    }
+                ]
+            }
+        )
         terraform_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -245,26 +250,19 @@ class TestGitHubClient:
 
     @pytest.fixture
     def github_client(self, config, mock_cache):
-        """Create a GitHubClient instance with a mock cache."""
-        with patch("httpx.AsyncClient") as mock_session_class:
-            mock_session = MagicMock()
-            mock_session_class.return_value = mock_session
-            client = GitHubClient(config=config, cache=mock_cache)
-            client.client = mock_session
-            return client
-
-    @pytest.mark.asyncio
+        """Create a GitHubClient with a mock cache and injected mock HTTP client."""
+        return GitHubClient(config=config, cache=mock_cache, http_client=MagicMock())
+
     async def test_get_repository_info(self, github_client, mock_cache):
         """Test getting repository information."""
         # Setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "full_name": "hashicorp/terraform",
-            "description": "Terraform infrastructure as code tool",
-            "html_url": "https://github.com/hashicorp/terraform",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "full_name": "hashicorp/terraform",
+                "description": "Terraform infrastructure as code tool",
+                "html_url": "https://github.com/hashicorp/terraform",
+            }
+        )
         github_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -279,19 +277,157 @@ class TestGitHubClient:
         assert result == expected_info
         github_client.client.get.assert_called_once_with("/repos/hashicorp/terraform")
 
-    @pytest.mark.asyncio
+    async def test_batch_get_repository_info(self, mock_cache):
+        """Test fetching several repositories with one GraphQL query."""
+        from tim_mcp.config import Config
+
+        client = GitHubClient(
+            config=Config(github_token="test-token"), cache=mock_cache
+        )
+        mock_response = _json_response(
+            {
+                "data": {
+                    "r0": {
+                        "isArchived": True,
+                        "diskUsage": 100,
+                        "defaultBranchRef": {"name": "main"},
+                        "repositoryTopics": {
+                            "nodes": [{"topic": {"name": "core-team"}}]
+                        },
+                    },
+                    "r1": None,
+                }
+            }
+        )
+        client.client.post = AsyncMock(return_value=mock_response)
+
+        result = await client.batch_get_repository_info(
+            [("owner", "repo"), ("owner", "missing"), ("owner", "repo")]
+        )
+
+        assert result == {
+            ("owner", "repo"): {
+                "archived": True,
+                "topics": ["core-team"],
+                "default_branch": "main",
+                "size": 100,
+            }
+        }
+        client.client.post.assert_called_once()
+        call = client.client.post.call_args
+        assert call.args[0] == "https://api.github.com/graphql"
+        assert call.kwargs["json"]["variables"] == {
+            "o0": "owner",
+            "n0": "repo",
+            "o1": "owner",
+            "n1": "missing",
+        }
+        await client.client.aclose()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"errors": [{"type": "RATE_LIMITED", "message": "rate limited"}]},
+                id="errors-only",
+            ),
+            pytest.param(
+                {
+                    "data": {"r0": None},
+                    "errors": [{"type": "FORBIDDEN", "message": "missing scope"}],
+                },
+                id="data-with-other-errors",
+            ),
+        ],
+    )
+    async def test_batch_get_repository_info_graphql_errors(self, mock_cache, payload):
+        """Test that GraphQL errors other than missing repositories raise."""
+        from tim_mcp.config import Config
+
+        client = GitHubClient(
+            config=Config(github_token="test-token"), cache=mock_cache
+        )
+        mock_response = _json_response(payload)
+        client.client.post = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(GitHubError, match="GraphQL error getting repository info"):
+            await client.batch_get_repository_info([("owner", "repo")])
+        await client.client.aclose()
+
+    async def test_batch_get_repository_info_not_found_errors(self, mock_cache):
+        """Test that NOT_FOUND errors only drop the missing repositories."""
+        from tim_mcp.config import Config
+
+        client = GitHubClient(
+            config=Config(github_token="test-token"), cache=mock_cache
+        )
+        mock_response = _json_response(
+            {
+                "data": {"r0": {"isArchived": False}, "r1": None},
+                "errors": [{"type": "NOT_FOUND", "path": ["r1"]}],
+            }
+        )
+        client.client.post = AsyncMock(return_value=mock_response)
+
+        result = await client.batch_get_repository_info(
+            [("owner", "repo"), ("owner", "missing")]
+        )
+
+        assert list(result) == [("owner", "repo")]
+        await client.client.aclose()
+
+    async def test_repository_info_reused_across_lookups(self):
+        """Test that batched results are cached for later batches only."""
+        from tim_mcp.config import Config
+        from tim_mcp.utils.cache import InMemoryCache
+
+        client = GitHubClient(
+            config=Config(github_token="test-token"), cache=InMemoryCache()
+        )
+        mock_response = _json_response(
+            {
+                "data": {
+                    "r0": {
+                        "isArchived": False,
+                        "repositoryTopics": {
+                            "nodes": [{"topic": {"name": "core-team"}}]
+                        },
+                    }
+                }
+            }
+        )
+        client.client.post = AsyncMock(return_value=mock_response)
+        rest_response = _json_response(
+            {
+                "full_name": "owner/repo",
+                "archived": False,
+                "topics": ["core-team"],
+            }
+        )
+        client.client.get = AsyncMock(return_value=rest_response)
+
+        first = await client.batch_get_repository_info([("owner", "repo")])
+        second = await client.batch_get_repository_info([("owner", "repo")])
+        single = await client.get_repository_info("owner", "repo")
+
+        assert first == second
+        client.client.post.assert_called_once()
+        # Single lookups still fetch the full REST payload, not the projection
+        assert single == rest_response.json()
+        client.client.get.assert_called_once()
+        await client.client.aclose()
+
     async def test_get_file_content(self, github_client, mock_cache):
         """Test getting content from a repository."""
         # Setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "name": "main.tf",
-            "path": "main.tf",
-            "content": "encoded_content",
-            "encoding": "base64",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            {
+                "name": "main.tf",
+                "path": "main.tf",
+                "content": "encoded_content",
+                "encoding": "base64",
+            }
+        )
         github_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -312,18 +448,16 @@ class TestGitHubClient:
             params={},
         )
 
-    @pytest.mark.asyncio
     async def test_get_directory_contents(self, github_client, mock_cache):
         """Test listing files in a repository."""
         # Setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {"name": "main.tf", "path": "main.tf", "type": "file"},
-            {"name": "variables.tf", "path": "variables.tf", "type": "file"},
-            {"name": "outputs.tf", "path": "outputs.tf", "type": "file"},
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
+        mock_response = _json_response(
+            [
+                {"name": "main.tf", "path": "main.tf", "type": "file"},
+                {"name": "variables.tf", "path": "variables.tf", "type": "file"},
+                {"name": "outputs.tf", "path": "outputs.tf", "type": "file"},
+            ]
+        )
         github_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -342,20 +476,17 @@ class TestGitHubClient:
             "/repos/hashicorp/terraform/contents", params={}
         )
 
-    @pytest.mark.asyncio
     async def test_get_latest_release(self, github_client, mock_cache):
         """Test getting latest release information."""
         # Setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "tag_name": "v1.2.3",
-            "name": "Release v1.2.3",
-            "published_at": "2023-01-01T00:00:00Z",
-            "html_url": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc/releases/tag/v1.2.3",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
+        mock_response = _json_response(
+            {
+                "tag_name": "v1.2.3",
+                "name": "Release v1.2.3",
+                "published_at": "2023-01-01T00:00:00Z",
+                "html_url": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc/releases/tag/v1.2.3",
+            }
+        )
         github_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute
@@ -375,21 +506,10 @@ class TestGitHubClient:
             "/repos/terraform-ibm-modules/terraform-ibm-vpc/releases/latest"
         )
 
-    @pytest.mark.asyncio
     async def test_get_latest_release_not_found(self, github_client, mock_cache):
         """Test getting latest release when no releases exist."""
         # Setup
-        mock_request = MagicMock()
-        mock_request.url = "https://api.github.com/repos/terraform-ibm-modules/no-releases/releases/latest"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-
-        http_error = httpx.HTTPStatusError(
-            "404 Client Error", request=mock_request, response=mock_response
-        )
-        mock_response.raise_for_status = MagicMock(side_effect=http_error)
+        mock_response = _json_response({"message": "Not Found"}, status_code=404)
         github_client.client.get = AsyncMock(return_value=mock_response)
 
         # Execute and verify exception
@@ -398,7 +518,6 @@ class TestGitHubClient:
                 "terraform-ibm-modules", "no-releases"
             )
 
-    @pytest.mark.asyncio
     async def test_resolve_version_latest_with_release(self, github_client, mock_cache):
         """Test resolving 'latest' version to release tag."""
         # Setup - Mock get_latest_release to return a release
@@ -420,7 +539,6 @@ class TestGitHubClient:
             "terraform-ibm-modules", "terraform-ibm-vpc"
         )
 
-    @pytest.mark.asyncio
     async def test_resolve_version_latest_no_releases(self, github_client, mock_cache):
         """Test resolving 'latest' version when no releases exist (fallback to HEAD)."""
         from tim_mcp.exceptions import ModuleNotFoundError
@@ -443,7 +561,6 @@ class TestGitHubClient:
             "terraform-ibm-modules", "terraform-ibm-vpc"
         )
 
-    @pytest.mark.asyncio
     async def test_resolve_version_specific_tag(self, github_client, mock_cache):
         """Test resolving specific version tag (should return as-is)."""
         # Execute
@@ -455,7 +572,6 @@ class TestGitHubClient:
         assert result == "v1.5.2"
         # Should not call get_latest_release for specific versions
 
-    @pytest.mark.asyncio
     async def test_resolve_version_branch_name(self, github_client, mock_cache):
         """Test resolving branch name (should return as-is)."""
         # Execute
@@ -466,7 +582,6 @@ class TestGitHubClient:
         # Verify
         assert result == "main"
 
-    @pytest.mark.asyncio
     async def test_resolve_version_error_fallback(self, github_client, mock_cache):
         """Test resolving version with API error (fallback to HEAD)."""
         # Setup - Mock get_latest_release to raise generic error
@@ -596,4 +711,64 @@ class TestGitHubClient:
         assert len(matches) == 5, f"Expected 5 .tf files, got {len(matches)}: {matches}"
 
 
+class TestConditionalRequests:
+    """Tests for ETag revalidation of API responses."""
+
+    async def test_not_modified_returns_stored_body(self, config, mock_cache):
+        """Test that a 304 answer reuses the body stored with the ETag."""
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"abc"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"topics": ["core-team"]}, headers={"ETag": '"abc"'}
+            )
+
+        client = GitHubClient(config=config, cache=mock_cache)
+        client.client = httpx.AsyncClient(
+            base_url=str(config.github_base_url),
+            transport=httpx.MockTransport(handler),
+        )
+
+        first = await client.get_repository_info("owner", "repo")
+        second = await client.get_repository_info("owner", "repo")
+
+        assert first == second == {"topics": ["core-team"]}
+        assert seen_headers == [None, '"abc"']
+        await client.client.aclose()
+
+    async def test_not_modified_registry_response(self, config, mock_cache):
+        """Test that a 304 from the registry reuses an unmodified stored body."""
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"id": "ns/vpc/ibm/1.0.0", "inputs": []},
+                headers={"ETag": '"v1"'},
+            )
+
+        http_client = httpx.AsyncClient(
+            base_url=str(config.terraform_registry_url),
+            transport=httpx.MockTransport(handler),
+        )
+        client = TerraformClient(config, cache=mock_cache, http_client=http_client)
+
+        first = await client.get_module_details("ns", "vpc", "ibm")
+        # Callers may modify the bodies they get back
+        first["inputs"].append({"name": "added"})
+        second = await client.get_module_details("ns", "vpc", "ibm")
+        second["inputs"].append({"name": "added"})
+        third = await client.get_module_details("ns", "vpc", "ibm")
+
+        assert third == {"id": "ns/vpc/ibm/1.0.0", "inputs": []}
+        assert seen_headers == [None, '"v1"', '"v1"']
+        await http_client.aclose()
+
+
 # Made with Bob
@@ -8,15 +8,12 @@ import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from generate_module_index import generate_module_index
 
 
-@pytest.mark.asyncio
 async def test_generate_module_index_script_execution(tmp_path, monkeypatch):
     """
     Test that the generate_module_index script executes successfully.
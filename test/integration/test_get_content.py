@@ -16,14 +16,15 @@ from tim_mcp.tools.get_content import get_content_impl
 from tim_mcp.types import GetContentRequest
 
 
+@pytest.fixture(scope="module")
+def config():
+    """Test configuration shared by the tests in this module."""
+    return Config()
+
+
 class TestGetContentTool:
     """Test cases for the get_content tool."""
 
-    @pytest.fixture
-    def config(self):
-        """Test configuration."""
-        return Config()
-
     @pytest.fixture
     def mock_github_client(self):
         """Mock GitHub client."""
@@ -115,7 +116,6 @@ class TestGetContentTool:
             },
         ]
 
-    @pytest.mark.asyncio
     async def test_get_content_basic_example_with_all_files(
         self,
         config,
@@ -196,7 +196,6 @@ class TestGetContentTool:
         )
         assert mock_github_client.get_file_content.call_count == 5  # 5 files total
 
-    @pytest.mark.asyncio
     async def test_get_content_with_terraform_files_only(
         self,
         config,
@@ -273,7 +272,6 @@ class TestGetContentTool:
         assert "## variables.tf" in result
         assert "## outputs.tf" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_root_path(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -344,7 +342,6 @@ class TestGetContentTool:
         )
         assert 'resource "ibm_vpc"' in result
 
-    @pytest.mark.asyncio
     async def test_get_content_without_readme(
         self,
         config,
@@ -386,7 +383,6 @@ class TestGetContentTool:
         readme_calls = [call for call in calls if "README.md" in str(call)]
         assert len(readme_calls) == 0
 
-    @pytest.mark.asyncio
     async def test_get_content_empty_directory(self, config, mock_github_client):
         """Test getting content from empty directory."""
         request = GetContentRequest(
@@ -418,7 +414,6 @@ class TestGetContentTool:
         assert "## variables.tf" not in result
         assert "## outputs.tf" not in result
 
-    @pytest.mark.asyncio
     async def test_get_content_module_not_found(self, config, mock_github_client):
         """Test handling module not found error."""
         request = GetContentRequest(
@@ -437,12 +432,9 @@ class TestGetContentTool:
             "nonexistent/module/provider"
         )
 
-        with pytest.raises(ModuleNotFoundError) as exc_info:
+        with pytest.raises(ModuleNotFoundError, match="nonexistent/module/provider"):
             await get_content_impl(request, config, mock_github_client)
 
-            assert "nonexistent/module/provider" in str(exc_info.value)
-
-    @pytest.mark.asyncio
     async def test_get_content_github_api_error(self, config, mock_github_client):
         """Test handling GitHub API error."""
         request = GetContentRequest(
@@ -461,13 +453,11 @@ class TestGetContentTool:
             "API rate limit exceeded", status_code=429
         )
 
-        with pytest.raises(GitHubError) as exc_info:
+        with pytest.raises(GitHubError, match="API rate limit exceeded") as exc_info:
             await get_content_impl(request, config, mock_github_client)
 
-            assert "API rate limit exceeded" in str(exc_info.value)
-            assert exc_info.value.status_code == 429
+        assert exc_info.value.status_code == 429
 
-    @pytest.mark.asyncio
     async def test_get_content_concurrent_file_fetching(
         self,
         config,
@@ -553,7 +543,6 @@ class TestGetContentTool:
             max_time_diff = max(call_times) - min(call_times)
             assert max_time_diff < 0.1  # All calls should start within 100ms
 
-    @pytest.mark.asyncio
     async def test_get_content_regex_pattern_matching(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -667,7 +656,6 @@ class TestGetContentTool:
         assert "## example.tftest" not in result
         assert "## README.txt" not in result
 
-    @pytest.mark.asyncio
     async def test_get_content_specific_version(
         self, config, mock_github_client, sample_readme_content, sample_main_tf_content
     ):
@@ -709,7 +697,6 @@ class TestGetContentTool:
         # Verify version appears in output
         assert "**Version:** v5.1.0" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_configuration_summary(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -783,7 +770,6 @@ class TestGetContentTool:
         assert "**Required Inputs:**" in result
         assert "**Outputs:**" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_latest_version_resolution(
         self, config, mock_github_client, sample_readme_content, sample_main_tf_content
     ):
@@ -833,7 +819,6 @@ class TestGetContentTool:
         # Verify resolved version appears in output
         assert "**Version:** v3.2.1" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_latest_fallback_to_head(
         self, config, mock_github_client, sample_readme_content, sample_main_tf_content
     ):
@@ -883,7 +868,6 @@ class TestGetContentTool:
         # Verify resolved version appears in output
         assert "**Version:** HEAD" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_invalid_regex_patterns(
         self, config, mock_github_client, sample_readme_content, sample_main_tf_content
     ):
@@ -948,7 +932,6 @@ class TestGetContentTool:
         assert "**Version:** latest" in result
         assert "# terraform-ibm-modules/vpc/ibm - examples/basic" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_unusual_glob_patterns(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -1016,7 +999,6 @@ class TestGetContentTool:
         assert "# terraform-ibm-modules/vpc/ibm - examples/basic" in result
         assert "## README" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_glob_patterns_error_scenario(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -1080,7 +1062,6 @@ class TestGetContentTool:
         # Should include main.tf which matches *.tf pattern
         assert "## main.tf" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_include_files_bug_reproduction(
         self, config, mock_github_client, sample_readme_content
     ):
@@ -1152,7 +1133,6 @@ class TestGetContentTool:
         # With the bug, this might fail if valid_include_matched logic is broken
         assert "# main.tf content" in result
 
-    @pytest.mark.asyncio
     async def test_get_content_source_replacement(self, config, mock_github_client):
         """Test that source = '../../' is replaced with module ID and version."""
         # Setup
@@ -4,10 +4,10 @@ Tests for the get_module_details tool implementation.
 Following TDD methodology - these tests are written first to define the expected behavior.
 """
 
-from unittest.mock import AsyncMock, patch
-
+import httpx
 import pytest
 
+from tim_mcp.clients.terraform_client import TerraformClient
 from tim_mcp.config import Config
 from tim_mcp.exceptions import (
     ModuleNotFoundError,
@@ -15,83 +15,90 @@ from tim_mcp.exceptions import (
     TerraformRegistryError,
     ValidationError,
 )
+from tim_mcp.tools import details
+from tim_mcp.tools.details import (
+    format_dependencies,
+    format_download_count,
+    format_inputs,
+    format_module_details,
+    format_outputs,
+    format_published_date,
+    format_version_list,
+    get_module_details_impl,
+)
 from tim_mcp.types import ModuleDetailsRequest
+from tim_mcp.utils.module_id import parse_module_id, parse_module_id_with_version
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
-    """Create a test configuration."""
+    """Create a test configuration shared by all tests in this module."""
     return Config()
 
 
-@pytest.fixture
-def sample_module_details_response():
-    """Sample API response for module details."""
-    return {
-        "id": "terraform-ibm-modules/vpc/ibm",
-        "namespace": "terraform-ibm-modules",
-        "name": "vpc",
-        "provider": "ibm",
-        "version": "7.4.2",
-        "description": (
-            "Provisions and configures IBM Cloud VPC resources including subnets, security groups, "
-            "routing tables, and load balancers."
-        ),
-        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-        "downloads": 53004,
-        "verified": True,
-        "published_at": "2025-09-02T10:30:00.000Z",
-        "root": {
-            "inputs": [
-                {
-                    "name": "vpc_name",
-                    "type": "string",
-                    "description": "Name of the VPC instance",
-                    "required": True,
-                },
-                {
-                    "name": "resource_group_id",
-                    "type": "string",
-                    "description": "ID of the resource group",
-                    "required": True,
-                },
-                {
-                    "name": "locations",
-                    "type": "list(string)",
-                    "description": "List of zones for VPC deployment",
-                    "default": ["us-south-1"],
-                    "required": False,
-                },
-                {
-                    "name": "vpc_tags",
-                    "type": "list(string)",
-                    "description": "List of tags to apply",
-                    "default": [],
-                    "required": False,
-                },
-            ],
-            "outputs": [
-                {
-                    "name": "vpc_id",
-                    "type": "string",
-                    "description": "ID of the created VPC",
-                },
-                {
-                    "name": "vpc_crn",
-                    "type": "string",
-                    "description": "CRN of the VPC instance",
-                },
-            ],
-            "dependencies": [{"name": "ibm", "version": ">= 1.49.0"}],
-        },
-        "versions": ["7.4.2", "7.4.1", "7.4.0", "7.3.1"],
-    }
-
-
-@pytest.fixture
-def expected_markdown_output():
-    """Expected markdown output for the sample module."""
-    return """# terraform-ibm-modules/vpc/ibm - Module Details
+# Sample API response for module details, shared read-only by the tests
+_SAMPLE_MODULE_DETAILS = {
+    "id": "terraform-ibm-modules/vpc/ibm",
+    "namespace": "terraform-ibm-modules",
+    "name": "vpc",
+    "provider": "ibm",
+    "version": "7.4.2",
+    "description": (
+        "Provisions and configures IBM Cloud VPC resources including subnets, security groups, "
+        "routing tables, and load balancers."
+    ),
+    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
+    "downloads": 53004,
+    "verified": True,
+    "published_at": "2025-09-02T10:30:00.000Z",
+    "root": {
+        "inputs": [
+            {
+                "name": "vpc_name",
+                "type": "string",
+                "description": "Name of the VPC instance",
+                "required": True,
+            },
+            {
+                "name": "resource_group_id",
+                "type": "string",
+                "description": "ID of the resource group",
+                "required": True,
+            },
+            {
+                "name": "locations",
+                "type": "list(string)",
+                "description": "List of zones for VPC deployment",
+                "default": ["us-south-1"],
+                "required": False,
+            },
+            {
+                "name": "vpc_tags",
+                "type": "list(string)",
+                "description": "List of tags to apply",
+                "default": [],
+                "required": False,
+            },
+        ],
+        "outputs": [
+            {
+                "name": "vpc_id",
+                "type": "string",
+                "description": "ID of the created VPC",
+            },
+            {
+                "name": "vpc_crn",
+                "type": "string",
+                "description": "CRN of the VPC instance",
+            },
+        ],
+        "dependencies": [{"name": "ibm", "version": ">= 1.49.0"}],
+    },
+    "versions": ["7.4.2", "7.4.1", "7.4.0", "7.3.1"],
+}
+
+# Expected markdown output for the sample module
+_EXPECTED_MARKDOWN = """# terraform-ibm-modules/vpc/ibm - Module Details
 
 **Latest Version:** v7.4.2
 **Published:** 2025-09-02
@@ -128,9 +135,6 @@ class TestGetModuleDetailsValidation:
 
     def test_valid_module_id_parsing(self):
         """Test that valid module IDs are parsed correctly."""
-        # This will be implemented when we create the actual function
-        from tim_mcp.utils.module_id import parse_module_id
-
         # Test standard format
         namespace, name, provider = parse_module_id("terraform-ibm-modules/vpc/ibm")
         assert namespace == "terraform-ibm-modules"
@@ -138,8 +142,6 @@ class TestGetModuleDetailsValidation:
         assert provider == "ibm"
 
         # Test with version included
-        from tim_mcp.utils.module_id import parse_module_id_with_version
-
         namespace, name, provider, version = parse_module_id_with_version(
             "terraform-ibm-modules/vpc/ibm/1.2.3"
         )
@@ -150,18 +152,15 @@ class TestGetModuleDetailsValidation:
 
     def test_invalid_module_id_format(self):
         """Test validation fails for invalid module ID format."""
-        from tim_mcp.utils.module_id import parse_module_id
-
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(
+            ValidationError, match="Invalid module_id format"
+        ) as exc_info:
             parse_module_id("invalid-format")
 
-        assert "Invalid module_id format" in str(exc_info.value)
         assert exc_info.value.field == "module_id"
 
     def test_empty_module_id_components(self):
         """Test validation fails for empty components."""
-        from tim_mcp.utils.module_id import parse_module_id
-
         with pytest.raises(ValidationError) as exc_info:
             parse_module_id("//")
 
@@ -169,8 +168,6 @@ class TestGetModuleDetailsValidation:
 
     def test_module_id_with_extra_slashes(self):
         """Test validation fails for module ID with too many slashes."""
-        from tim_mcp.utils.module_id import parse_module_id
-
         with pytest.raises(ValidationError):
             parse_module_id("namespace/name/provider/version/extra")
 
@@ -178,229 +175,219 @@ class TestGetModuleDetailsValidation:
 class TestGetModuleDetailsSuccess:
     """Test successful module details retrieval."""
 
-    @pytest.mark.asyncio
-    async def test_get_module_details_latest_version(
-        self, config, sample_module_details_response, expected_markdown_output
-    ):
+    async def test_get_module_details_latest_version(self, config, fake_details_client):
         """Test getting module details for latest version."""
-        from tim_mcp.tools.details import get_module_details_impl
-
-        # Mock the TerraformClient
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.return_value = sample_module_details_response
-            mock_client.get_module_versions.return_value = [
-                "7.4.2",
-                "7.4.1",
-                "7.4.0",
-                "7.3.1",
-            ]
-
-            request = ModuleDetailsRequest(
-                module_id="terraform-ibm-modules/vpc/ibm", version="latest"
-            )
-
-            result = await get_module_details_impl(request, config)
-
-            assert result == expected_markdown_output
-            mock_client.get_module_details.assert_called_once_with(
-                namespace="terraform-ibm-modules",
-                name="vpc",
-                provider="ibm",
-                version="latest",
-            )
-
-    @pytest.mark.asyncio
+        fake_details_client.details = _SAMPLE_MODULE_DETAILS
+        fake_details_client.versions = [
+            "7.4.2",
+            "7.4.1",
+            "7.4.0",
+            "7.3.1",
+        ]
+
+        request = ModuleDetailsRequest(
+            module_id="terraform-ibm-modules/vpc/ibm", version="latest"
+        )
+
+        result = await get_module_details_impl(request, config)
+
+        assert result == _EXPECTED_MARKDOWN
+        assert fake_details_client.calls == [
+            {
+                "namespace": "terraform-ibm-modules",
+                "name": "vpc",
+                "provider": "ibm",
+                "version": "latest",
+            }
+        ]
+
     async def test_get_module_details_specific_version(
-        self, config, sample_module_details_response
+        self, config, fake_details_client
     ):
         """Test getting module details for specific version."""
-        from tim_mcp.tools.details import get_module_details_impl
-
         # Modify response for specific version
-        specific_version_response = sample_module_details_response.copy()
-        specific_version_response["version"] = "7.4.1"
-
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.return_value = specific_version_response
-            mock_client.get_module_versions.return_value = [
-                "7.4.2",
-                "7.4.1",
-                "7.4.0",
-                "7.3.1",
-            ]
-
-            request = ModuleDetailsRequest(
-                module_id="terraform-ibm-modules/vpc/ibm/7.4.1"
-            )
-
-            result = await get_module_details_impl(request, config)
-
-            assert "**Latest Version:** v7.4.1" in result
-            mock_client.get_module_details.assert_called_once_with(
-                namespace="terraform-ibm-modules",
-                name="vpc",
-                provider="ibm",
-                version="7.4.1",
-            )
-
-    @pytest.mark.asyncio
-    async def test_module_with_no_dependencies(self, config):
-        """Test module with no dependencies."""
-        from tim_mcp.tools.details import get_module_details_impl
-
-        response_no_deps = {
-            "id": "simple/module/aws",
-            "namespace": "simple",
+        specific_version_response = {**_SAMPLE_MODULE_DETAILS, "version": "7.4.1"}
+
+        fake_details_client.details = specific_version_response
+        fake_details_client.versions = [
+            "7.4.2",
+            "7.4.1",
+            "7.4.0",
+            "7.3.1",
+        ]
+
+        request = ModuleDetailsRequest(module_id="terraform-ibm-modules/vpc/ibm/7.4.1")
+
+        result = await get_module_details_impl(request, config)
+
+        assert "**Latest Version:** v7.4.1" in result
+        assert fake_details_client.calls == [
+            {
+                "namespace": "terraform-ibm-modules",
+                "name": "vpc",
+                "provider": "ibm",
+                "version": "7.4.1",
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        ("dependencies", "expected_lines"),
+        [
+            pytest.param(
+                [],
+                ["**Module Dependencies:** None", "**Provider Requirements:**\nNone"],
+                id="no-dependencies",
+            ),
+            pytest.param(
+                [
+                    {"name": "aws", "version": ">= 4.0.0"},
+                    {"name": "terraform-aws-modules/vpc/aws", "version": "~> 3.0"},
+                ],
+                [
+                    "**Provider Requirements:**",
+                    "- AWS Provider >= 4.0.0",
+                    "**Module Dependencies:**",
+                    "- terraform-aws-modules/vpc/aws ~> 3.0",
+                ],
+                id="provider-and-module-dependencies",
+            ),
+        ],
+    )
+    async def test_module_dependencies(
+        self, config, fake_details_client, dependencies, expected_lines
+    ):
+        """Test formatting of provider and module dependencies."""
+        fake_details_client.details = {
+            "id": "example/module/aws",
+            "namespace": "example",
             "name": "module",
             "provider": "aws",
             "version": "1.0.0",
-            "description": "A simple module",
-            "source": "https://github.com/simple/terraform-module",
+            "description": "An example module",
+            "source": "https://github.com/example/terraform-module",
             "downloads": 100,
             "verified": False,
             "published_at": "2025-01-01T00:00:00.000Z",
-            "root": {"inputs": [], "outputs": [], "dependencies": []},
+            "root": {"inputs": [], "outputs": [], "dependencies": dependencies},
             "versions": ["1.0.0"],
         }
+        fake_details_client.versions = ["1.0.0"]
 
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.return_value = response_no_deps
-            mock_client.get_module_versions.return_value = ["1.0.0"]
+        request = ModuleDetailsRequest(module_id="example/module/aws")
 
-            request = ModuleDetailsRequest(module_id="simple/module/aws")
+        result = await get_module_details_impl(request, config)
 
-            result = await get_module_details_impl(request, config)
+        for line in expected_lines:
+            assert line in result
 
-            assert "**Module Dependencies:** None" in result
-            assert "**Provider Requirements:**\nNone" in result
-
-    @pytest.mark.asyncio
-    async def test_module_with_module_dependencies(self, config):
-        """Test module with both provider and module dependencies."""
-        from tim_mcp.tools.details import get_module_details_impl
-
-        response_with_deps = {
-            "id": "complex/module/aws",
-            "namespace": "complex",
-            "name": "module",
-            "provider": "aws",
-            "version": "2.0.0",
-            "description": "A complex module",
-            "source": "https://github.com/complex/terraform-module",
-            "downloads": 500,
-            "verified": True,
-            "published_at": "2025-01-15T12:00:00.000Z",
-            "root": {
-                "inputs": [],
-                "outputs": [],
-                "dependencies": [
-                    {"name": "aws", "version": ">= 4.0.0"},
-                    {"name": "terraform-aws-modules/vpc/aws", "version": "~> 3.0"},
-                ],
-            },
-            "versions": ["2.0.0"],
-        }
 
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.return_value = response_with_deps
-            mock_client.get_module_versions.return_value = ["2.0.0"]
+class TestGetModuleDetailsErrors:
+    """Test error handling for get_module_details."""
 
-            request = ModuleDetailsRequest(module_id="complex/module/aws")
+    async def test_module_not_found(self, config, fake_details_client):
+        """Test handling when module is not found."""
+        fake_details_client.exc = TerraformRegistryError(
+            "Module not found", status_code=404
+        )
 
-            result = await get_module_details_impl(request, config)
+        request = ModuleDetailsRequest(module_id="nonexistent/module/aws")
 
-            assert "**Provider Requirements:**" in result
-            assert "- AWS Provider >= 4.0.0" in result
-            assert "**Module Dependencies:**" in result
-            assert "- terraform-aws-modules/vpc/aws ~> 3.0" in result
+        with pytest.raises(ModuleNotFoundError, match="nonexistent/module/aws"):
+            await get_module_details_impl(request, config)
 
+    async def test_rate_limit_error(self, config, fake_details_client):
+        """Test handling of rate limit errors."""
+        fake_details_client.exc = RateLimitError(
+            "Rate limit exceeded", reset_time=1640995200
+        )
 
-class TestGetModuleDetailsErrors:
-    """Test error handling for get_module_details."""
+        request = ModuleDetailsRequest(module_id="test/module/aws")
 
-    @pytest.mark.asyncio
-    async def test_module_not_found(self, config):
-        """Test handling when module is not found."""
-        from tim_mcp.tools.details import get_module_details_impl
+        with pytest.raises(RateLimitError):
+            await get_module_details_impl(request, config)
 
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.side_effect = TerraformRegistryError(
-                "Module not found", status_code=404
-            )
+    async def test_api_error_handling(self, config, fake_details_client):
+        """Test handling of general API errors."""
+        fake_details_client.exc = TerraformRegistryError(
+            "Internal server error", status_code=500
+        )
 
-            request = ModuleDetailsRequest(module_id="nonexistent/module/aws")
+        request = ModuleDetailsRequest(module_id="test/module/aws")
 
-            with pytest.raises(ModuleNotFoundError) as exc_info:
-                await get_module_details_impl(request, config)
+        with pytest.raises(TerraformRegistryError) as exc_info:
+            await get_module_details_impl(request, config)
 
-            assert "nonexistent/module/aws" in str(exc_info.value)
+        assert exc_info.value.status_code == 500
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_error(self, config):
-        """Test handling of rate limit errors."""
-        from tim_mcp.tools.details import get_module_details_impl
+    async def test_invalid_module_id_format_in_request(self, config):
+        """Test handling of invalid module ID in request."""
+        request = ModuleDetailsRequest(module_id="invalid-format")
 
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.side_effect = RateLimitError(
-                "Rate limit exceeded", reset_time=1640995200
-            )
+        with pytest.raises(TerraformRegistryError, match="Invalid module_id format"):
+            await get_module_details_impl(request, config)
 
-            request = ModuleDetailsRequest(module_id="test/module/aws")
 
-            with pytest.raises(RateLimitError):
-                await get_module_details_impl(request, config)
+class TestGetModuleDetailsOverHttp:
+    """Test get_module_details against the real client over a mocked transport."""
 
-    @pytest.mark.asyncio
-    async def test_api_error_handling(self, config):
-        """Test handling of general API errors."""
-        from tim_mcp.tools.details import get_module_details_impl
+    @pytest.fixture
+    async def registry_routes(self, config, monkeypatch):
+        """Route the details tool's registry requests to canned HTTP responses."""
+        routes: dict[str, httpx.Response] = {}
 
-        with patch("tim_mcp.tools.details.TerraformClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_module_details.side_effect = TerraformRegistryError(
-                "Internal server error", status_code=500
-            )
+        def handler(request: httpx.Request) -> httpx.Response:
+            return routes.get(request.url.path, httpx.Response(404))
 
-            request = ModuleDetailsRequest(module_id="test/module/aws")
+        http_client = httpx.AsyncClient(
+            base_url=str(config.terraform_registry_url),
+            transport=httpx.MockTransport(handler),
+        )
+        monkeypatch.setattr(
+            details,
+            "TerraformClient",
+            lambda config, **kwargs: TerraformClient(config, http_client=http_client),
+        )
+        yield routes
+        await http_client.aclose()
+
+    async def test_get_module_details(self, config, registry_routes):
+        """Test that registry responses are fetched, filtered and formatted."""
+        base_path = httpx.URL(str(config.terraform_registry_url)).path.rstrip("/")
+        module_path = f"{base_path}/modules/terraform-ibm-modules/vpc/ibm"
+        registry_routes[module_path] = httpx.Response(200, json=_SAMPLE_MODULE_DETAILS)
+        registry_routes[f"{module_path}/versions"] = httpx.Response(
+            200,
+            json={
+                "modules": [
+                    {
+                        "versions": [
+                            {"version": v}
+                            for v in ["7.4.0", "7.5.0-beta", "7.4.2", "7.3.1", "7.4.1"]
+                        ]
+                    }
+                ]
+            },
+        )
 
-            with pytest.raises(TerraformRegistryError) as exc_info:
-                await get_module_details_impl(request, config)
+        request = ModuleDetailsRequest(module_id="terraform-ibm-modules/vpc/ibm")
 
-            assert exc_info.value.status_code == 500
+        result = await get_module_details_impl(request, config)
 
-    @pytest.mark.asyncio
-    async def test_invalid_module_id_format_in_request(self, config):
-        """Test handling of invalid module ID in request."""
-        from tim_mcp.tools.details import get_module_details_impl
+        assert result == _EXPECTED_MARKDOWN
 
-        request = ModuleDetailsRequest(module_id="invalid-format")
+    async def test_module_not_found(self, config, registry_routes):
+        """Test that a registry 404 surfaces as ModuleNotFoundError."""
+        request = ModuleDetailsRequest(module_id="nonexistent/module/aws")
 
-        with pytest.raises(TerraformRegistryError) as exc_info:
+        with pytest.raises(ModuleNotFoundError):
             await get_module_details_impl(request, config)
 
-        assert "Invalid module_id format" in str(exc_info.value)
-
 
 class TestMarkdownFormatting:
     """Test the markdown formatting functionality."""
 
     def test_format_module_details_basic(self):
         """Test basic markdown formatting."""
-        from tim_mcp.tools.details import format_module_details
-
         module_data = {
             "id": "test/module/aws",
             "namespace": "test",
@@ -426,8 +413,6 @@ class TestMarkdownFormatting:
 
     def test_format_inputs_and_outputs(self):
         """Test formatting of inputs and outputs."""
-        from tim_mcp.tools.details import format_inputs, format_outputs
-
         inputs = [
             {
                 "name": "vpc_name",
@@ -457,8 +442,6 @@ class TestMarkdownFormatting:
 
     def test_format_dependencies(self):
         """Test formatting of dependencies."""
-        from tim_mcp.tools.details import format_dependencies
-
         dependencies = [
             {"name": "aws", "version": ">= 4.0.0"},
             {"name": "terraform-aws-modules/vpc/aws", "version": "~> 3.0"},
@@ -471,16 +454,12 @@ class TestMarkdownFormatting:
 
     def test_format_large_download_count(self):
         """Test formatting of large download counts with commas."""
-        from tim_mcp.tools.details import format_download_count
-
         assert format_download_count(1000) == "1,000"
         assert format_download_count(1000000) == "1,000,000"
         assert format_download_count(53004) == "53,004"
 
     def test_format_published_date(self):
         """Test formatting of published date."""
-        from tim_mcp.tools.details import format_published_date
-
         # Test ISO 8601 format
         result = format_published_date("2025-09-02T10:30:00.000Z")
         assert result == "2025-09-02"
@@ -491,8 +470,6 @@ class TestMarkdownFormatting:
 
     def test_format_version_list(self):
         """Test formatting of version list."""
-        from tim_mcp.tools.details import format_version_list
-
         versions = ["7.4.2", "7.4.1", "7.4.0", "7.3.1"]
         result = format_version_list(versions)
 
@@ -17,6 +17,7 @@ from tim_mcp.exceptions import (
     RateLimitError,
     ValidationError,
 )
+from tim_mcp.tools import list_content
 from tim_mcp.tools.list_content import list_content_impl
 from tim_mcp.types import ListContentRequest
 
@@ -105,7 +106,6 @@ class TestListContentImpl:
             "html_url": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
         }
 
-    @pytest.mark.asyncio
     async def test_list_content_success(
         self,
         mock_config,
@@ -130,10 +130,8 @@ class TestListContentImpl:
         mock_github_client.get_file_content.side_effect = mock_get_file_content
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient
                 mock_terraform_client = AsyncMock()
                 mock_terraform_client.get_module_structure.return_value = {
@@ -193,7 +191,6 @@ class TestListContentImpl:
         assert "**Path:** `modules/landing-zone-vpc`" in result
         assert "Enhanced VPC configuration" in result
 
-    @pytest.mark.asyncio
     async def test_list_content_with_specific_version(
         self,
         mock_config,
@@ -218,10 +215,8 @@ class TestListContentImpl:
         mock_github_client.get_file_content.side_effect = mock_get_file_content
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to fail (force GitHub fallback)
                 mock_terraform_client = AsyncMock()
                 from tim_mcp.exceptions import TerraformRegistryError
@@ -256,17 +251,14 @@ class TestListContentImpl:
                     recursive=True,
                 )
 
-    @pytest.mark.asyncio
     async def test_list_content_module_not_found(self, mock_config, mock_github_client):
         """Test error handling when module repository is not found."""
         # Setup
         request = ListContentRequest(module_id="nonexistent/module/ibm")
 
         # Execute & Verify
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to fail
                 mock_terraform_client = AsyncMock()
                 from tim_mcp.exceptions import TerraformRegistryError
@@ -297,12 +289,11 @@ class TestListContentImpl:
                 )
                 MockGitHubClient.return_value.__aexit__ = AsyncMock(return_value=None)
 
-                with pytest.raises(ModuleNotFoundError) as exc_info:
+                with pytest.raises(
+                    ModuleNotFoundError, match="nonexistent/terraform-ibm-module"
+                ):
                     await list_content_impl(request, mock_config)
 
-                assert "nonexistent/terraform-ibm-module" in str(exc_info.value)
-
-    @pytest.mark.asyncio
     async def test_list_content_github_api_error(self, mock_config, mock_github_client):
         """Test that Registry API is used even when GitHub API fails (for solutions)."""
         # Setup
@@ -316,10 +307,8 @@ class TestListContentImpl:
         )
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to succeed
                 mock_terraform_client = AsyncMock()
                 mock_terraform_client.get_module_structure.return_value = {
@@ -348,17 +337,14 @@ class TestListContentImpl:
                 assert "**Version:** 1.0.0" in result
                 assert "## Root Module" in result
 
-    @pytest.mark.asyncio
     async def test_list_content_rate_limit_error(self, mock_config):
         """Test error handling for Registry API rate limit errors."""
         # Setup
         request = ListContentRequest(module_id="terraform-ibm-modules/vpc/ibm")
 
         # Execute & Verify
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to raise rate limit error
                 mock_terraform_client = AsyncMock()
 
@@ -393,25 +379,22 @@ class TestListContentImpl:
                 )
                 MockGitHubClient.return_value.__aexit__ = AsyncMock(return_value=None)
 
-                with pytest.raises(RateLimitError) as exc_info:
+                with pytest.raises(
+                    RateLimitError, match="GitHub rate limit exceeded"
+                ) as exc_info:
                     await list_content_impl(request, mock_config)
 
-                assert "GitHub rate limit exceeded" in str(exc_info.value)
                 assert exc_info.value.reset_time == 1234567890
 
-    @pytest.mark.asyncio
     async def test_list_content_invalid_module_id(self, mock_config):
         """Test error handling for invalid module ID format."""
         # Setup
         request = ListContentRequest(module_id="invalid-module-id")
 
         # Execute & Verify
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Invalid module_id format"):
             await list_content_impl(request, mock_config)
 
-        assert "Invalid module_id format" in str(exc_info.value)
-
-    @pytest.mark.asyncio
     async def test_list_content_empty_repository(
         self, mock_config, mock_github_client, sample_repo_info
     ):
@@ -424,10 +407,8 @@ class TestListContentImpl:
         mock_github_client.get_repository_tree.return_value = []
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to fail (force GitHub fallback)
                 mock_terraform_client = AsyncMock()
                 from tim_mcp.exceptions import TerraformRegistryError
@@ -461,7 +442,6 @@ class TestListContentImpl:
                 assert "## Examples" not in result
                 assert "## Submodules" not in result
 
-    @pytest.mark.asyncio
     async def test_list_content_readme_parsing_fallback(
         self, mock_config, mock_github_client, sample_tree_response, sample_repo_info
     ):
@@ -479,10 +459,8 @@ class TestListContentImpl:
         mock_github_client.get_file_content.side_effect = mock_get_file_content
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient with empty READMEs
                 mock_terraform_client = AsyncMock()
                 mock_terraform_client.get_module_structure.return_value = {
@@ -527,7 +505,6 @@ class TestListContentImpl:
         # Generic description for submodules
         assert "Submodule providing" in result
 
-    @pytest.mark.asyncio
     async def test_list_content_path_categorization(
         self, mock_config, mock_github_client, sample_repo_info
     ):
@@ -557,10 +534,8 @@ class TestListContentImpl:
         mock_github_client.get_file_content.side_effect = mock_get_file_content
 
         # Execute
-        with patch("tim_mcp.tools.list_content.GitHubClient") as MockGitHubClient:
-            with patch(
-                "tim_mcp.tools.list_content.TerraformClient"
-            ) as MockTerraformClient:
+        with patch.object(list_content, "GitHubClient") as MockGitHubClient:
+            with patch.object(list_content, "TerraformClient") as MockTerraformClient:
                 # Mock TerraformClient to fail (force GitHub fallback)
                 mock_terraform_client = AsyncMock()
                 from tim_mcp.exceptions import TerraformRegistryError
@@ -4,198 +4,380 @@ Tests for the search_modules tool implementation.
 Following TDD methodology - these tests define the behavior we want to implement.
 """
 
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 
 import pytest
 from pydantic import ValidationError
 
+from tim_mcp.clients.github_client import GitHubClient
 from tim_mcp.config import Config
-from tim_mcp.exceptions import RateLimitError, TerraformRegistryError
+from tim_mcp.context import (
+    SEARCH_RESPONSE_TTL,
+    _http_clients,
+    aclose_http_clients,
+    get_search_response_cache,
+    reset_search_response_cache,
+)
+from tim_mcp.exceptions import GitHubError, RateLimitError, TerraformRegistryError
 from tim_mcp.exceptions import ValidationError as TIMValidationError
+from tim_mcp.tools import search
 from tim_mcp.tools.search import search_modules_impl
 from tim_mcp.types import ModuleInfo, ModuleSearchRequest, ModuleSearchResponse
 
 
-def create_mock_github_client(repo_mappings=None):
-    """
-    Create a properly configured mock GitHub client.
-
-    Args:
-        repo_mappings: Dict mapping URL substrings to (owner, repo) tuples.
-                      Defaults to common test repos.
-    """
-    if repo_mappings is None:
-        repo_mappings = {
-            "vpc": ("terraform-ibm-modules", "terraform-ibm-vpc"),
-            "security-group": ("terraform-ibm-modules", "terraform-ibm-security-group"),
-            "db2-cloud": ("terraform-ibm-modules", "terraform-ibm-db2-cloud"),
-            "namespace": ("terraform-ibm-modules", "terraform-ibm-namespace"),
-            "icd-postgresql": ("terraform-ibm-modules", "terraform-ibm-icd-postgresql"),
-        }
+@pytest.fixture(scope="module")
+def config():
+    """Create a test configuration shared by all tests in this module."""
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def config_with_filtering():
+    """Create a test configuration with filtering enabled, shared by the module."""
+    return Config(
+        allowed_namespaces=["terraform-ibm-modules", "ibm-garage-cloud"],
+        excluded_modules=[
+            "terraform-ibm-modules/bad-module/ibm",
+            "terraform-ibm-modules/deprecated-vpc/ibm",
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test without search responses cached by earlier tests."""
+    reset_search_response_cache()
+
+
+@pytest.fixture(autouse=True)
+def fake_clients(fake_terraform_client, fake_github_client):
+    """Run every search against the registry and GitHub client fakes."""
+
+
+@pytest.fixture(autouse=True)
+async def close_http_clients():
+    """Close the shared connection pools a test's searches opened."""
+    yield
+    await aclose_http_clients()
+
+
+# Arbitrary fixed timestamp for models whose publish date is irrelevant
+_FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
+
+# Publish dates of the modules in the sample registry responses
+_PUBLISHED_VPC = datetime(2025, 9, 2, 8, 33, 15, tzinfo=UTC)
+_PUBLISHED_SECURITY_GROUP = datetime(2025, 8, 15, 12, 22, 33, tzinfo=UTC)
+
+_MODULE_TEMPLATE = {
+    "namespace": "terraform-ibm-modules",
+    "provider": "ibm",
+    "version": "1.0.0",
+    "verified": False,
+    "published_at": "2025-09-01T08:00:00.000Z",
+}
+
+
+def _mod(name, downloads, **overrides):
+    """Build a registry module entry for ``name`` from the shared template."""
+    return {
+        **_MODULE_TEMPLATE,
+        "id": f"terraform-ibm-modules/{name}/ibm",
+        "name": name,
+        "description": f"{name} module",
+        "source": f"https://github.com/terraform-ibm-modules/{name}",
+        "downloads": downloads,
+        **overrides,
+    }
+
+
+def _unsorted_modules():
+    """Build low/high/medium download modules listed out of download order."""
+    return [
+        _mod("low-downloads", 100),
+        _mod("high-downloads", 50000, version="2.0.0", verified=True),
+        _mod("medium-downloads", 5000, version="1.5.0"),
+    ]
+
+
+def _make_response(*modules, offset=0, total_count=None):
+    """Build a registry search response page holding ``modules``."""
+    meta = {"limit": 50, "offset": offset}
+    if total_count is not None:
+        meta["total_count"] = total_count
+    return {"modules": list(modules), "meta": meta}
+
+
+def _vpc_module():
+    """Build the registry entry of the VPC module in the sample search."""
+    return _mod(
+        "vpc",
+        53004,
+        version="5.1.0",
+        description="Provisions and configures IBM Cloud VPC resources",
+        source="https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
+        published_at="2025-09-02T08:33:15.000Z",
+    )
+
+
+def _security_group_module():
+    """Build the registry entry of the security group module in the sample search."""
+    return _mod(
+        "security-group",
+        15234,
+        version="2.3.1",
+        description="Creates and configures IBM Cloud security groups",
+        source="https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
+        verified=True,
+        published_at="2025-08-15T12:22:33.000Z",
+    )
+
+
+@pytest.fixture
+def sample_registry_response():
+    """Sample response from Terraform Registry API."""
+    return _make_response(_vpc_module(), _security_group_module(), total_count=23)
+
+
+# Fields of the modules expected from the sample search, in download order
+_EXPECTED_MODULE_FIELDS = (
+    {
+        "name": "vpc",
+        "version": "5.1.0",
+        "description": "Provisions and configures IBM Cloud VPC resources",
+        "source_url": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
+        "downloads": 53004,
+        "verified": False,
+        "published_at": _PUBLISHED_VPC,
+    },
+    {
+        "name": "security-group",
+        "version": "2.3.1",
+        "description": "Creates and configures IBM Cloud security groups",
+        "source_url": "https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
+        "downloads": 15234,
+        "verified": True,
+        "published_at": _PUBLISHED_SECURITY_GROUP,
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def expected_response():
+    """Expected formatted response for the sample search (read-only)."""
+    return ModuleSearchResponse(
+        query="vpc",
+        total_found=23,
+        modules=[
+            ModuleInfo(
+                id=f"terraform-ibm-modules/{fields['name']}/ibm",
+                namespace="terraform-ibm-modules",
+                provider="ibm",
+                **fields,
+            )
+            for fields in _EXPECTED_MODULE_FIELDS
+        ],
+    )
 
-    mock_github_client = AsyncMock()
 
-    def parse_url_side_effect(url):
-        for key, value in repo_mappings.items():
-            if key in url:
-                return value
-        return None
+class TestSearchModulesImpl:
+    """Test the search_modules_impl function."""
 
-    mock_github_client.parse_github_url.side_effect = parse_url_side_effect
+    async def test_successful_search_basic_query(
+        self, config, fake_terraform_client, sample_registry_response, expected_response
+    ):
+        """Test successful module search with basic query."""
+        # Setup - return the response only on first call, empty on subsequent calls
+        fake_terraform_client.responses = [
+            sample_registry_response,  # First call returns modules
+            {
+                "modules": [],
+                "meta": {"limit": 50, "offset": 50, "total_count": 23},
+            },  # Second call returns empty
+        ]
+        request = ModuleSearchRequest(query="vpc")
 
-    async def mock_get_repo_info(*args, **kwargs):
-        return {
-            "default_branch": "main",
-            "size": 100,
-            "archived": False,
-            "topics": ["core-team", "terraform", "ibm-cloud", "terraform-module"],
+        # Execute
+        result = await search_modules_impl(request, config)
+
+        # Verify
+        assert result == expected_response
+        # Check that search was called twice due to batching
+        assert len(fake_terraform_client.calls) == 2
+        assert fake_terraform_client.calls[0] == {
+            "query": "vpc",
+            "namespace": "terraform-ibm-modules",
+            "limit": 50,  # batch_size is 50
+            "offset": 0,
         }
 
-    mock_github_client.get_repository_info = mock_get_repo_info
-    return mock_github_client
+    async def test_concurrent_identical_searches_coalesced(
+        self, config, fake_terraform_client, sample_registry_response, expected_response
+    ):
+        """Test that identical searches running together share one registry search."""
+        # Setup - pages for a single search only
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            {
+                "modules": [],
+                "meta": {"limit": 50, "offset": 50, "total_count": 23},
+            },
+        ]
+        request = ModuleSearchRequest(query="vpc")
 
+        # Execute
+        first, second = await asyncio.gather(
+            search_modules_impl(request, config),
+            search_modules_impl(request, config),
+        )
 
-class TestSearchModulesImpl:
-    """Test the search_modules_impl function."""
+        # Verify both callers got the result of one search's two page requests
+        assert first == second == expected_response
+        assert len(fake_terraform_client.calls) == 2
+        assert not search._INFLIGHT
 
-    @pytest.fixture
-    def config(self):
-        """Create a test configuration."""
-        return Config()
+    async def test_repeated_search_served_from_cache(
+        self, config, fake_terraform_client, sample_registry_response, expected_response
+    ):
+        """Test that repeating a search reuses the response built the first time."""
+        # Setup
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            {
+                "modules": [],
+                "meta": {"limit": 50, "offset": 50, "total_count": 23},
+            },
+        ]
+        request = ModuleSearchRequest(query="vpc")
 
-    @pytest.fixture
-    def config_with_filtering(self):
-        """Create a test configuration with filtering enabled."""
-        return Config(
-            allowed_namespaces=["terraform-ibm-modules", "ibm-garage-cloud"],
-            excluded_modules=[
-                "terraform-ibm-modules/bad-module/ibm",
-                "terraform-ibm-modules/deprecated-vpc/ibm",
-            ],
-        )
+        first = await search_modules_impl(request, config)
+        fake_terraform_client.calls.clear()
 
-    @pytest.fixture
-    def mock_terraform_client(self):
-        """Create a mock Terraform client."""
-        return AsyncMock()
+        # Execute
+        second = await search_modules_impl(request, config)
 
-    @pytest.fixture
-    def sample_registry_response(self):
-        """Sample response from Terraform Registry API."""
-        return {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/vpc/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "vpc",
-                    "provider": "ibm",
-                    "version": "5.1.0",
-                    "description": "Provisions and configures IBM Cloud VPC resources",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    "downloads": 53004,
-                    "verified": False,
-                    "published_at": "2025-09-02T08:33:15.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/security-group/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "security-group",
-                    "provider": "ibm",
-                    "version": "2.3.1",
-                    "description": "Creates and configures IBM Cloud security groups",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
-                    "downloads": 15234,
-                    "verified": True,
-                    "published_at": "2025-08-15T12:22:33.000Z",
-                },
-            ],
-            "meta": {"limit": 10, "offset": 0, "total_count": 23},
+        # Verify
+        assert second is first
+        assert second == expected_response
+        assert fake_terraform_client.calls == []
+
+    async def test_degraded_search_not_cached(
+        self,
+        config,
+        fake_terraform_client,
+        fake_github_client,
+        sample_registry_response,
+    ):
+        """Test that results missing modules after failed lookups are not reused."""
+        # Setup - pages for two searches
+        empty_page = {
+            "modules": [],
+            "meta": {"limit": 50, "offset": 50, "total_count": 23},
         }
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            empty_page,
+            sample_registry_response,
+            empty_page,
+        ]
+        fake_github_client.exc = GitHubError("API rate limit exceeded")
+        request = ModuleSearchRequest(query="vpc")
 
-    @pytest.fixture
-    def expected_response(self):
-        """Expected formatted response."""
-        return ModuleSearchResponse(
-            query="vpc",
-            total_found=23,
-            modules=[
-                ModuleInfo(
-                    id="terraform-ibm-modules/vpc/ibm",
-                    namespace="terraform-ibm-modules",
-                    name="vpc",
-                    provider="ibm",
-                    version="5.1.0",
-                    description="Provisions and configures IBM Cloud VPC resources",
-                    source_url="https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    downloads=53004,
-                    verified=False,
-                    published_at=datetime.fromisoformat("2025-09-02T08:33:15+00:00"),
-                ),
-                ModuleInfo(
-                    id="terraform-ibm-modules/security-group/ibm",
-                    namespace="terraform-ibm-modules",
-                    name="security-group",
-                    provider="ibm",
-                    version="2.3.1",
-                    description="Creates and configures IBM Cloud security groups",
-                    source_url="https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
-                    downloads=15234,
-                    verified=True,
-                    published_at=datetime.fromisoformat("2025-08-15T12:22:33+00:00"),
-                ),
-            ],
-        )
+        degraded = await search_modules_impl(request, config)
+        fake_github_client.exc = None
 
-    @pytest.mark.asyncio
-    async def test_successful_search_basic_query(
-        self, config, mock_terraform_client, sample_registry_response, expected_response
+        # Execute
+        recovered = await search_modules_impl(request, config)
+
+        # Verify the second search ran again instead of reusing the empty result
+        assert degraded.modules == []
+        assert len(recovered.modules) == 2
+        assert len(fake_terraform_client.calls) == 4
+
+    def test_response_cache_expires_after_five_minutes(self):
+        """Test that search responses are kept for a fixed five minutes."""
+        assert SEARCH_RESPONSE_TTL == 300
+        assert get_search_response_cache().ttl == SEARCH_RESPONSE_TTL
+
+    async def test_exclusions_part_of_cache_key(
+        self, config, fake_terraform_client, sample_registry_response
     ):
-        """Test successful module search with basic query."""
-        # Setup - return the response only on first call, empty on subsequent calls
-        mock_terraform_client.search_modules.side_effect = [
-            sample_registry_response,  # First call returns modules
+        """Test that a different exclusion list does not reuse a cached response."""
+        # Setup
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            _make_response(offset=50),
+            sample_registry_response,
+            _make_response(offset=50),
+        ]
+        request = ModuleSearchRequest(query="vpc")
+        excluding_config = Config(excluded_modules=["terraform-ibm-modules/vpc/ibm"])
+
+        await search_modules_impl(request, config)
+
+        # Execute
+        result = await search_modules_impl(request, excluding_config)
+
+        # Verify
+        assert [module.name for module in result.modules] == ["security-group"]
+        assert len(fake_terraform_client.calls) == 4
+
+    async def test_shared_http_clients_closed(
+        self, config, fake_terraform_client, sample_registry_response
+    ):
+        """Test that closing the shared HTTP clients closes and forgets them."""
+        # Setup
+        fake_terraform_client.responses = [
+            sample_registry_response,
             {
                 "modules": [],
                 "meta": {"limit": 50, "offset": 50, "total_count": 23},
-            },  # Second call returns empty
+            },
+        ]
+        await search_modules_impl(ModuleSearchRequest(query="vpc"), config)
+        clients = list(_http_clients.values())
+        assert len(clients) == 2
+
+        # Execute
+        await aclose_http_clients()
+
+        # Verify
+        assert _http_clients == {}
+        assert all(client.is_closed for client in clients)
+
+    async def test_json_search_serializes_once(
+        self, config, fake_terraform_client, sample_registry_response, expected_response
+    ):
+        """Test that the JSON entry point reuses the text serialized the first time."""
+        # Setup
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            {
+                "modules": [],
+                "meta": {"limit": 50, "offset": 50, "total_count": 23},
+            },
         ]
         request = ModuleSearchRequest(query="vpc")
 
-        # Create a mock GitHub client
-        mock_github_client = create_mock_github_client()
-
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            # Always return True for repository validation
-            mock_is_valid.return_value = True
-
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify
-            assert result == expected_response
-            # Check that search was called twice due to batching
-            assert mock_terraform_client.search_modules.call_count == 2
-            mock_terraform_client.search_modules.assert_any_call(
-                query="vpc",
-                namespace="terraform-ibm-modules",
-                limit=50,  # batch_size is 50
-                offset=0,
-            )
+        first = await search.search_modules_json_impl(request, config)
+
+        # Execute
+        second = await search.search_modules_json_impl(request, config)
+
+        # Verify the text is kept in the response's own cache entry
+        assert second is first
+        assert first == expected_response.model_dump_json(indent=2)
+        assert len(fake_terraform_client.calls) == 2
+        (entry,) = get_search_response_cache().values()
+        assert entry.json is first
 
-    @pytest.mark.asyncio
     async def test_successful_search_with_limit(
-        self, config, mock_terraform_client, sample_registry_response
+        self, config, fake_terraform_client, sample_registry_response
     ):
         """Test successful module search with custom limit."""
         # Setup - return modules in batches
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,  # First batch
             sample_registry_response,  # Second batch
             sample_registry_response,  # Third batch
@@ -206,238 +388,95 @@ class TestSearchModulesImpl:
         ]
         request = ModuleSearchRequest(query="vpc", limit=5)
 
-        # Create a mock GitHub client
-        mock_github_client = create_mock_github_client()
-
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            # Always return True for repository validation
-            mock_is_valid.return_value = True
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify
-            assert result.query == "vpc"
-            assert result.total_found == 23
-            assert len(result.modules) == 5  # Should get 5 modules as requested
-            # Should be called multiple times due to batching
-            assert mock_terraform_client.search_modules.call_count >= 3
-
-    @pytest.mark.asyncio
-    async def test_empty_search_results(self, config, mock_terraform_client):
+        # Execute
+        result = await search_modules_impl(request, config)
+
+        # Verify
+        assert result.query == "vpc"
+        assert result.total_found == 23
+        # Repeated batches only contribute their two distinct modules
+        assert len(result.modules) == 2
+        # Should be called multiple times due to batching
+        assert len(fake_terraform_client.calls) >= 3
+
+    async def test_empty_search_results(self, config, fake_terraform_client):
         """Test handling of empty search results."""
         # Setup
         empty_response = {
             "modules": [],
             "meta": {"limit": 10, "offset": 0, "total_count": 0},
         }
-        mock_terraform_client.search_modules.return_value = empty_response
+        fake_terraform_client.responses = [empty_response]
         request = ModuleSearchRequest(query="nonexistent")
 
-        # Create a mock GitHub client
-        mock_github_client = create_mock_github_client()
-
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            # Always return True for repository validation
-            mock_is_valid.return_value = True
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify
-            assert result.query == "nonexistent"
-            assert result.total_found == 0
-            assert result.modules == []
-
-    @pytest.mark.asyncio
-    async def test_terraform_registry_error(self, config, mock_terraform_client):
-        """Test handling of Terraform Registry API errors."""
-        # Setup
-        mock_terraform_client.search_modules.side_effect = TerraformRegistryError(
-            "API temporarily unavailable", status_code=503
-        )
-        request = ModuleSearchRequest(query="vpc")
-
-        with patch("tim_mcp.tools.search.TerraformClient") as mock_client_class:
-            mock_client_class.return_value.__aenter__.return_value = (
-                mock_terraform_client
-            )
-            # Execute & Verify
-            with pytest.raises(TerraformRegistryError) as exc_info:
-                await search_modules_impl(request, config)
-
-            assert "API temporarily unavailable" in str(exc_info.value)
-            assert exc_info.value.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_rate_limit_error(self, config, mock_terraform_client):
-        """Test handling of rate limit errors."""
-        # Setup
-        mock_terraform_client.search_modules.side_effect = RateLimitError(
-            "Rate limit exceeded", reset_time=1695123456, api_name="Terraform Registry"
-        )
-        request = ModuleSearchRequest(query="vpc")
-
-        with patch("tim_mcp.tools.search.TerraformClient") as mock_client_class:
-            mock_client_class.return_value.__aenter__.return_value = (
-                mock_terraform_client
-            )
-            # Execute & Verify
-            with pytest.raises(RateLimitError) as exc_info:
-                await search_modules_impl(request, config)
+        # Execute
+        result = await search_modules_impl(request, config)
 
-            assert "Rate limit exceeded" in str(exc_info.value)
-            assert exc_info.value.reset_time == 1695123456
+        # Verify
+        assert result.query == "nonexistent"
+        assert result.total_found == 0
+        assert result.modules == []
 
-    @pytest.mark.asyncio
-    async def test_malformed_api_response(self, config, mock_terraform_client):
-        """Test handling of malformed API responses - invalid modules are skipped."""
-        # Setup - all modules have missing required fields
-        malformed_response = {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/vpc/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    # Missing required fields like 'name', 'provider', etc.
-                }
-            ],
-            "meta": {"limit": 10, "offset": 0, "total_count": 1},
-        }
-        mock_terraform_client.search_modules.side_effect = [
-            malformed_response,
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
-        ]
-        request = ModuleSearchRequest(query="vpc")
-
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute - should handle malformed data gracefully
-            result = await search_modules_impl(request, config)
-
-            # Verify - no modules should be in results since all were invalid
-            assert len(result.modules) == 0
-            assert result.total_found == 1
-
-    @pytest.mark.asyncio
-    async def test_invalid_datetime_format(self, config, mock_terraform_client):
-        """Test handling of invalid datetime formats - modules with bad dates are skipped."""
-        # Setup
-        invalid_datetime_response = {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/bad-date/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "bad-date",
-                    "provider": "ibm",
-                    "version": "5.1.0",
-                    "description": "Test module",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    "downloads": 123,
-                    "verified": False,
-                    "published_at": "invalid-date-format",
-                },
-                {  # Valid module
-                    "id": "terraform-ibm-modules/vpc/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "vpc",
-                    "provider": "ibm",
-                    "version": "1.0.0",
-                    "description": "Valid module",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    "downloads": 100,
-                    "verified": False,
-                    "published_at": "2025-01-01T00:00:00.000Z",
-                },
-            ],
-            "meta": {"limit": 10, "offset": 0, "total_count": 2},
-        }
-        mock_terraform_client.search_modules.side_effect = [
-            invalid_datetime_response,
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 2}},
+    async def test_duplicate_modules_across_batches_processed_once(
+        self,
+        config,
+        fake_terraform_client,
+        fake_github_client,
+        sample_registry_response,
+    ):
+        """Test that modules repeated in later batches are not looked up again."""
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            sample_registry_response,
+            {"modules": [], "meta": {"limit": 50, "offset": 100, "total_count": 23}},
         ]
         request = ModuleSearchRequest(query="vpc")
 
-        mock_github_client = create_mock_github_client()
-
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute - should handle invalid datetime gracefully
-            result = await search_modules_impl(request, config)
-
-            # Verify - only the valid module should be in results
-            assert len(result.modules) == 1
-            assert result.modules[0].id == "terraform-ibm-modules/vpc/ibm"
-
-    @pytest.mark.asyncio
-    async def test_missing_meta_information(self, config, mock_terraform_client):
-        """Test handling of missing meta information in API response."""
-        # Setup
-        no_meta_response = {
-            "modules": []
-            # Missing 'meta' section
-        }
-        mock_terraform_client.search_modules.return_value = no_meta_response
-        request = ModuleSearchRequest(query="vpc")
-
-        with patch("tim_mcp.tools.search.TerraformClient") as mock_client_class:
-            mock_client_class.return_value.__aenter__.return_value = (
-                mock_terraform_client
-            )
-            # Execute & Verify
-            with pytest.raises(TIMValidationError) as exc_info:
-                await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
-            assert "Invalid API response format" in str(exc_info.value)
+        assert [m.id for m in result.modules] == [
+            "terraform-ibm-modules/vpc/ibm",
+            "terraform-ibm-modules/security-group/ibm",
+        ]
+        assert len(fake_terraform_client.version_lookups) == 2
+        assert len(fake_github_client.lookups) == 2
 
-    @pytest.mark.asyncio
     async def test_client_context_manager_usage(
-        self, config, mock_terraform_client, sample_registry_response
+        self, config, fake_terraform_client, sample_registry_response, monkeypatch
     ):
         """Test that the TerraformClient is used as an async context manager."""
-        # Setup
-        mock_terraform_client.search_modules.return_value = sample_registry_response
+        # Setup - two pages for each of the two searches
+        fake_terraform_client.responses = [
+            sample_registry_response,
+            _make_response(offset=50),
+        ] * 2
         request = ModuleSearchRequest(query="vpc")
-
-        with patch("tim_mcp.tools.search.TerraformClient") as mock_client_class:
-            # Set up the context manager correctly
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__.return_value = mock_terraform_client
-            mock_client_class.return_value = mock_instance
-
-            # Execute
-            await search_modules_impl(request, config)
-
-            # Verify context manager methods were called
-            mock_instance.__aenter__.assert_called_once()
-            mock_instance.__aexit__.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_response_data_transformation(self, config, mock_terraform_client):
+        events = []
+        http_clients = []
+
+        @asynccontextmanager
+        async def tracking_client_class(*args, **kwargs):
+            events.append("enter")
+            http_clients.append(kwargs["http_client"])
+            try:
+                yield fake_terraform_client
+            finally:
+                events.append("exit")
+
+        monkeypatch.setattr(search, "TerraformClient", tracking_client_class)
+
+        # Execute
+        await search_modules_impl(request, config)
+        reset_search_response_cache()
+        await search_modules_impl(request, config)
+
+        # Verify each search entered and exited the client once, sending its
+        # requests through the same shared connection pool
+        assert events == ["enter", "exit", "enter", "exit"]
+        assert http_clients[0] is http_clients[1]
+        assert not http_clients[0].is_closed
+
+    async def test_response_data_transformation(self, config, fake_terraform_client):
         """Test correct transformation of API response data to our format."""
         # Setup with specific test data
         api_response = {
@@ -457,127 +496,75 @@ class TestSearchModulesImpl:
             ],
             "meta": {"limit": 10, "offset": 0, "total_count": 1},
         }
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             api_response,
             {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
         ]
         request = ModuleSearchRequest(query="test")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify transformation
-            assert result.query == "test"
-            assert result.total_found == 1
-            assert len(result.modules) == 1
-
-            module = result.modules[0]
-            assert module.id == "test/module/provider"
-            assert module.namespace == "test"
-            assert module.name == "module"
-            assert module.provider == "provider"
-            assert module.version == "1.0.0"
-            assert module.description == "Test description"
-            assert str(module.source_url) == "https://github.com/test/repo"
-            assert module.downloads == 999
-            assert module.verified is True
-            assert module.published_at == datetime.fromisoformat(
-                "2025-01-01T12:00:00+00:00"
-            )
+        # Execute
+        result = await search_modules_impl(request, config)
+
+        # Verify transformation
+        assert result.query == "test"
+        assert result.total_found == 1
+        assert len(result.modules) == 1
+
+        module = result.modules[0]
+        assert module.id == "test/module/provider"
+        assert module.namespace == "test"
+        assert module.name == "module"
+        assert module.provider == "provider"
+        assert module.version == "1.0.0"
+        assert module.description == "Test description"
+        assert str(module.source_url) == "https://github.com/test/repo"
+        assert module.downloads == 999
+        assert module.verified is True
+        assert module.published_at == datetime(2025, 1, 1, 12, tzinfo=UTC)
 
-    @pytest.mark.asyncio
     async def test_namespace_filtering_uses_configured(
-        self, config_with_filtering, mock_terraform_client, sample_registry_response
+        self, config_with_filtering, fake_terraform_client, sample_registry_response
     ):
         """Test that the configured namespace is used from config."""
         # Setup
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,
             {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 23}},
         ]
         # Request without namespace parameter
         request = ModuleSearchRequest(query="vpc")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-            # Execute
-            result = await search_modules_impl(request, config_with_filtering)
-
-            # Verify that the search was called with the first allowed namespace
-            mock_terraform_client.search_modules.assert_any_call(
-                query="vpc",
-                namespace="terraform-ibm-modules",  # First allowed namespace from config
-                limit=50,  # batch_size is 50
-                offset=0,
-            )
-            assert result.query == "vpc"
+        # Execute
+        result = await search_modules_impl(request, config_with_filtering)
+
+        # Verify that the search was called with the first allowed namespace
+        assert fake_terraform_client.calls[0] == {
+            "query": "vpc",
+            "namespace": "terraform-ibm-modules",  # First allowed namespace from config
+            "limit": 50,  # batch_size is 50
+            "offset": 0,
+        }
+        assert result.query == "vpc"
 
-    @pytest.mark.asyncio
     async def test_module_exclusion_filtering(
-        self, config_with_filtering, mock_terraform_client
+        self, config_with_filtering, fake_terraform_client
     ):
         """Test that excluded modules are filtered out from results."""
         # Setup - response with both allowed and excluded modules
-        response_with_excluded = {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/vpc/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "vpc",
-                    "provider": "ibm",
-                    "version": "5.1.0",
-                    "description": "Provisions and configures IBM Cloud VPC resources",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    "downloads": 53004,
-                    "verified": False,
-                    "published_at": "2025-09-02T08:33:15.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/bad-module/ibm",  # This should be excluded
-                    "namespace": "terraform-ibm-modules",
-                    "name": "bad-module",
-                    "provider": "ibm",
-                    "version": "1.0.0",
-                    "description": "This module has issues",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-bad-module",
-                    "downloads": 10,
-                    "verified": False,
-                    "published_at": "2025-08-01T10:00:00.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/security-group/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "security-group",
-                    "provider": "ibm",
-                    "version": "2.3.1",
-                    "description": "Creates and configures IBM Cloud security groups",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
-                    "downloads": 15234,
-                    "verified": True,
-                    "published_at": "2025-08-15T12:22:33.000Z",
-                },
-            ],
-            "meta": {"limit": 10, "offset": 0, "total_count": 3},
-        }
+        response_with_excluded = _make_response(
+            _vpc_module(),
+            _mod(
+                "bad-module",
+                10,
+                description="This module has issues",
+                source="https://github.com/terraform-ibm-modules/terraform-ibm-bad-module",
+                published_at="2025-08-01T10:00:00.000Z",
+            ),
+            _security_group_module(),
+            total_count=3,
+        )
 
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             response_with_excluded,
             response_with_excluded,  # May need more batches
             response_with_excluded,
@@ -585,556 +572,449 @@ class TestSearchModulesImpl:
         ]
         request = ModuleSearchRequest(query="modules")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute
-            result = await search_modules_impl(request, config_with_filtering)
-
-            # Verify that only non-excluded modules are in the results
-            assert result.query == "modules"
-            assert result.total_found == 3  # Original total from API
-            assert len(result.modules) == 5  # Should reach limit of 5 (default)
-
-            # Verify the excluded module is not in results
-            module_ids = [module.id for module in result.modules]
-            assert "terraform-ibm-modules/vpc/ibm" in module_ids
-            assert "terraform-ibm-modules/security-group/ibm" in module_ids
-            assert "terraform-ibm-modules/bad-module/ibm" not in module_ids  # Excluded
-
-    @pytest.mark.asyncio
+        # Execute
+        result = await search_modules_impl(request, config_with_filtering)
+
+        # Verify that only non-excluded modules are in the results
+        assert result.query == "modules"
+        assert result.total_found == 3  # Original total from API
+        assert len(result.modules) == 2  # Duplicates across batches dropped
+
+        # Verify the excluded module is not in results
+        module_ids = [module.id for module in result.modules]
+        assert "terraform-ibm-modules/vpc/ibm" in module_ids
+        assert "terraform-ibm-modules/security-group/ibm" in module_ids
+        assert "terraform-ibm-modules/bad-module/ibm" not in module_ids  # Excluded
+
+    async def test_excluded_modules_skip_version_lookups(
+        self, config_with_filtering, fake_terraform_client
+    ):
+        """Test that excluded modules are dropped before their versions are fetched."""
+        # Setup - registry IDs carry the version, exclusions do not
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod("vpc", 100, id="terraform-ibm-modules/vpc/ibm/1.0.0"),
+                _mod(
+                    "bad-module", 200, id="terraform-ibm-modules/bad-module/ibm/1.0.0"
+                ),
+                total_count=2,
+            ),
+            _make_response(offset=50),
+        ]
+        request = ModuleSearchRequest(query="modules")
+
+        # Execute
+        result = await search_modules_impl(request, config_with_filtering)
+
+        # Verify
+        assert [module.id for module in result.modules] == [
+            "terraform-ibm-modules/vpc/ibm"
+        ]
+        assert fake_terraform_client.version_lookups == [
+            ("terraform-ibm-modules", "vpc", "ibm")
+        ]
+
     async def test_empty_allowed_namespaces_no_filtering(
-        self, mock_terraform_client, sample_registry_response
+        self, fake_terraform_client, sample_registry_response
     ):
         """Test behavior when allowed_namespaces is empty - no namespace filtering should occur."""
         # Setup config with empty allowed namespaces
         config_no_filtering = Config(allowed_namespaces=[], excluded_modules=[])
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,
             {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 23}},
         ]
         request = ModuleSearchRequest(query="vpc")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-            # Execute
-            result = await search_modules_impl(request, config_no_filtering)
-
-            # Verify that None namespace was passed (no filtering)
-            mock_terraform_client.search_modules.assert_any_call(
-                query="vpc",
-                namespace=None,  # No namespace filtering when config is empty
-                limit=50,  # batch_size is 50
-                offset=0,
-            )
-            assert result.query == "vpc"
+        # Execute
+        result = await search_modules_impl(request, config_no_filtering)
 
-    @pytest.mark.asyncio
-    async def test_download_sorting(self, config, mock_terraform_client):
-        """Test that results are sorted by downloads in descending order."""
-        # Setup - response with modules in wrong download order
-        unsorted_response = {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/low-downloads/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "low-downloads",
-                    "provider": "ibm",
-                    "version": "1.0.0",
-                    "description": "Module with few downloads",
-                    "source": "https://github.com/terraform-ibm-modules/low-downloads",
-                    "downloads": 100,  # Low downloads
-                    "verified": False,
-                    "published_at": "2025-09-01T08:00:00.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/high-downloads/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "high-downloads",
-                    "provider": "ibm",
-                    "version": "2.0.0",
-                    "description": "Module with many downloads",
-                    "source": "https://github.com/terraform-ibm-modules/high-downloads",
-                    "downloads": 50000,  # High downloads
-                    "verified": True,
-                    "published_at": "2025-09-02T08:00:00.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/medium-downloads/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "medium-downloads",
-                    "provider": "ibm",
-                    "version": "1.5.0",
-                    "description": "Module with medium downloads",
-                    "source": "https://github.com/terraform-ibm-modules/medium-downloads",
-                    "downloads": 5000,  # Medium downloads
-                    "verified": False,
-                    "published_at": "2025-09-01T12:00:00.000Z",
-                },
-            ],
-            "meta": {"limit": 100, "offset": 0, "total_count": 3},
+        # Verify that None namespace was passed (no filtering)
+        assert fake_terraform_client.calls[0] == {
+            "query": "vpc",
+            "namespace": None,  # No namespace filtering when config is empty
+            "limit": 50,  # batch_size is 50
+            "offset": 0,
         }
+        assert result.query == "vpc"
+
+    @pytest.mark.parametrize(
+        ("modules", "limit", "expected"),
+        [
+            pytest.param(
+                _unsorted_modules(),
+                5,
+                [
+                    ("high-downloads", 50000),
+                    ("medium-downloads", 5000),
+                    ("low-downloads", 100),
+                ],
+                id="descending",
+            ),
+            pytest.param(
+                _unsorted_modules(),
+                2,
+                [("high-downloads", 50000), ("medium-downloads", 5000)],
+                id="with-limit",
+            ),
+            pytest.param(
+                [
+                    _mod("module-a", 1000),
+                    _mod("module-b", 1000, published_at="2025-09-02T08:00:00.000Z"),
+                ],
+                5,
+                [("module-a", 1000), ("module-b", 1000)],
+                id="same-counts-keep-registry-order",
+            ),
+        ],
+    )
+    async def test_download_sorting(
+        self, config, fake_terraform_client, modules, limit, expected
+    ):
+        """Test that results are sorted by downloads in descending order."""
+        fake_terraform_client.responses = [
+            _make_response(*modules, total_count=len(modules)),
+            _make_response(offset=50, total_count=len(modules)),
+        ]
+        request = ModuleSearchRequest(query="modules", limit=limit)
+
+        # Execute
+        result = await search_modules_impl(request, config)
+
+        # Verify order and that the user's limit is applied after sorting
+        assert result.query == "modules"
+        assert result.total_found == len(modules)
+        assert [(m.name, m.downloads) for m in result.modules] == expected
+
+        # Stop paging once the first page satisfies the limit
+        if limit < len(modules):
+            assert len(fake_terraform_client.calls) == 1
+
+
+class TestSearchModulesErrors:
+    """Test search_modules_impl error handling and malformed registry data."""
+
+    @pytest.mark.parametrize(
+        ("exc", "attr", "value"),
+        [
+            pytest.param(
+                TerraformRegistryError("API temporarily unavailable", status_code=503),
+                "status_code",
+                503,
+                id="registry-error",
+            ),
+            pytest.param(
+                RateLimitError(
+                    "Rate limit exceeded",
+                    reset_time=1695123456,
+                    api_name="Terraform Registry",
+                ),
+                "reset_time",
+                1695123456,
+                id="rate-limit-error",
+            ),
+        ],
+    )
+    async def test_api_error_propagated(
+        self, config, fake_terraform_client, exc, attr, value
+    ):
+        """Test that registry and rate limit errors reach the caller unchanged."""
+        # Setup
+        fake_terraform_client.exc = exc
+        request = ModuleSearchRequest(query="vpc")
 
-        mock_terraform_client.search_modules.side_effect = [
-            unsorted_response,
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 3}},
+        # Execute & Verify
+        with pytest.raises(type(exc), match=str(exc)) as exc_info:
+            await search_modules_impl(request, config)
+
+        assert getattr(exc_info.value, attr) == value
+        assert fake_terraform_client.calls == [
+            {
+                "query": "vpc",
+                "namespace": "terraform-ibm-modules",
+                "limit": 50,
+                "offset": 0,
+            }
         ]
-        request = ModuleSearchRequest(query="modules")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify that results are sorted by downloads descending
-            assert result.query == "modules"
-            assert result.total_found == 3
-            assert len(result.modules) == 3
-
-            # Check order: high (50000) -> medium (5000) -> low (100)
-            assert result.modules[0].downloads == 50000
-            assert result.modules[0].id == "terraform-ibm-modules/high-downloads/ibm"
-            assert result.modules[1].downloads == 5000
-            assert result.modules[1].id == "terraform-ibm-modules/medium-downloads/ibm"
-            assert result.modules[2].downloads == 100
-            assert result.modules[2].id == "terraform-ibm-modules/low-downloads/ibm"
-
-    @pytest.mark.asyncio
-    async def test_download_sorting_with_limit(self, config, mock_terraform_client):
-        """Test that sorting works correctly when applying user's limit."""
-        # Setup - same unsorted response as above
-        unsorted_response = {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/low-downloads/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "low-downloads",
-                    "provider": "ibm",
-                    "version": "1.0.0",
-                    "description": "Module with few downloads",
-                    "source": "https://github.com/terraform-ibm-modules/low-downloads",
-                    "downloads": 100,
-                    "verified": False,
-                    "published_at": "2025-09-01T08:00:00.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/high-downloads/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "high-downloads",
-                    "provider": "ibm",
-                    "version": "2.0.0",
-                    "description": "Module with many downloads",
-                    "source": "https://github.com/terraform-ibm-modules/high-downloads",
-                    "downloads": 50000,
-                    "verified": True,
-                    "published_at": "2025-09-02T08:00:00.000Z",
-                },
+    async def test_malformed_api_response(self, config, fake_terraform_client):
+        """Test handling of malformed API responses - invalid modules are skipped."""
+        # Setup - all modules have missing required fields
+        malformed_response = {
+            "modules": [
                 {
-                    "id": "terraform-ibm-modules/medium-downloads/ibm",
+                    "id": "terraform-ibm-modules/vpc/ibm",
                     "namespace": "terraform-ibm-modules",
-                    "name": "medium-downloads",
-                    "provider": "ibm",
-                    "version": "1.5.0",
-                    "description": "Module with medium downloads",
-                    "source": "https://github.com/terraform-ibm-modules/medium-downloads",
-                    "downloads": 5000,
-                    "verified": False,
-                    "published_at": "2025-09-01T12:00:00.000Z",
-                },
+                    # Missing required fields like 'name', 'provider', etc.
+                }
             ],
-            "meta": {"limit": 100, "offset": 0, "total_count": 3},
+            "meta": {"limit": 10, "offset": 0, "total_count": 1},
         }
-
-        mock_terraform_client.search_modules.side_effect = [
-            unsorted_response,
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 3}},
+        fake_terraform_client.responses = [
+            malformed_response,
+            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
         ]
-        # Request only top 2 results
-        request = ModuleSearchRequest(query="modules", limit=2)
-
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            # Execute
-            result = await search_modules_impl(request, config)
-
-            # Verify that we get top 2 by downloads
-            assert result.query == "modules"
-            assert result.total_found == 3
-            assert len(result.modules) == 2  # Limited to 2
-
-            # Check that we got the top 2: high (50000) and medium (5000)
-            assert result.modules[0].downloads == 50000
-            assert result.modules[0].id == "terraform-ibm-modules/high-downloads/ibm"
-            assert result.modules[1].downloads == 5000
-            assert result.modules[1].id == "terraform-ibm-modules/medium-downloads/ibm"
-
-    @pytest.mark.asyncio
-    async def test_download_sorting_same_counts(self, config, mock_terraform_client):
-        """Test sorting behavior when modules have the same download counts."""
-        # Setup - modules with same download counts
-        same_downloads_response = {
+        request = ModuleSearchRequest(query="vpc")
+
+        # Execute - should handle malformed data gracefully
+        result = await search_modules_impl(request, config)
+
+        # Verify - no modules should be in results since all were invalid
+        assert len(result.modules) == 0
+        assert result.total_found == 1
+
+    async def test_invalid_datetime_format(self, config, fake_terraform_client):
+        """Test handling of invalid datetime formats - modules with bad dates are skipped."""
+        # Setup
+        invalid_datetime_response = {
             "modules": [
                 {
-                    "id": "terraform-ibm-modules/module-a/ibm",
+                    "id": "terraform-ibm-modules/bad-date/ibm",
                     "namespace": "terraform-ibm-modules",
-                    "name": "module-a",
+                    "name": "bad-date",
                     "provider": "ibm",
-                    "version": "1.0.0",
-                    "description": "Module A",
-                    "source": "https://github.com/terraform-ibm-modules/module-a",
-                    "downloads": 1000,  # Same downloads
+                    "version": "5.1.0",
+                    "description": "Test module",
+                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
+                    "downloads": 123,
                     "verified": False,
-                    "published_at": "2025-09-01T08:00:00.000Z",
+                    "published_at": "invalid-date-format",
                 },
-                {
-                    "id": "terraform-ibm-modules/module-b/ibm",
+                {  # Valid module
+                    "id": "terraform-ibm-modules/vpc/ibm",
                     "namespace": "terraform-ibm-modules",
-                    "name": "module-b",
+                    "name": "vpc",
                     "provider": "ibm",
                     "version": "1.0.0",
-                    "description": "Module B",
-                    "source": "https://github.com/terraform-ibm-modules/module-b",
-                    "downloads": 1000,  # Same downloads
+                    "description": "Valid module",
+                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
+                    "downloads": 100,
                     "verified": False,
-                    "published_at": "2025-09-02T08:00:00.000Z",
+                    "published_at": "2025-01-01T00:00:00.000Z",
                 },
             ],
-            "meta": {"limit": 100, "offset": 0, "total_count": 2},
+            "meta": {"limit": 10, "offset": 0, "total_count": 2},
         }
-
-        mock_terraform_client.search_modules.side_effect = [
-            same_downloads_response,
+        fake_terraform_client.responses = [
+            invalid_datetime_response,
             {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 2}},
         ]
-        request = ModuleSearchRequest(query="modules")
+        request = ModuleSearchRequest(query="vpc")
 
-        mock_github_client = AsyncMock()
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
+        # Execute - should handle invalid datetime gracefully
+        result = await search_modules_impl(request, config)
+
+        # Verify - only the valid module should be in results
+        assert len(result.modules) == 1
+        assert result.modules[0].id == "terraform-ibm-modules/vpc/ibm"
 
-            # Execute
-            result = await search_modules_impl(request, config)
+    async def test_missing_meta_information(self, config, fake_terraform_client):
+        """Test handling of missing meta information in API response."""
+        # Setup
+        no_meta_response = {
+            "modules": []
+            # Missing 'meta' section
+        }
+        fake_terraform_client.responses = [no_meta_response]
+        request = ModuleSearchRequest(query="vpc")
 
-            # Verify that results are returned (order may be stable but not guaranteed)
-            assert result.query == "modules"
-            assert result.total_found == 2
-            assert len(result.modules) == 2
-            # Both modules should have same download count
-            assert all(module.downloads == 1000 for module in result.modules)
+        # Execute & Verify
+        with pytest.raises(TIMValidationError, match="Invalid API response format"):
+            await search_modules_impl(request, config)
 
 
 class TestRepositoryFiltering:
     """Test repository filtering functionality."""
 
-    @pytest.fixture
-    def config(self):
-        """Create a test configuration."""
-        return Config()
-
-    @pytest.fixture
-    def mock_terraform_client(self):
-        """Create a mock Terraform client."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client."""
-        mock_client = MagicMock()
-        # parse_github_url is a regular method (not async)
-        mock_client.parse_github_url.return_value = (
-            "terraform-ibm-modules",
-            "terraform-ibm-vpc",
-        )
-        # get_repository_info is async
-        mock_client.get_repository_info = AsyncMock(
-            return_value={
-                "archived": False,
-                "topics": ["core-team"],  # Required topic for valid repos
-            }
-        )
-        return mock_client
+    # Repositories of the modules in the sample registry response
+    _VPC_REPO = ("terraform-ibm-modules", "terraform-ibm-vpc")
+    _SECURITY_GROUP_REPO = ("terraform-ibm-modules", "terraform-ibm-security-group")
 
     @pytest.fixture
-    def sample_registry_response(self):
-        """Sample response from Terraform Registry API."""
-        return {
-            "modules": [
-                {
-                    "id": "terraform-ibm-modules/vpc/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "vpc",
-                    "provider": "ibm",
-                    "version": "5.1.0",
-                    "description": "Provisions and configures IBM Cloud VPC resources",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                    "downloads": 53004,
-                    "verified": False,
-                    "published_at": "2025-09-02T08:33:15.000Z",
-                },
-                {
-                    "id": "terraform-ibm-modules/security-group/ibm",
-                    "namespace": "terraform-ibm-modules",
-                    "name": "security-group",
-                    "provider": "ibm",
-                    "version": "2.3.1",
-                    "description": "Creates and configures IBM Cloud security groups",
-                    "source": "https://github.com/terraform-ibm-modules/terraform-ibm-security-group",
-                    "downloads": 15234,
-                    "verified": True,
-                    "published_at": "2025-08-15T12:22:33.000Z",
-                },
-            ],
-            "meta": {"limit": 50, "offset": 0, "total_count": 23},
-        }
+    def config(self):
+        """Create a configuration with a GitHub token, enabling batched lookups."""
+        return Config(github_token="test-token")
 
-    @pytest.mark.asyncio
     async def test_repository_filtering_valid_repos(
         self,
         config,
-        mock_terraform_client,
-        mock_github_client,
+        fake_terraform_client,
+        fake_github_client,
         sample_registry_response,
     ):
         """Test that valid repositories pass filtering."""
         # Setup
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,
             {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 23}},
         ]
 
-        # Mock GitHub client to return valid repository info
-        def mock_parse_url(url):
-            if "vpc" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-vpc")
-            elif "security-group" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-security-group")
-            return None
-
-        mock_github_client.parse_github_url.side_effect = mock_parse_url
-
-        # Mock repository info - both repos are valid
-        mock_github_client.get_repository_info = AsyncMock(
-            return_value={
-                "archived": False,
-                "topics": ["core-team"],  # Required topic for valid repos
-            }
-        )
-
         request = ModuleSearchRequest(query="vpc", limit=2)
 
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
+        # Execute
+        result = await search_modules_impl(request, config)
+
+        # Verify
+        assert len(result.modules) == 2  # Both modules should pass filtering
+        assert result.modules[0].id == "terraform-ibm-modules/vpc/ibm"
+        assert result.modules[1].id == "terraform-ibm-modules/security-group/ibm"
+
+        # Both repositories were checked with a single batched lookup
+        assert fake_github_client.batch_lookups == [
+            [self._VPC_REPO, self._SECURITY_GROUP_REPO]
+        ]
+        assert fake_github_client.lookups == []
+
+    async def test_batched_lookup_limited_to_window(
+        self,
+        config,
+        fake_terraform_client,
+        fake_github_client,
+        sample_registry_response,
+    ):
+        """Test that only the repositories of the validation window are looked up."""
+        # Setup
+        fake_terraform_client.responses = [sample_registry_response]
+        request = ModuleSearchRequest(query="vpc", limit=1)
 
-            # Execute
-            result = await search_modules_impl(request, config)
+        # Execute
+        result = await search_modules_impl(request, config)
 
-            # Verify
-            assert len(result.modules) == 2  # Both modules should pass filtering
-            assert result.modules[0].id == "terraform-ibm-modules/vpc/ibm"
-            assert result.modules[1].id == "terraform-ibm-modules/security-group/ibm"
+        # Verify - the second module of the page was never looked up
+        assert [module.name for module in result.modules] == ["vpc"]
+        assert fake_github_client.batch_lookups == [[self._VPC_REPO]]
 
-    @pytest.mark.asyncio
-    async def test_repository_filtering_archived_repos(
+    async def test_no_token_checks_window_repositories_individually(
+        self, fake_terraform_client, fake_github_client, sample_registry_response
+    ):
+        """Test that without a token each window repository is fetched on its own."""
+        # Setup
+        fake_terraform_client.responses = [sample_registry_response]
+        request = ModuleSearchRequest(query="vpc", limit=1)
+
+        # Execute
+        result = await search_modules_impl(request, Config(github_token=None))
+
+        # Verify
+        assert [module.name for module in result.modules] == ["vpc"]
+        assert fake_github_client.batch_lookups == []
+        assert fake_github_client.lookups == [self._VPC_REPO]
+
+    @pytest.mark.parametrize(
+        "vpc_repo_info",
+        [
+            pytest.param({"archived": True, "topics": ["core-team"]}, id="archived"),
+            pytest.param(
+                {"archived": False, "topics": ["terraform", "ibm-cloud"]},
+                id="missing-topics",
+            ),
+            pytest.param(None, id="not-found"),
+        ],
+    )
+    async def test_invalid_repositories_filtered_out(
         self,
         config,
-        mock_terraform_client,
-        mock_github_client,
+        fake_terraform_client,
+        fake_github_client,
         sample_registry_response,
+        vpc_repo_info,
     ):
-        """Test that archived repositories are filtered out."""
+        """Test that archived, untagged and missing repositories are filtered out."""
         # Setup
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,
             sample_registry_response,  # Need more to get enough valid
             {"modules": [], "meta": {"limit": 50, "offset": 100, "total_count": 23}},
         ]
-
-        def mock_parse_url(url):
-            if "vpc" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-vpc")
-            elif "security-group" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-security-group")
-            return None
-
-        mock_github_client.parse_github_url.side_effect = mock_parse_url
-
-        # Mock repository info - first repo is archived
-        async def mock_get_repo_info(owner, repo):
-            if "vpc" in repo:
-                return {
-                    "archived": True,  # This repo is archived
-                    "topics": ["core-team"],
-                }
-            else:
-                return {
-                    "archived": False,
-                    "topics": ["core-team"],  # Required topic for valid repos
-                }
-
-        mock_github_client.get_repository_info = AsyncMock(
-            side_effect=mock_get_repo_info
-        )
+        fake_github_client.repos[self._VPC_REPO] = vpc_repo_info
 
         request = ModuleSearchRequest(query="vpc", limit=5)
 
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-
-            # Execute
-            result = await search_modules_impl(request, config)
+        # Execute
+        result = await search_modules_impl(request, config)
 
-            # Verify - only non-archived repo should be in results (security-group)
-            assert len(result.modules) == 2
-            assert result.modules[0].id == "terraform-ibm-modules/security-group/ibm"
+        # Verify - only the security group module's repository is valid
+        assert len(result.modules) == 1
+        assert result.modules[0].id == "terraform-ibm-modules/security-group/ibm"
 
-    @pytest.mark.asyncio
-    async def test_repository_filtering_missing_topics(
+    async def test_failed_batch_falls_back_to_single_lookups(
         self,
         config,
-        mock_terraform_client,
-        mock_github_client,
+        fake_terraform_client,
+        fake_github_client,
         sample_registry_response,
     ):
-        """Test that repositories without required topics are filtered out."""
+        """Test that a failed batched lookup is not read as no repositories."""
         # Setup
-        mock_terraform_client.search_modules.side_effect = [
+        fake_terraform_client.responses = [
             sample_registry_response,
-            sample_registry_response,  # Need more to get enough valid
-            {"modules": [], "meta": {"limit": 50, "offset": 100, "total_count": 23}},
+            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 23}},
         ]
-
-        def mock_parse_url(url):
-            if "vpc" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-vpc")
-            elif "security-group" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-security-group")
-            return None
-
-        mock_github_client.parse_github_url.side_effect = mock_parse_url
-
-        # Mock repository info - first repo missing core-team topic
-        async def mock_get_repo_info(owner, repo):
-            if "vpc" in repo:
-                return {
-                    "archived": False,
-                    "topics": ["terraform", "ibm-cloud"],  # Missing core-team
-                }
-            else:
-                return {
-                    "archived": False,
-                    "topics": ["core-team"],  # Required topic for valid repos
-                }
-
-        mock_github_client.get_repository_info = AsyncMock(
-            side_effect=mock_get_repo_info
+        fake_github_client.batch_exc = GitHubError(
+            "GraphQL error getting repository info: API rate limit exceeded"
         )
+        request = ModuleSearchRequest(query="vpc", limit=2)
 
-        request = ModuleSearchRequest(query="vpc", limit=5)
-
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-
-            # Execute
-            result = await search_modules_impl(request, config)
+        # Execute
+        result = await search_modules_impl(request, config)
 
-            # Verify - only repo with required topics should be in results
-            assert len(result.modules) == 2
-            assert result.modules[0].id == "terraform-ibm-modules/security-group/ibm"
+        # Verify both modules were validated through per-repository lookups
+        assert [module.name for module in result.modules] == ["vpc", "security-group"]
+        assert fake_github_client.lookups == [
+            self._VPC_REPO,
+            self._SECURITY_GROUP_REPO,
+        ]
 
 
 class TestGitHubClientURLParsing:
     """Test GitHub URL parsing functionality."""
 
     @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client with real URL parsing."""
-        from tim_mcp.clients.github_client import GitHubClient
-        from tim_mcp.config import Config
-
-        return GitHubClient(Config())
+    async def github_client(self):
+        """Create a GitHub client to parse URLs with."""
+        async with GitHubClient(Config()) as client:
+            yield client
 
-    def test_parse_standard_github_url(self, mock_github_client):
+    def test_parse_standard_github_url(self, github_client):
         """Test parsing standard GitHub URLs."""
         url = "https://github.com/terraform-ibm-modules/terraform-ibm-vpc"
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
         assert result == ("terraform-ibm-modules", "terraform-ibm-vpc")
 
-    def test_parse_github_url_with_git_suffix(self, mock_github_client):
+    def test_parse_github_url_with_git_suffix(self, github_client):
         """Test parsing GitHub URLs with .git suffix."""
         url = "https://github.com/terraform-ibm-modules/terraform-ibm-vpc.git"
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
         assert result == ("terraform-ibm-modules", "terraform-ibm-vpc")
 
-    def test_parse_github_url_with_git_prefix(self, mock_github_client):
+    def test_parse_github_url_with_git_prefix(self, github_client):
         """Test parsing GitHub URLs with git:: prefix."""
         url = "git::https://github.com/terraform-ibm-modules/terraform-ibm-vpc.git"
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
+        assert result == ("terraform-ibm-modules", "terraform-ibm-vpc")
+
+    def test_parse_github_url_with_subpath(self, github_client):
+        """Test parsing GitHub URLs that point below the repository root."""
+        url = "https://www.github.com/terraform-ibm-modules/terraform-ibm-vpc/tree/main"
+        result = github_client.parse_github_url(url)
         assert result == ("terraform-ibm-modules", "terraform-ibm-vpc")
 
-    def test_parse_non_github_url(self, mock_github_client):
+    def test_parse_non_github_url(self, github_client):
         """Test parsing non-GitHub URLs returns None."""
         url = "https://gitlab.com/owner/repo"
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
         assert result is None
 
-    def test_parse_invalid_url(self, mock_github_client):
+    def test_parse_invalid_url(self, github_client):
         """Test parsing invalid URLs returns None."""
         url = "not-a-valid-url"
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
         assert result is None
 
-    def test_parse_empty_url(self, mock_github_client):
+    def test_parse_empty_url(self, github_client):
         """Test parsing empty URL returns None."""
         url = ""
-        result = mock_github_client.parse_github_url(url)
+        result = github_client.parse_github_url(url)
         assert result is None
 
 
@@ -1152,80 +1032,103 @@ class TestModuleSearchRequestValidation:
         request = ModuleSearchRequest(query="vpc")
         assert request.limit == 5
 
-    def test_limit_validation_min(self):
-        """Test limit minimum validation."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"query": "vpc", "limit": 0}, id="limit-below-min"),
+            pytest.param({"query": "vpc", "limit": 101}, id="limit-above-max"),
+            pytest.param({"query": ""}, id="empty-query"),
+        ],
+    )
+    def test_invalid_request(self, kwargs):
+        """Test that out-of-range limits and empty queries are rejected."""
         with pytest.raises(ValidationError):
-            ModuleSearchRequest(query="vpc", limit=0)
+            ModuleSearchRequest(**kwargs)
 
-    def test_limit_validation_max(self):
-        """Test limit maximum validation."""
-        with pytest.raises(ValidationError):
-            ModuleSearchRequest(query="vpc", limit=101)
+    def test_from_validated_matches_validated_request(self):
+        """Test that pre-validated construction yields an equal request."""
+        request = ModuleSearchRequest.from_validated(query="vpc", limit=3)
+        assert request == ModuleSearchRequest(query="vpc", limit=3)
 
-    def test_empty_query_validation(self):
-        """Test empty query validation."""
-        with pytest.raises(ValidationError):
-            ModuleSearchRequest(query="")
+
+class TestPublishedAtParsing:
+    """Test parsing of registry publication timestamps."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2025-09-02T08:33:15.000Z", datetime(2025, 9, 2, 8, 33, 15, tzinfo=UTC)),
+            ("2025-09-02T08:33:15Z", datetime(2025, 9, 2, 8, 33, 15, tzinfo=UTC)),
+            (
+                "2025-09-02T08:33:15.1234567Z",
+                datetime(2025, 9, 2, 8, 33, 15, 123456, tzinfo=UTC),
+            ),
+            ("2025-09-02T08:33:15+00:00", datetime(2025, 9, 2, 8, 33, 15, tzinfo=UTC)),
+        ],
+    )
+    def test_parses_registry_timestamps(self, value, expected):
+        """Test that registry and other ISO timestamps parse to aware datetimes."""
+        assert search._parse_published_at(value) == expected
+
+    @pytest.mark.parametrize("value", ["invalid-date-format", "2025-02-30T00:00:00Z"])
+    def test_rejects_invalid_timestamps(self, value):
+        """Test that malformed or impossible timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            search._parse_published_at(value)
 
 
 class TestModuleInfoValidation:
     """Test validation of ModuleInfo model."""
 
+    _VALID_FIELDS = {
+        "id": "test/module/provider",
+        "namespace": "test",
+        "name": "module",
+        "provider": "provider",
+        "version": "1.0.0",
+        "description": "Test description",
+        "source_url": "https://github.com/test/repo",
+        "downloads": 100,
+        "verified": True,
+        "published_at": _FIXED_DT,
+    }
+
     def test_valid_module_info(self):
         """Test valid ModuleInfo creation."""
-        module = ModuleInfo(
-            id="test/module/provider",
-            namespace="test",
-            name="module",
-            provider="provider",
-            version="1.0.0",
-            description="Test description",
-            source_url="https://github.com/test/repo",
-            downloads=100,
-            verified=True,
-            published_at=datetime.now(),
-        )
+        module = ModuleInfo(**self._VALID_FIELDS)
         assert module.id == "test/module/provider"
         assert module.downloads == 100
 
-    def test_invalid_source_url(self):
-        """Test invalid source URL validation."""
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            pytest.param({"source_url": "not-a-url"}, id="invalid-source-url"),
+            pytest.param({"downloads": -1}, id="negative-downloads"),
+        ],
+    )
+    def test_invalid_module_info(self, overrides):
+        """Test that invalid source URLs and negative downloads are rejected."""
         with pytest.raises(ValidationError):
-            ModuleInfo(
-                id="test/module/provider",
-                namespace="test",
-                name="module",
-                provider="provider",
-                version="1.0.0",
-                description="Test description",
-                source_url="not-a-url",
-                downloads=100,
-                verified=True,
-                published_at=datetime.now(),
-            )
+            ModuleInfo(**{**self._VALID_FIELDS, **overrides})
 
-    def test_negative_downloads(self):
-        """Test negative downloads validation."""
+    def test_search_response_reuses_frozen_modules(self):
+        """Test that responses keep the given module instances and are immutable."""
+        module = search._transform_module_data(_mod("vpc", 100))
+        response = ModuleSearchResponse(query="vpc", total_found=1, modules=[module])
+
+        assert response.modules[0] is module
         with pytest.raises(ValidationError):
-            ModuleInfo(
-                id="test/module/provider",
-                namespace="test",
-                name="module",
-                provider="provider",
-                version="1.0.0",
-                description="Test description",
-                source_url="https://github.com/test/repo",
-                downloads=-1,
-                verified=True,
-                published_at=datetime.now(),
-            )
+            response.total_found = 2
+        with pytest.raises(ValidationError):
+            module.downloads = 0
 
 
 class TestTotalFoundBug:
     """Test for issue #21 - total_found incorrectly set to 0."""
 
-    @pytest.mark.asyncio
-    async def test_total_found_reflects_actual_total_from_registry(self):
+    async def test_total_found_reflects_actual_total_from_registry(
+        self, config, fake_terraform_client
+    ):
         """
         Test that total_found reflects the total count from the Terraform Registry,
         not 0 or the number of returned modules.
@@ -1233,127 +1136,24 @@ class TestTotalFoundBug:
         This test reproduces issue #21 where total_found was being set to 0
         even though modules were returned.
         """
-        config = Config()
-
-        # Create mock clients
-        mock_terraform_client = AsyncMock()
-        mock_github_client = (
-            MagicMock()
-        )  # Use MagicMock for GitHub client since parse_github_url is sync
-
-        # Mock the async context manager methods
-        mock_terraform_client.__aenter__.return_value = mock_terraform_client
-        mock_terraform_client.__aexit__.return_value = None
-        mock_github_client.__aenter__.return_value = mock_github_client
-        mock_github_client.__aexit__.return_value = None
-
-        # Mock GitHub client to validate all repositories
-        def mock_parse_url(url):
-            # Extract owner/repo from the URL
-            if "terraform-ibm-vsi" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-vsi")
-            elif "landing-zone-vsi" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-landing-zone-vsi")
-            elif "vpc-vsi" in url:
-                return ("terraform-ibm-modules", "terraform-ibm-vpc-vsi")
-            return ("terraform-ibm-modules", "test-repo")
-
-        mock_github_client.parse_github_url.side_effect = mock_parse_url
-
-        # Mock get_repository_info to return valid repo data
-        async def mock_get_repo_info(owner, repo_name):
-            return {
-                "archived": False,
-                "topics": ["core-team"],  # Required topic
-            }
-
-        mock_github_client.get_repository_info.side_effect = mock_get_repo_info
-
-        # Simulate a search that requires multiple batches
-        # Registry has 15 total modules, but we need to fetch them in batches
-        # First batch returns total_count=15, second batch is missing total_count
-        batch_count = 0
-
-        async def mock_search(*args, **kwargs):
-            nonlocal batch_count
-            batch_count += 1
-
-            if batch_count == 1:
-                # First batch: has total_count=15
-                return {
-                    "modules": [
-                        {
-                            "id": "terraform-ibm-modules/vpc-vsi/ibm",
-                            "namespace": "terraform-ibm-modules",
-                            "name": "vpc-vsi",
-                            "provider": "ibm",
-                            "version": "2.0.0",
-                            "description": "VPC VSI module",
-                            "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc-vsi",
-                            "downloads": 3000,
-                            "verified": True,
-                            "published_at": "2025-09-01T00:00:00.000Z",
-                        },
-                    ],
-                    "meta": {
-                        "limit": 10,
-                        "offset": 0,
-                        "total_count": 15,  # Total modules matching "vsi" query
-                    },
-                }
-            else:
-                # Second batch: missing total_count (simulates API inconsistency)
-                # This causes the bug - total_count gets reset to 0
-                return {
-                    "modules": [
-                        {
-                            "id": "terraform-ibm-modules/vsi/ibm",
-                            "namespace": "terraform-ibm-modules",
-                            "name": "vsi",
-                            "provider": "ibm",
-                            "version": "1.0.0",
-                            "description": "VSI module",
-                            "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vsi",
-                            "downloads": 1000,
-                            "verified": True,
-                            "published_at": "2025-09-01T00:00:00.000Z",
-                        },
-                        {
-                            "id": "terraform-ibm-modules/landing-zone-vsi/ibm",
-                            "namespace": "terraform-ibm-modules",
-                            "name": "landing-zone-vsi",
-                            "provider": "ibm",
-                            "version": "5.10.0",
-                            "description": "Landing Zone VSI module",
-                            "source": "https://github.com/terraform-ibm-modules/terraform-ibm-landing-zone-vsi",
-                            "downloads": 2000,
-                            "verified": True,
-                            "published_at": "2025-09-01T00:00:00.000Z",
-                        },
-                    ],
-                    "meta": {
-                        "limit": 10,
-                        "offset": 50,
-                        # total_count is missing here - causes bug!
-                    },
-                }
-
-        mock_terraform_client.search_modules = mock_search
-
+        # Registry has 15 matching modules; the first page reports the total,
+        # the second omits it (simulates API inconsistency)
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod("vpc-vsi", 3000, version="2.0.0", verified=True),
+                total_count=15,
+            ),
+            _make_response(
+                _mod("vsi", 1000, verified=True),
+                _mod("landing-zone-vsi", 2000, version="5.10.0", verified=True),
+                offset=50,
+            ),
+        ]
         request = ModuleSearchRequest(query="vsi", limit=3)
 
-        # Patch the context managers
-        with (
-            patch(
-                "tim_mcp.tools.search.TerraformClient",
-                return_value=mock_terraform_client,
-            ),
-            patch("tim_mcp.tools.search.GitHubClient", return_value=mock_github_client),
-        ):
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
-        # The bug: total_found is set to 0 instead of 15
-        # This assertion should FAIL initially, demonstrating the bug
+        # The bug: total_found was set to 0 instead of 15
         assert result.total_found == 15, (
             f"Expected total_found=15 (total from registry), but got {result.total_found}"
         )
@@ -1362,73 +1162,54 @@ class TestTotalFoundBug:
         assert len(result.modules) == 3
         assert result.query == "vsi"
 
+    async def test_total_found_taken_from_first_page_reporting_it(
+        self, config, fake_terraform_client
+    ):
+        """Test that a total_count missing from the first page is picked up later."""
+        fake_terraform_client.responses = [
+            _make_response(_mod("vsi", 1000)),
+            _make_response(_mod("vpc-vsi", 3000), offset=50, total_count=9),
+            _make_response(_mod("landing-zone-vsi", 2000), offset=100, total_count=0),
+        ]
+        request = ModuleSearchRequest(query="vsi", limit=3)
+
+        result = await search_modules_impl(request, config)
+
+        assert result.total_found == 9
+        assert len(result.modules) == 3
+
 
 class TestPrereleaseVersionFiltering:
     """Test that pre-release versions are filtered and replaced with stable versions."""
 
-    @pytest.fixture
-    def config(self):
-        """Create a test configuration."""
-        return Config()
-
-    async def test_prerelease_version_replaced_with_stable(self, config):
+    async def test_prerelease_version_replaced_with_stable(
+        self, config, fake_terraform_client
+    ):
         """Test that modules with pre-release versions are replaced with stable versions."""
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results with pre-release version
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/db2-cloud/ibm",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "db2-cloud",
-                        "provider": "ibm",
-                        "version": "2.0.1-beta",  # Pre-release version
-                        "description": "IBM Cloud DB2 module",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-db2-cloud",
-                        "downloads": 1000,
-                        "verified": True,
-                        "published_at": "2025-09-01T00:00:00.000Z",
-                    }
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 1},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
-        ]
-
-        # Mock get_module_versions to return stable versions
-        mock_terraform_client.get_module_versions.return_value = [
-            "2.0.0",
-            "1.9.0",
-            "1.8.5",
+        # Search results list a pre-release version
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod(
+                    "db2-cloud",
+                    1000,
+                    version="2.0.1-beta",
+                    description="IBM Cloud DB2 module",
+                    verified=True,
+                ),
+                total_count=1,
+            ),
+            _make_response(offset=50, total_count=1),
         ]
-
-        # Mock get_module_details to return description for latest version
-        async def mock_get_details(namespace, name, provider, version):
-            return {
-                "description": "IBM Cloud DB2 module",
-                "version": version,
-            }
-
-        mock_terraform_client.get_module_details = AsyncMock(
-            side_effect=mock_get_details
-        )
+        # The registry reports stable versions only
+        fake_terraform_client.versions["db2-cloud"] = ["2.0.0", "1.9.0", "1.8.5"]
+        fake_terraform_client.details[("db2-cloud", "2.0.0")] = {
+            "description": "IBM Cloud DB2 module",
+            "version": "2.0.0",
+        }
 
         request = ModuleSearchRequest(query="db2")
 
-        # Patch the context managers
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify the pre-release version was replaced with stable version
         assert len(result.modules) == 1
@@ -1438,54 +1219,28 @@ class TestPrereleaseVersionFiltering:
         )
         assert module.name == "db2-cloud"
 
-        # Verify get_module_versions was called to fetch stable versions
-        mock_terraform_client.get_module_versions.assert_called_once_with(
-            "terraform-ibm-modules", "db2-cloud", "ibm"
-        )
+        # Verify the stable versions were fetched
+        assert fake_terraform_client.version_lookups == [
+            ("terraform-ibm-modules", "db2-cloud", "ibm")
+        ]
 
-    async def test_prerelease_module_skipped_when_no_stable_versions(self, config):
+    async def test_prerelease_module_skipped_when_no_stable_versions(
+        self, config, fake_terraform_client
+    ):
         """Test that modules with only pre-release versions are skipped."""
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results with pre-release version
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/db2-cloud/ibm",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "db2-cloud",
-                        "provider": "ibm",
-                        "version": "1.0.0-alpha",  # Pre-release version
-                        "description": "IBM Cloud DB2 module",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-db2-cloud",
-                        "downloads": 1000,
-                        "verified": True,
-                        "published_at": "2025-09-01T00:00:00.000Z",
-                    }
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 1},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod("db2-cloud", 1000, version="1.0.0-alpha", verified=True),
+                total_count=1,
+            ),
+            _make_response(offset=50, total_count=1),
         ]
-
-        # Mock get_module_versions to return no stable versions
-        mock_terraform_client.get_module_versions.return_value = []
+        # No stable versions available
+        fake_terraform_client.versions["db2-cloud"] = []
 
         request = ModuleSearchRequest(query="db2")
 
-        # Patch the context managers
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify the module was skipped
         assert len(result.modules) == 0, (
@@ -1494,65 +1249,27 @@ class TestPrereleaseVersionFiltering:
         # total_found reflects the API's count, not filtered results
         assert result.total_found == 1
 
-    async def test_stable_version_updated_if_newer_available(self, config):
+    async def test_stable_version_updated_if_newer_available(
+        self, config, fake_terraform_client
+    ):
         """Test that stable versions are updated to latest if search returns outdated version."""
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results with older stable version
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/vpc/ibm",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "vpc",
-                        "provider": "ibm",
-                        "version": "5.1.0",  # Old stable version from search API
-                        "description": "Old IBM Cloud VPC module description",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                        "downloads": 50000,
-                        "verified": True,
-                        "published_at": "2025-09-01T00:00:00.000Z",
-                    }
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 1},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
+        # Search results list an older stable version
+        fake_terraform_client.responses = [
+            _make_response(
+                _vpc_module() | {"description": "Old IBM Cloud VPC module description"},
+                total_count=1,
+            ),
+            _make_response(offset=50, total_count=1),
         ]
-
-        # Mock get_module_versions to return newer version available
-        mock_terraform_client.get_module_versions.return_value = ["5.2.0", "5.1.0"]
-
-        # Mock get_module_details for latest version
-        async def mock_get_details(namespace, name, provider, version):
-            if version == "5.2.0":
-                return {
-                    "description": "Latest IBM Cloud VPC module",
-                    "version": "5.2.0",
-                }
-            return {
-                "description": "Old IBM Cloud VPC module description",
-                "version": version,
-            }
-
-        mock_terraform_client.get_module_details = AsyncMock(
-            side_effect=mock_get_details
-        )
+        fake_terraform_client.versions["vpc"] = ["5.2.0", "5.1.0"]
+        fake_terraform_client.details[("vpc", "5.2.0")] = {
+            "description": "Latest IBM Cloud VPC module",
+            "version": "5.2.0",
+        }
 
         request = ModuleSearchRequest(query="vpc")
 
-        # Patch the context managers
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify the version was updated to latest
         assert len(result.modules) == 1
@@ -1562,86 +1279,30 @@ class TestPrereleaseVersionFiltering:
         )
         assert module.description == "Latest IBM Cloud VPC module"
 
-        # Verify get_module_versions was called (we always fetch latest now)
-        mock_terraform_client.get_module_versions.assert_called_once_with(
-            "terraform-ibm-modules", "vpc", "ibm"
-        )
+        # Verify the versions were fetched (we always fetch latest now)
+        assert fake_terraform_client.version_lookups == [
+            ("terraform-ibm-modules", "vpc", "ibm")
+        ]
 
-    async def test_multiple_modules_always_get_latest_versions(self, config):
+    async def test_multiple_modules_always_get_latest_versions(
+        self, config, fake_terraform_client
+    ):
         """Test search with multiple modules - all get updated to latest versions."""
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results with mixed versions
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/vpc/ibm",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "vpc",
-                        "provider": "ibm",
-                        "version": "5.1.0",  # Older stable
-                        "description": "IBM Cloud VPC module",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-vpc",
-                        "downloads": 50000,
-                        "verified": True,
-                        "published_at": "2025-09-01T00:00:00.000Z",
-                    },
-                    {
-                        "id": "terraform-ibm-modules/db2-cloud/ibm",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "db2-cloud",
-                        "provider": "ibm",
-                        "version": "2.0.1-beta",  # Pre-release
-                        "description": "IBM Cloud DB2 module",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-db2-cloud",
-                        "downloads": 1000,
-                        "verified": True,
-                        "published_at": "2025-09-01T00:00:00.000Z",
-                    },
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 2},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 2}},
+        # Search results mix an older stable and a pre-release version
+        fake_terraform_client.responses = [
+            _make_response(
+                _vpc_module() | {"downloads": 50000},
+                _mod("db2-cloud", 1000, version="2.0.1-beta", verified=True),
+                total_count=2,
+            ),
+            _make_response(offset=50, total_count=2),
         ]
-
-        # Mock get_module_versions - called for both modules now
-        def mock_get_versions(namespace, name, provider):
-            if name == "vpc":
-                return ["5.2.0", "5.1.0"]  # Newer version available
-            elif name == "db2-cloud":
-                return ["2.0.0", "1.9.0"]  # Stable versions
-            return []
-
-        mock_terraform_client.get_module_versions = AsyncMock(
-            side_effect=mock_get_versions
-        )
-
-        # Mock get_module_details
-        async def mock_get_details(namespace, name, provider, version):
-            return {
-                "description": f"{name} v{version}",
-                "version": version,
-            }
-
-        mock_terraform_client.get_module_details = AsyncMock(
-            side_effect=mock_get_details
-        )
+        fake_terraform_client.versions["vpc"] = ["5.2.0", "5.1.0"]
+        fake_terraform_client.versions["db2-cloud"] = ["2.0.0", "1.9.0"]
 
         request = ModuleSearchRequest(query="ibm")
 
-        # Patch the context managers
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify both modules are in results
         assert len(result.modules) == 2
@@ -1658,95 +1319,54 @@ class TestPrereleaseVersionFiltering:
             f"Expected DB2 v2.0.0, got {db2_module.version}"
         )
 
-        # Verify get_module_versions was called for BOTH modules (new behavior)
-        assert mock_terraform_client.get_module_versions.call_count == 2
-        mock_terraform_client.get_module_versions.assert_any_call(
-            "terraform-ibm-modules", "vpc", "ibm"
-        )
-        mock_terraform_client.get_module_versions.assert_any_call(
-            "terraform-ibm-modules", "db2-cloud", "ibm"
-        )
+        # Verify versions were fetched for BOTH modules
+        assert fake_terraform_client.version_lookups == [
+            ("terraform-ibm-modules", "vpc", "ibm"),
+            ("terraform-ibm-modules", "db2-cloud", "ibm"),
+        ]
 
 
 class TestLatestVersionFetching:
     """Test for issue #47 - Always fetch latest version to get correct description."""
 
-    @pytest.fixture
-    def config(self):
-        """Create a test configuration."""
-        return Config()
-
-    @pytest.mark.asyncio
     async def test_outdated_version_replaced_with_latest_and_correct_description(
-        self, config
+        self, config, fake_terraform_client
     ):
         """
         Test that search API returning outdated versions is corrected to latest version.
         This fixes issue #47 where namespace module showed wrong description from v1.0.0
         instead of correct description from v1.0.3.
         """
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results - registry returns old version 1.0.0 with wrong description
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/namespace/ibm/1.0.0",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "namespace",
-                        "provider": "ibm",
-                        "version": "1.0.0",  # Old version from search API
-                        "description": "Implements a ICD Postgresql instance with tags, users, memory allocation, disk allocation, cpu allocation and context based restrictions",  # Wrong description!
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-namespace",
-                        "downloads": 72588,
-                        "verified": False,
-                        "published_at": "2024-02-08T14:45:13.252062Z",
-                    }
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 1},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
+        # Registry search returns old version 1.0.0 with the wrong description
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod(
+                    "namespace",
+                    72588,
+                    id="terraform-ibm-modules/namespace/ibm/1.0.0",
+                    description="Implements a ICD Postgresql instance with tags, users, memory allocation, disk allocation, cpu allocation and context based restrictions",  # Wrong description!
+                    source="https://github.com/terraform-ibm-modules/terraform-ibm-namespace",
+                    published_at="2024-02-08T14:45:13.252062Z",
+                ),
+                total_count=1,
+            ),
+            _make_response(offset=50, total_count=1),
         ]
-
-        # Mock get_module_versions to return all versions (sorted descending)
-        mock_terraform_client.get_module_versions.return_value = [
+        # All versions, sorted descending
+        fake_terraform_client.versions["namespace"] = [
             "1.0.3",  # Latest
             "1.0.2",
             "1.0.1",
             "1.0.0",  # Oldest
         ]
-
-        # Mock get_module_details to return correct description for latest version
-        async def mock_get_details(namespace, name, provider, version):
-            if version == "1.0.3":
-                return {
-                    "description": "Configures a Kubernetes namespace or Openshift project.",  # Correct description
-                    "version": "1.0.3",
-                }
-            else:
-                return {
-                    "description": "Implements a ICD Postgresql instance with tags, users, memory allocation, disk allocation, cpu allocation and context based restrictions",
-                    "version": version,
-                }
-
-        mock_terraform_client.get_module_details = AsyncMock(
-            side_effect=mock_get_details
-        )
+        fake_terraform_client.details[("namespace", "1.0.3")] = {
+            "description": "Configures a Kubernetes namespace or Openshift project.",  # Correct description
+            "version": "1.0.3",
+        }
 
         request = ModuleSearchRequest(query="postgresql", limit=5)
 
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True  # Repository validation passes
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify we got the module
         assert len(result.modules) == 1
@@ -1763,82 +1383,49 @@ class TestLatestVersionFetching:
             f"Expected correct description from v1.0.3, got: {module.description}"
         )
 
-        # Verify get_module_versions was called
-        mock_terraform_client.get_module_versions.assert_called_once_with(
-            "terraform-ibm-modules", "namespace", "ibm"
-        )
-
-        # Verify get_module_details was called for latest version
-        mock_terraform_client.get_module_details.assert_called_once_with(
-            "terraform-ibm-modules", "namespace", "ibm", "1.0.3"
-        )
+        # Verify the versions and the latest version's details were fetched
+        assert fake_terraform_client.version_lookups == [
+            ("terraform-ibm-modules", "namespace", "ibm")
+        ]
+        assert fake_terraform_client.details_lookups == [
+            ("terraform-ibm-modules", "namespace", "ibm", "1.0.3")
+        ]
 
-    @pytest.mark.asyncio
-    async def test_always_fetch_latest_version_even_for_stable_versions(self, config):
+    async def test_always_fetch_latest_version_even_for_stable_versions(
+        self, config, fake_terraform_client
+    ):
         """
         Test that we always fetch the latest version, not just for pre-releases.
         The search API may return any version, not necessarily the latest.
         """
-        mock_terraform_client = AsyncMock()
-        mock_github_client = create_mock_github_client()
-
-        # Mock search results - returns stable but outdated version
-        mock_terraform_client.search_modules.side_effect = [
-            {
-                "modules": [
-                    {
-                        "id": "terraform-ibm-modules/icd-postgresql/ibm/1.0.0",
-                        "namespace": "terraform-ibm-modules",
-                        "name": "icd-postgresql",
-                        "provider": "ibm",
-                        "version": "1.0.0",  # Old stable version
-                        "description": "Old description",
-                        "source": "https://github.com/terraform-ibm-modules/terraform-ibm-icd-postgresql",
-                        "downloads": 50000,
-                        "verified": True,
-                        "published_at": "2023-01-01T00:00:00.000Z",
-                    }
-                ],
-                "meta": {"limit": 50, "offset": 0, "total_count": 1},
-            },
-            {"modules": [], "meta": {"limit": 50, "offset": 50, "total_count": 1}},
+        # Search returns a stable but outdated version
+        fake_terraform_client.responses = [
+            _make_response(
+                _mod(
+                    "icd-postgresql",
+                    50000,
+                    id="terraform-ibm-modules/icd-postgresql/ibm/1.0.0",
+                    description="Old description",
+                    verified=True,
+                    published_at="2023-01-01T00:00:00.000Z",
+                ),
+                total_count=1,
+            ),
+            _make_response(offset=50, total_count=1),
         ]
-
-        # Mock get_module_versions - latest is 4.2.29
-        mock_terraform_client.get_module_versions.return_value = [
+        fake_terraform_client.versions["icd-postgresql"] = [
             "4.2.29",  # Latest
             "4.2.28",
             "1.0.0",  # What search returned
         ]
-
-        # Mock get_module_details for latest version
-        async def mock_get_details(namespace, name, provider, version):
-            if version == "4.2.29":
-                return {
-                    "description": "Implements an instance of the IBM Cloud Databases for PostgreSQL service.",
-                    "version": "4.2.29",
-                }
-            return {
-                "description": "Old description",
-                "version": version,
-            }
-
-        mock_terraform_client.get_module_details = AsyncMock(
-            side_effect=mock_get_details
-        )
+        fake_terraform_client.details[("icd-postgresql", "4.2.29")] = {
+            "description": "Implements an instance of the IBM Cloud Databases for PostgreSQL service.",
+            "version": "4.2.29",
+        }
 
         request = ModuleSearchRequest(query="postgresql", limit=5)
 
-        with (
-            patch("tim_mcp.tools.search.TerraformClient") as mock_tf_class,
-            patch("tim_mcp.tools.search.GitHubClient") as mock_gh_class,
-            patch("tim_mcp.tools.search._is_repository_valid") as mock_is_valid,
-        ):
-            mock_tf_class.return_value.__aenter__.return_value = mock_terraform_client
-            mock_gh_class.return_value.__aenter__.return_value = mock_github_client
-            mock_is_valid.return_value = True  # Repository validation passes
-
-            result = await search_modules_impl(request, config)
+        result = await search_modules_impl(request, config)
 
         # Verify version was updated to latest
         assert len(result.modules) == 1
@@ -1852,7 +1439,7 @@ class TestLatestVersionFetching:
         )
 
         # Verify latest version was fetched
-        mock_terraform_client.get_module_versions.assert_called_once()
-        mock_terraform_client.get_module_details.assert_called_once_with(
-            "terraform-ibm-modules", "icd-postgresql", "ibm", "4.2.29"
-        )
+        assert len(fake_terraform_client.version_lookups) == 1
+        assert fake_terraform_client.details_lookups == [
+            ("terraform-ibm-modules", "icd-postgresql", "ibm", "4.2.29")
+        ]
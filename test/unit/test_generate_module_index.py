@@ -8,6 +8,7 @@ import json
 import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -103,10 +104,8 @@ def mock_cache():
 
 @pytest.fixture
 def mock_config():
-    """Create a mock configuration."""
-    mock_config = MagicMock()
-    mock_config.allowed_namespaces = ["terraform-ibm-modules"]
-    return mock_config
+    """Create a stub configuration with just the fields the script reads."""
+    return SimpleNamespace(allowed_namespaces=["terraform-ibm-modules"])
 
 
 @pytest.fixture
@@ -378,7 +377,6 @@ async def _generate_module_index_impl(output_path, tf_client, gh_client):
     return output
 
 
-@pytest.mark.asyncio
 async def test_generate_module_index(
     mock_config, mock_cache, mock_terraform_client, mock_github_client, tmp_path
 ):
@@ -433,7 +431,6 @@ async def test_generate_module_index(
     assert "WatsonX AI resources" in modules[2]["readme_excerpt"]
 
 
-@pytest.mark.asyncio
 async def test_generate_module_index_with_exceptions(
     mock_config, mock_cache, mock_terraform_client, mock_github_client, tmp_path
 ):
@@ -510,7 +507,6 @@ async def test_generate_module_index_with_exceptions(
 class TestSubmoduleDescription:
     """Tests for the fetch_submodule_description function."""
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_basic(self):
         """Test fetching a basic submodule description."""
         mock_gh_client = MagicMock()
@@ -545,7 +541,6 @@ See the examples directory.
         assert "Financial Services Cloud" in result
         assert len(result) <= 1200  # Should respect character limit
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_with_bullet_list(self):
         """Test fetching description that ends with a colon and has a bullet list."""
         mock_gh_client = MagicMock()
@@ -582,7 +577,6 @@ IBM Cloud account required.
         assert "\n" not in result  # Should be normalized to single line
         assert len(result) <= 1200
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_truncation(self):
         """Test that very long descriptions are truncated at word boundaries."""
         mock_gh_client = MagicMock()
@@ -612,7 +606,6 @@ IBM Cloud account required.
         # Should end at a word boundary, not mid-word
         assert not result.endswith(" ")  # No trailing space
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_no_readme(self):
         """Test handling when README doesn't exist."""
         mock_gh_client = MagicMock()
@@ -631,7 +624,6 @@ IBM Cloud account required.
 
         assert result == ""  # Should return empty string on error
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_empty_readme(self):
         """Test handling when README exists but is empty."""
         mock_gh_client = MagicMock()
@@ -649,7 +641,6 @@ IBM Cloud account required.
 
         assert result == ""
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_markdown_links_removed(self):
         """Test that markdown links are removed from descriptions."""
         mock_gh_client = MagicMock()
@@ -679,7 +670,6 @@ See the [documentation](https://github.com/terraform-ibm-modules/terraform-ibm-c
         assert "IBM Cloud" in result
         assert "Key Protect" in result
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_etc_suffix(self):
         """Test that bullet lists get properly extracted and formatted."""
         mock_gh_client = MagicMock()
@@ -717,7 +707,6 @@ This module includes the following:
         # Should limit to first 5 items when there are more
         assert "Feature 5" in result or "Feature 6" in result
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_whitespace_normalization(self):
         """Test that multi-line text is normalized to single line."""
         mock_gh_client = MagicMock()
@@ -748,7 +737,6 @@ normalized to a single line.
         assert "\n" not in result
         assert "multiple lines" in result or "multiplelines" in result.replace(" ", "")
 
-    @pytest.mark.asyncio
     async def test_fetch_submodule_description_skips_html_comments_in_fallback(self):
         """Test that HTML comments are skipped even in second pass fallback."""
         mock_gh_client = MagicMock()
@@ -793,7 +781,6 @@ The Private Path solution solves security, privacy and complexity problems.
 class TestParallelProcessing:
     """Tests for parallel processing functionality."""
 
-    @pytest.mark.asyncio
     async def test_parallel_submodule_fetching(self):
         """Test that submodules are fetched in parallel."""
         import asyncio
@@ -839,7 +826,6 @@ class TestParallelProcessing:
             time_diff = max(call_times) - min(call_times)
             assert time_diff < 0.1, "Calls should start within 0.1s of each other"
 
-    @pytest.mark.asyncio
     async def test_parallel_exception_handling(self):
         """Test that exceptions in parallel processing don't stop other tasks."""
         import asyncio
@@ -853,7 +839,7 @@ class TestParallelProcessing:
             call_count += 1
             if call_count == 2:
                 raise Exception("Simulated API error")
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(0)  # Yield so the other tasks interleave
             return {"decoded_content": "# Test\n\nDescription text."}
 
         mock_gh_client.get_file_content = AsyncMock(side_effect=fail_on_second_call)
@@ -875,7 +861,6 @@ class TestParallelProcessing:
         successful = [r for r in results if isinstance(r, str) and r != ""]
         assert len(successful) == 2
 
-    @pytest.mark.asyncio
     async def test_batched_module_processing(self):
         """Test that modules are processed in batches."""
         # This is more of an integration test concept
@@ -1,18 +1,38 @@
-"""Unit tests for InMemoryCache."""
+"""Unit tests for InMemoryCache and ETagCache."""
 
-import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 
-from tim_mcp.utils.cache import InMemoryCache
+import pytest
+
+from tim_mcp.utils.cache import ETagCache, InMemoryCache
+
+# Keys and values written by the thread-safety test, formatted once
+_KEY_VALUES = [(f"key{i}", f"value{i}") for i in range(100)]
+
+
+class FakeClock:
+    """Manually advanced clock for expiring cache entries without sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 class TestInMemoryCache:
     """Test suite for InMemoryCache class."""
 
-    def test_cache_get_set(self):
-        """Test basic get/set operations."""
-        cache = InMemoryCache(fresh_ttl=10, maxsize=10)
+    @pytest.fixture
+    def cache(self):
+        """Create a small cache for tests that need no particular TTL or size."""
+        return InMemoryCache(fresh_ttl=10, maxsize=10)
 
+    def test_cache_get_set(self, cache):
+        """Test basic get/set operations."""
         # Test set and get
         assert cache.set("key1", "value1") is True
         assert cache.get("key1") == "value1"
@@ -22,28 +42,30 @@ class TestInMemoryCache:
 
     def test_cache_ttl_expiration(self):
         """Test that cache entries expire after TTL (become stale)."""
-        cache = InMemoryCache(fresh_ttl=1, maxsize=10)
+        clock = FakeClock()
+        cache = InMemoryCache(fresh_ttl=1, maxsize=10, timer=clock)
 
         # Set a value
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
-        # Wait for fresh TTL to expire
-        time.sleep(1.1)
+        # Advance past the fresh TTL
+        clock.advance(1.1)
 
         # Fresh get should return None (entry is stale)
         assert cache.get("key1") is None
 
     def test_cache_stale_fallback(self):
         """Test that allow_stale returns expired entries."""
-        cache = InMemoryCache(fresh_ttl=1, evict_ttl=10, maxsize=10)
+        clock = FakeClock()
+        cache = InMemoryCache(fresh_ttl=1, evict_ttl=10, maxsize=10, timer=clock)
 
         # Set a value
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
-        # Wait for fresh TTL to expire
-        time.sleep(1.1)
+        # Advance past the fresh TTL
+        clock.advance(1.1)
 
         # Normal get should return None
         assert cache.get("key1") is None
@@ -51,6 +73,19 @@ class TestInMemoryCache:
         # Stale get should return the value
         assert cache.get("key1", allow_stale=True) == "value1"
 
+    def test_cache_stale_eviction(self):
+        """Test that stale entries are evicted once evict_ttl has passed."""
+        clock = FakeClock()
+        cache = InMemoryCache(fresh_ttl=1, evict_ttl=10, maxsize=10, timer=clock)
+
+        cache.set("key1", "value1")
+
+        # Advance past the evict TTL
+        clock.advance(11)
+
+        # Entry is gone even when stale entries are allowed
+        assert cache.get("key1", allow_stale=True) is None
+
     def test_cache_lru_eviction(self):
         """Test that LRU eviction works when maxsize exceeded."""
         cache = InMemoryCache(fresh_ttl=100, maxsize=2)
@@ -70,10 +105,8 @@ class TestInMemoryCache:
         assert cache.get("key2") == "value2"
         assert cache.get("key3") == "value3"
 
-    def test_cache_invalidate(self):
+    def test_cache_invalidate(self, cache):
         """Test cache invalidation."""
-        cache = InMemoryCache(fresh_ttl=10, maxsize=10)
-
         # Set a value
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
@@ -88,10 +121,8 @@ class TestInMemoryCache:
         # Invalidating non-existent key should succeed
         assert cache.invalidate("missing_key") is True
 
-    def test_cache_clear(self):
+    def test_cache_clear(self, cache):
         """Test clearing all cache entries."""
-        cache = InMemoryCache(fresh_ttl=10, maxsize=10)
-
         # Add multiple entries
         cache.set("key1", "value1")
         cache.set("key2", "value2")
@@ -112,46 +143,31 @@ class TestInMemoryCache:
     def test_cache_thread_safety(self):
         """Test that cache is thread-safe."""
         cache = InMemoryCache(fresh_ttl=10, maxsize=100)
-        errors = []
 
         def write_values(start, end):
             """Write values to cache."""
-            try:
-                for i in range(start, end):
-                    cache.set(f"key{i}", f"value{i}")
-            except Exception as e:
-                errors.append(e)
+            for key, value in _KEY_VALUES[start:end]:
+                cache.set(key, value)
 
         def read_values(start, end):
             """Read values from cache."""
-            try:
-                for i in range(start, end):
-                    cache.get(f"key{i}")
-            except Exception as e:
-                errors.append(e)
-
-        # Create multiple threads
-        threads = []
-        threads.append(threading.Thread(target=write_values, args=(0, 50)))
-        threads.append(threading.Thread(target=write_values, args=(50, 100)))
-        threads.append(threading.Thread(target=read_values, args=(0, 50)))
-        threads.append(threading.Thread(target=read_values, args=(50, 100)))
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-
-        # No errors should have occurred
-        assert len(errors) == 0
-
-    def test_cache_complex_values(self):
+            for key, _ in _KEY_VALUES[start:end]:
+                cache.get(key)
+
+        # Run writers and readers over overlapping key ranges
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(func, i * 25, (i + 1) * 25)
+                for func in (write_values, read_values)
+                for i in range(4)
+            ]
+
+            # result() re-raises any error from a worker thread
+            for future in futures:
+                future.result()
+
+    def test_cache_complex_values(self, cache):
         """Test caching complex data types."""
-        cache = InMemoryCache(fresh_ttl=10, maxsize=10)
-
         # Test dict
         cache.set("dict_key", {"name": "test", "value": 123})
         result = cache.get("dict_key")
@@ -170,7 +186,8 @@ class TestInMemoryCache:
 
     def test_cache_update_existing_key(self):
         """Test updating an existing cache entry."""
-        cache = InMemoryCache(fresh_ttl=1, evict_ttl=10, maxsize=10)
+        clock = FakeClock()
+        cache = InMemoryCache(fresh_ttl=1, evict_ttl=10, maxsize=10, timer=clock)
 
         # Set initial value
         cache.set("key1", "value1")
@@ -181,7 +198,7 @@ class TestInMemoryCache:
         assert cache.get("key1") == "value2"
 
         # Should also update the value in stale cache
-        time.sleep(1.1)
+        clock.advance(1.1)
         assert cache.get("key1", allow_stale=True) == "value2"
 
     def test_cache_equal_ttls_allowed(self):
@@ -196,8 +213,6 @@ class TestInMemoryCache:
 
     def test_cache_evict_ttl_less_than_fresh_ttl_raises_error(self):
         """Test that evict_ttl < fresh_ttl raises ValueError."""
-        import pytest
-
         with pytest.raises(ValueError) as exc_info:
             InMemoryCache(fresh_ttl=3600, evict_ttl=1800)
 
@@ -215,3 +230,27 @@ class TestInMemoryCache:
         cache.set("key1", "value1")
         # With TTL=0, entry may or may not be retrievable depending on timing
         # Just verify no errors occur during initialization and basic operations
+
+
+class TestETagCache:
+    """Test suite for ETagCache class."""
+
+    def test_bodies_bounded_by_size(self):
+        """Test that least recently used bodies are dropped to stay within budget."""
+        cache = ETagCache(max_bytes=10)
+        cache.set("a", '"1"', b"12345")
+        cache.set("b", '"2"', b"12345")
+        cache.get("a")
+        cache.set("c", '"3"', b"123")
+
+        assert cache.get("a") == ('"1"', b"12345")
+        assert cache.get("b") is None
+        assert cache.get("c") == ('"3"', b"123")
+
+    def test_oversized_body_not_stored(self):
+        """Test that a body larger than the whole budget replaces nothing."""
+        cache = ETagCache(max_bytes=10)
+        cache.set("a", '"1"', b"123")
+        cache.set("a", '"2"', b"12345678901")
+
+        assert cache.get("a") is None
@@ -5,6 +5,7 @@ Provides common patterns for rate limiting, caching, retry logic, and error hand
 to reduce code duplication across GitHub and Terraform clients.
 """
 
+import json
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -18,6 +19,7 @@ from tenacity import (
 )
 
 from ..exceptions import RateLimitError
+from ..utils.cache import ETagCache
 from ..utils.rate_limiter import with_rate_limit
 
 
@@ -32,6 +34,57 @@ def check_rate_limit_response(response: httpx.Response, api_name: str) -> None:
         )
 
 
+async def conditional_get(
+    client: httpx.AsyncClient,
+    etag_cache: ETagCache,
+    url: str,
+    api_name: str,
+    params: dict[str, Any] | None = None,
+) -> tuple[httpx.Response, Any]:
+    """
+    GET a JSON resource, revalidating against a previously stored ETag.
+
+    When an ETag is known for the URL, ``If-None-Match`` is sent and a
+    ``304 Not Modified`` answer is served from the stored raw body instead of
+    downloading it again. Every call decodes its own body, so callers may
+    modify what they get back.
+
+    Args:
+        client: HTTP client to send the request with
+        etag_cache: Store of ETags and raw bodies, keyed by absolute URL
+        url: Request path relative to the client's base URL
+        api_name: API name used in rate limit errors
+        params: Optional query parameters
+
+    Returns:
+        Tuple of the HTTP response and its parsed JSON body
+
+    Raises:
+        RateLimitError: If the API reports rate limiting
+        httpx.HTTPStatusError: If the response is an error
+    """
+    cache_key = str(client.build_request("GET", url, params=params).url)
+    cached = etag_cache.get(cache_key)
+
+    kwargs: dict[str, Any] = {}
+    if params is not None:
+        kwargs["params"] = params
+    if cached:
+        kwargs["headers"] = {"If-None-Match": cached[0]}
+
+    response = await client.get(url, **kwargs)
+    check_rate_limit_response(response, api_name)
+    if cached and response.status_code == 304:
+        return response, json.loads(cached[1])
+    response.raise_for_status()
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        etag_cache.set(cache_key, etag, response.content)
+    return response, data
+
+
 def make_cache_key(prefix: str) -> Callable[..., str]:
     """
     Create a cache key generator function for a given prefix.
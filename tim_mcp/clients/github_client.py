@@ -7,6 +7,7 @@ Enterprise.
 """
 
 import base64
+import re
 import time
 from typing import Any
 
@@ -15,9 +16,64 @@ import httpx
 from ..config import Config, get_github_auth_headers
 from ..exceptions import GitHubError, ModuleNotFoundError
 from ..logging import get_logger, log_api_request
-from ..utils.cache import InMemoryCache
+from ..utils.cache import ETagCache, InMemoryCache
 from ..utils.rate_limiter import RateLimiter
-from .base import api_method, check_rate_limit_response
+from .base import (
+    api_method,
+    check_rate_limit_response,
+    conditional_get,
+    make_cache_key,
+)
+
+# Repository fields requested per alias in batched GraphQL lookups
+_REPO_INFO_FIELDS = (
+    "isArchived diskUsage defaultBranchRef { name } "
+    "repositoryTopics(first: 20) { nodes { topic { name } } }"
+)
+
+# Batched lookups only fetch the fields above, so they are cached apart from
+# the full REST payloads that get_repository_info caches under gh_repo_info
+_repo_validation_cache_key = make_cache_key("gh_repo_validation")
+
+# Owner and repository of a github.com source URL, with optional git:: prefix
+# and .git suffix; anything after the repository segment is ignored
+_GITHUB_URL_RE = re.compile(
+    r"^(?:git::)?[A-Za-z][A-Za-z0-9+.-]*://(?:www\.)?github\.com/+"
+    r"([^/?#]+)/+([^/?#]+?)(?:\.git)?/*(?:[/?#]|$)"
+)
+
+
+def _repo_info_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL repository node into the REST repository fields we use."""
+    topics = (node.get("repositoryTopics") or {}).get("nodes") or []
+    return {
+        "archived": node.get("isArchived", False),
+        "topics": [t["topic"]["name"] for t in topics],
+        "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+        "size": node.get("diskUsage"),
+    }
+
+
+def create_http_client(
+    config: Config, limits: httpx.Limits | None = None
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for the GitHub API.
+
+    Args:
+        config: Configuration instance
+        limits: Connection pool limits, or None for the per-client defaults
+            (pass larger limits for clients shared across tool calls)
+
+    Returns:
+        The HTTP client
+    """
+    return httpx.AsyncClient(
+        base_url=str(config.github_base_url),
+        timeout=config.request_timeout,
+        headers=get_github_auth_headers(config),
+        limits=limits or httpx.Limits(max_connections=10, max_keepalive_connections=5),
+    )
 
 
 class GitHubClient:
@@ -28,6 +84,8 @@ class GitHubClient:
         config: Config,
         cache: InMemoryCache | None = None,
         rate_limiter: RateLimiter | None = None,
+        etag_cache: ETagCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize the GitHub client.
@@ -36,6 +94,9 @@ class GitHubClient:
             config: Configuration instance
             cache: Cache instance, or None to create a new one
             rate_limiter: Rate limiter instance for request throttling
+            etag_cache: ETag store for conditional requests, or None to create a new one
+            http_client: Shared HTTP client to send requests through, or None to
+                create one owned (and closed) by this client
         """
         self.config = config
         self.cache = cache or InMemoryCache(
@@ -44,21 +105,18 @@ class GitHubClient:
             maxsize=config.cache_maxsize,
         )
         self.rate_limiter = rate_limiter
+        self.etags = etag_cache or ETagCache()
         self.logger = get_logger(__name__, client="github")
 
-        headers = get_github_auth_headers(config)
-        self.client = httpx.AsyncClient(
-            base_url=str(config.github_base_url),
-            timeout=config.request_timeout,
-            headers=headers,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-        )
+        self._owns_client = http_client is None
+        self.client = http_client or create_http_client(config)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     def _parse_module_id(self, module_id: str) -> tuple[str, str, str]:
         """Parse module ID into namespace, name, provider components."""
@@ -80,42 +138,25 @@ class GitHubClient:
 
     def parse_github_url(self, source_url: str) -> tuple[str, str] | None:
         """Parse GitHub URL to extract owner and repository name."""
-        from urllib.parse import urlparse
-
-        if not source_url:
+        # Cheap containment check rejects non-GitHub sources before the regex
+        if not source_url or "github.com" not in source_url:
             return None
 
-        clean_url = source_url[5:] if source_url.startswith("git::") else source_url
-
-        try:
-            parsed = urlparse(clean_url)
-            if parsed.netloc not in ["github.com", "www.github.com"]:
-                return None
-
-            path = parsed.path.strip("/")
-            if path.endswith(".git"):
-                path = path[:-4]
-
-            path_parts = path.split("/")
-            if len(path_parts) < 2:
-                return None
-
-            return path_parts[0], path_parts[1]
-        except Exception as e:
-            self.logger.warning(
-                "Failed to parse GitHub URL", url=source_url, error=str(e)
-            )
+        match = _GITHUB_URL_RE.match(source_url)
+        if match is None:
             return None
 
+        return match.group(1), match.group(2)
+
     @api_method(cache_key_prefix="gh_repo_info")
     async def get_repository_info(self, owner: str, repo: str) -> dict[str, Any]:
         """Get repository information."""
         start_time = time.time()
         try:
-            response = await self.client.get(f"/repos/{owner}/{repo}")
+            response, data = await conditional_get(
+                self.client, self.etags, f"/repos/{owner}/{repo}", "GitHub"
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "GitHub")
-            response.raise_for_status()
 
             log_api_request(
                 self.logger,
@@ -125,7 +166,7 @@ class GitHubClient:
                 duration_ms,
                 repo=f"{owner}/{repo}",
             )
-            return response.json()
+            return data
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -140,6 +181,131 @@ class GitHubClient:
         except httpx.RequestError as e:
             raise GitHubError(f"Request error getting repository info: {e}") from e
 
+    async def batch_get_repository_info(
+        self, repos: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """
+        Get repository information for several repositories at once.
+
+        Repositories not already cached are fetched with a single GraphQL
+        query. Those results only hold the archived, topics, default_branch
+        and size fields, and are cached separately from get_repository_info.
+        Without a token the GraphQL API is unavailable, so each repository is
+        fetched through the REST API with get_repository_info instead.
+
+        Args:
+            repos: (owner, repo) pairs to look up
+
+        Returns:
+            Mapping of (owner, repo) to repository information. Repositories
+            that do not exist are omitted.
+
+        Raises:
+            GitHubError: If the GraphQL request fails or reports errors other
+                than missing repositories
+            RateLimitError: If the GitHub API reports rate limiting
+        """
+        results: dict[tuple[str, str], dict[str, Any]] = {}
+        missing: list[tuple[str, str]] = []
+        for owner, repo in dict.fromkeys(repos):
+            cached = self.cache.get(_repo_validation_cache_key(self, owner, repo))
+            if cached is not None:
+                results[(owner, repo)] = cached
+            else:
+                missing.append((owner, repo))
+
+        if not missing:
+            return results
+
+        if not self.config.github_token:
+            for owner, repo in missing:
+                try:
+                    results[(owner, repo)] = await self.get_repository_info(owner, repo)
+                except ModuleNotFoundError:
+                    continue
+            return results
+
+        fetched = await self._query_repositories(missing)
+        for (owner, repo), info in fetched.items():
+            self.cache.set(_repo_validation_cache_key(self, owner, repo), info)
+            results[(owner, repo)] = info
+        return results
+
+    def _graphql_url(self) -> str:
+        """Get the GraphQL endpoint for the configured GitHub API."""
+        base_url = str(self.config.github_base_url).rstrip("/")
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL under /api/graphql
+        if base_url.endswith("/api/v3"):
+            return f"{base_url[: -len('/v3')]}/graphql"
+        return f"{base_url}/graphql"
+
+    @api_method()
+    async def _query_repositories(
+        self, repos: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Fetch repository information for all repos in one GraphQL query."""
+        start_time = time.time()
+        variables: dict[str, str] = {}
+        params: list[str] = []
+        fields: list[str] = []
+        for i, (owner, repo) in enumerate(repos):
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(
+                f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_REPO_INFO_FIELDS} }}"
+            )
+        query = f"query({', '.join(params)}) {{ {' '.join(fields)} }}"
+
+        try:
+            response = await self.client.post(
+                self._graphql_url(), json={"query": query, "variables": variables}
+            )
+            duration_ms = (time.time() - start_time) * 1000
+            check_rate_limit_response(response, "GitHub")
+            response.raise_for_status()
+
+            payload = response.json()
+            data = payload.get("data")
+            errors = payload.get("errors") or []
+            # Missing repositories come back as NOT_FOUND errors next to the
+            # data of the others; anything else (rate limiting, missing token
+            # scopes) means the answer cannot be trusted
+            if errors and (
+                not data or any(e.get("type") != "NOT_FOUND" for e in errors)
+            ):
+                raise GitHubError(
+                    "GraphQL error getting repository info: "
+                    + "; ".join(str(e.get("message", e)) for e in errors),
+                    status_code=response.status_code,
+                    response_body=response.text,
+                )
+            data = data or {}
+            log_api_request(
+                self.logger,
+                "POST",
+                str(response.url),
+                response.status_code,
+                duration_ms,
+                repo_count=len(repos),
+            )
+
+            results = {}
+            for i, key in enumerate(repos):
+                node = data.get(f"r{i}")
+                if node is not None:
+                    results[key] = _repo_info_from_graphql(node)
+            return results
+
+        except httpx.HTTPStatusError as e:
+            raise GitHubError(
+                f"HTTP error getting repository info: {e}",
+                status_code=e.response.status_code,
+                response_body=e.response.text,
+            ) from e
+        except httpx.RequestError as e:
+            raise GitHubError(f"Request error getting repository info: {e}") from e
+
     @api_method(cache_key_prefix="gh_dir_contents")
     async def get_directory_contents(
         self, owner: str, repo: str, path: str = "", ref: str = "HEAD"
@@ -153,12 +319,10 @@ class GitHubClient:
                 if path
                 else f"/repos/{owner}/{repo}/contents"
             )
-            response = await self.client.get(url, params=params)
+            response, data = await conditional_get(
+                self.client, self.etags, url, "GitHub", params=params
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "GitHub")
-            response.raise_for_status()
-
-            data = response.json()
             if not isinstance(data, list):
                 data = [data]
 
@@ -193,14 +357,14 @@ class GitHubClient:
         start_time = time.time()
         try:
             params = {"ref": ref} if ref != "HEAD" else {}
-            response = await self.client.get(
-                f"/repos/{owner}/{repo}/contents/{path}", params=params
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                f"/repos/{owner}/{repo}/contents/{path}",
+                "GitHub",
+                params=params,
             )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "GitHub")
-            response.raise_for_status()
-
-            data = response.json()
             if data.get("encoding") == "base64" and data.get("content"):
                 try:
                     data["decoded_content"] = base64.b64decode(data["content"]).decode(
@@ -242,14 +406,15 @@ class GitHubClient:
         start_time = time.time()
         try:
             params = {"recursive": "1"} if recursive else {}
-            response = await self.client.get(
-                f"/repos/{owner}/{repo}/git/trees/{ref}", params=params
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                f"/repos/{owner}/{repo}/git/trees/{ref}",
+                "GitHub",
+                params=params,
             )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "GitHub")
-            response.raise_for_status()
-
-            tree_items = response.json().get("tree", [])
+            tree_items = data.get("tree", [])
             log_api_request(
                 self.logger,
                 "GET",
@@ -334,12 +499,13 @@ class GitHubClient:
         """Get the latest release for a repository."""
         start_time = time.time()
         try:
-            response = await self.client.get(f"/repos/{owner}/{repo}/releases/latest")
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                f"/repos/{owner}/{repo}/releases/latest",
+                "GitHub",
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "GitHub")
-            response.raise_for_status()
-
-            data = response.json()
             log_api_request(
                 self.logger,
                 "GET",
@@ -14,14 +14,40 @@ import httpx
 from ..config import Config, get_terraform_registry_headers
 from ..exceptions import TerraformRegistryError
 from ..logging import get_logger, log_api_request
-from ..utils.cache import InMemoryCache
+from ..utils.cache import ETagCache, InMemoryCache
 from ..utils.rate_limiter import RateLimiter
-from .base import api_method, check_rate_limit_response
+from .base import api_method, conditional_get
+
+# Semantic version followed by a pre-release suffix, e.g. 1.0.0-beta.1
+_PRERELEASE_RE = re.compile(r"\d+\.\d+\.\d+-")
 
 
 def is_prerelease_version(version: str) -> bool:
     """Check if a version string is a pre-release version."""
-    return bool(re.match(r"^\d+\.\d+\.\d+-", version))
+    # Stable versions contain no hyphen, so most never reach the regex
+    return "-" in version and _PRERELEASE_RE.match(version) is not None
+
+
+def create_http_client(
+    config: Config, limits: httpx.Limits | None = None
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for the Terraform Registry.
+
+    Args:
+        config: Configuration instance
+        limits: Connection pool limits, or None for the per-client defaults
+            (pass larger limits for clients shared across tool calls)
+
+    Returns:
+        The HTTP client
+    """
+    return httpx.AsyncClient(
+        base_url=str(config.terraform_registry_url),
+        timeout=config.request_timeout,
+        headers=get_terraform_registry_headers(),
+        limits=limits or httpx.Limits(max_connections=10, max_keepalive_connections=5),
+    )
 
 
 class TerraformClient:
@@ -32,6 +58,8 @@ class TerraformClient:
         config: Config,
         cache: InMemoryCache | None = None,
         rate_limiter: RateLimiter | None = None,
+        etag_cache: ETagCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize the Terraform client.
@@ -40,6 +68,9 @@ class TerraformClient:
             config: Configuration instance
             cache: Cache instance, or None to create a new one
             rate_limiter: Rate limiter instance for request throttling
+            etag_cache: ETag store for conditional requests, or None to create a new one
+            http_client: Shared HTTP client to send requests through, or None to
+                create one owned (and closed) by this client
         """
         self.config = config
         self.cache = cache or InMemoryCache(
@@ -48,20 +79,18 @@ class TerraformClient:
             maxsize=config.cache_maxsize,
         )
         self.rate_limiter = rate_limiter
+        self.etags = etag_cache or ETagCache()
         self.logger = get_logger(__name__, client="terraform")
 
-        self.client = httpx.AsyncClient(
-            base_url=str(config.terraform_registry_url),
-            timeout=config.request_timeout,
-            headers=get_terraform_registry_headers(),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-        )
+        self._owns_client = http_client is None
+        self.client = http_client or create_http_client(config)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     @api_method(cache_key_prefix="tf_module_search")
     async def search_modules(
@@ -74,12 +103,14 @@ class TerraformClient:
             params["namespace"] = namespace
 
         try:
-            response = await self.client.get("/modules/search", params=params)
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                "/modules/search",
+                "Terraform Registry",
+                params=params,
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "Terraform Registry")
-            response.raise_for_status()
-
-            data = response.json()
             log_api_request(
                 self.logger,
                 "GET",
@@ -112,12 +143,14 @@ class TerraformClient:
             start_time = time.time()
             try:
                 params = {"namespace": namespace, "limit": limit, "offset": offset}
-                response = await self.client.get("/modules", params=params)
+                response, data = await conditional_get(
+                    self.client,
+                    self.etags,
+                    "/modules",
+                    "Terraform Registry",
+                    params=params,
+                )
                 duration_ms = (time.time() - start_time) * 1000
-                check_rate_limit_response(response, "Terraform Registry")
-                response.raise_for_status()
-
-                data = response.json()
                 modules = data.get("modules", [])
                 if not modules:
                     break
@@ -167,12 +200,10 @@ class TerraformClient:
             if version != "latest":
                 url += f"/{version}"
 
-            response = await self.client.get(url)
+            response, data = await conditional_get(
+                self.client, self.etags, url, "Terraform Registry"
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "Terraform Registry")
-            response.raise_for_status()
-
-            data = response.json()
             log_api_request(
                 self.logger,
                 "GET",
@@ -202,14 +233,13 @@ class TerraformClient:
         """Get available versions for a module."""
         start_time = time.time()
         try:
-            response = await self.client.get(
-                f"/modules/{namespace}/{name}/{provider}/versions"
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                f"/modules/{namespace}/{name}/{provider}/versions",
+                "Terraform Registry",
             )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "Terraform Registry")
-            response.raise_for_status()
-
-            data = response.json()
             modules = data.get("modules", [])
             if not modules:
                 all_versions = []
@@ -225,10 +255,12 @@ class TerraformClient:
             # Sort versions (latest first)
             from packaging.version import InvalidVersion, Version
 
-            try:
-                versions.sort(key=lambda v: Version(v), reverse=True)
-            except InvalidVersion:
-                pass
+            # list.sort computes each key once; skip it for trivially sorted lists
+            if len(versions) > 1:
+                try:
+                    versions.sort(key=Version, reverse=True)
+                except InvalidVersion:
+                    pass
 
             log_api_request(
                 self.logger,
@@ -286,12 +318,10 @@ class TerraformClient:
             if version != "latest":
                 url += f"/{version}"
 
-            response = await self.client.get(url)
+            response, data = await conditional_get(
+                self.client, self.etags, url, "Terraform Registry"
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "Terraform Registry")
-            response.raise_for_status()
-
-            data = response.json()
 
             # Log successful request
             log_api_request(
@@ -325,12 +355,13 @@ class TerraformClient:
         """Get information about a provider."""
         start_time = time.time()
         try:
-            response = await self.client.get(f"/providers/{namespace}/{name}")
+            response, data = await conditional_get(
+                self.client,
+                self.etags,
+                f"/providers/{namespace}/{name}",
+                "Terraform Registry",
+            )
             duration_ms = (time.time() - start_time) * 1000
-            check_rate_limit_response(response, "Terraform Registry")
-            response.raise_for_status()
-
-            data = response.json()
             log_api_request(
                 self.logger,
                 "GET",
@@ -1,34 +1,54 @@
 """
 Shared application context for TIM-MCP.
 
-This module holds shared instances (rate limiter, cache) that are initialized
-at server startup and can be imported by tools without circular import issues.
+This module holds shared instances (rate limiter, caches, HTTP connection pools)
+that are initialized at server startup and can be imported by tools without
+circular import issues.
 """
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
+
 if TYPE_CHECKING:
-    from .utils.cache import InMemoryCache
+    import httpx
+
+    from .utils.cache import ETagCache, InMemoryCache
     from .utils.rate_limiter import RateLimiter
 
 # Global instances initialized at server startup
 _rate_limiter: "RateLimiter | None" = None
 _cache: "InMemoryCache | None" = None
+_etag_cache: "ETagCache | None" = None
+# HTTP connection pools shared by client instances, keyed by API name
+_http_clients: dict[str, "httpx.AsyncClient"] = {}
+
+# Built search responses are reused for this many seconds
+SEARCH_RESPONSE_TTL = 300
+# Recently built search responses, keyed by the inputs that determine them
+_search_response_cache: TTLCache = TTLCache(maxsize=512, ttl=SEARCH_RESPONSE_TTL)
 
 
-def init_context(rate_limiter: "RateLimiter", cache: "InMemoryCache") -> None:
+def init_context(
+    rate_limiter: "RateLimiter",
+    cache: "InMemoryCache",
+    etag_cache: "ETagCache | None" = None,
+) -> None:
     """
-    Initialize the shared context with rate limiter and cache.
+    Initialize the shared context with rate limiter and caches.
 
     Called once at server startup.
 
     Args:
         rate_limiter: Global rate limiter instance
         cache: Shared cache instance
+        etag_cache: Shared store of ETags for conditional requests
     """
-    global _rate_limiter, _cache
+    global _rate_limiter, _cache, _etag_cache
     _rate_limiter = rate_limiter
     _cache = cache
+    _etag_cache = etag_cache
 
 
 def get_rate_limiter() -> "RateLimiter | None":
@@ -39,3 +59,53 @@ def get_rate_limiter() -> "RateLimiter | None":
 def get_cache() -> "InMemoryCache | None":
     """Get the shared cache instance."""
     return _cache
+
+
+def get_etag_cache() -> "ETagCache | None":
+    """Get the shared ETag cache instance."""
+    return _etag_cache
+
+
+def get_search_response_cache() -> TTLCache:
+    """Get the cache of recently built search responses."""
+    return _search_response_cache
+
+
+def reset_search_response_cache() -> None:
+    """Forget all cached search responses, e.g. between tests."""
+    _search_response_cache.clear()
+
+
+def get_http_client(
+    name: str, factory: "Callable[[], httpx.AsyncClient]"
+) -> "httpx.AsyncClient":
+    """
+    Get the shared HTTP client for an API, creating it on first use.
+
+    Reusing one client per API keeps connections alive between tool calls
+    instead of paying TCP/TLS setup on every request.
+
+    Args:
+        name: Key identifying the API the client talks to
+        factory: Builds the client when none exists yet (or it was closed)
+
+    Returns:
+        The shared HTTP client
+    """
+    client = _http_clients.get(name)
+    if client is None or client.is_closed:
+        client = _http_clients[name] = factory()
+    return client
+
+
+async def aclose_http_clients() -> None:
+    """
+    Close the shared HTTP clients and forget them.
+
+    Called at server shutdown; the next get_http_client call creates a fresh
+    client, so this is also safe to run between tests.
+    """
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
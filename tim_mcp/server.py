@@ -8,14 +8,16 @@ for Terraform IBM Modules discovery and implementation support.
 import json
 import textwrap
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
 from fastmcp import FastMCP
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
 from .config import Config, load_config
-from .context import init_context
+from .context import aclose_http_clients, init_context
 from .exceptions import TIMError
 from .exceptions import ValidationError as TIMValidationError
 from .logging import configure_logging, get_logger, log_tool_execution
@@ -26,7 +28,7 @@ from .types import (
     ModuleDetailsRequest,
     ModuleSearchRequest,
 )
-from .utils.cache import InMemoryCache
+from .utils.cache import ETagCache, InMemoryCache
 from .utils.rate_limiter import RateLimiter
 
 # Global configuration and logger
@@ -47,9 +49,10 @@ shared_cache = InMemoryCache(
     evict_ttl=config.cache_evict_ttl,
     maxsize=config.cache_maxsize,
 )
+shared_etag_cache = ETagCache()
 
 # Initialize shared context for tools
-init_context(global_rate_limiter, shared_cache)
+init_context(global_rate_limiter, shared_cache, shared_etag_cache)
 
 logger.info(
     "Cache initialized",
@@ -103,10 +106,20 @@ def _load_instructions() -> str:
         raise
 
 
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP connection pools when the server shuts down."""
+    try:
+        yield
+    finally:
+        await aclose_http_clients()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "TIM-MCP",
     instructions=_load_instructions(),
+    lifespan=_lifespan,
 )
 
 
@@ -174,8 +187,8 @@ def _sanitize_list_parameter(param: Any, param_name: str) -> list[str] | None:
 
 @mcp.tool()
 async def search_modules(
-    query: str,
-    limit: int = 5,
+    query: Annotated[str, Field(min_length=1)],
+    limit: Annotated[int, Field(ge=1, le=100)] = 5,
 ) -> str:
     """
     Search Terraform Registry for modules with intelligent result optimization.
@@ -193,14 +206,15 @@ async def search_modules(
     start_time = time.time()
 
     try:
-        # Validate request
-        request = ModuleSearchRequest(query=query, limit=limit)
+        # Parameters are validated against the tool schema before we are called,
+        # so building the request cannot raise a ValidationError
+        request = ModuleSearchRequest.from_validated(query=query, limit=limit)
 
         # Import here to avoid circular imports
-        from .tools.search import search_modules_impl
+        from .tools.search import search_modules_json_impl
 
         # Execute search
-        response = await search_modules_impl(request, config)
+        response_json = await search_modules_json_impl(request, config)
 
         # Log successful execution
         duration_ms = (time.time() - start_time) * 1000
@@ -212,22 +226,7 @@ async def search_modules(
             success=True,
         )
 
-        return response.model_dump_json(indent=2)
-
-    except ValidationError as e:
-        duration_ms = (time.time() - start_time) * 1000
-        log_tool_execution(
-            logger,
-            "search_modules",
-            {
-                "query": query,
-                "limit": limit,
-            },
-            duration_ms,
-            success=False,
-            error="validation_error",
-        )
-        raise TIMValidationError(f"Invalid parameters: {e}") from e
+        return response_json
 
     except TIMError:
         duration_ms = (time.time() - start_time) * 1000
@@ -10,7 +10,7 @@ from typing import Any
 
 from ..clients.terraform_client import TerraformClient
 from ..config import Config
-from ..context import get_cache, get_rate_limiter
+from ..context import get_cache, get_etag_cache, get_rate_limiter
 from ..exceptions import ModuleNotFoundError, TerraformRegistryError, ValidationError
 from ..types import ModuleDetailsRequest
 from ..utils.module_id import parse_module_id_with_version
@@ -274,8 +274,9 @@ async def get_module_details_impl(request: ModuleDetailsRequest, config: Config)
     # Initialize Terraform client and fetch data
     cache = get_cache()
     rate_limiter = get_rate_limiter()
+    etag_cache = get_etag_cache()
     async with TerraformClient(
-        config, cache=cache, rate_limiter=rate_limiter
+        config, cache=cache, rate_limiter=rate_limiter, etag_cache=etag_cache
     ) as terraform_client:
         try:
             # Fetch module details and versions concurrently for better performance
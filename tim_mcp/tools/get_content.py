@@ -12,7 +12,7 @@ from typing import Any
 
 from ..clients.github_client import GitHubClient
 from ..config import Config
-from ..context import get_cache, get_rate_limiter
+from ..context import get_cache, get_etag_cache, get_rate_limiter
 from ..logging import get_logger
 from ..types import GetContentRequest
 from ..utils.module_id import parse_module_id_with_version, transform_version_for_github
@@ -43,8 +43,9 @@ async def get_content_impl(
     if github_client is None:
         cache = get_cache()
         rate_limiter = get_rate_limiter()
+        etag_cache = get_etag_cache()
         async with GitHubClient(
-            config, cache=cache, rate_limiter=rate_limiter
+            config, cache=cache, rate_limiter=rate_limiter, etag_cache=etag_cache
         ) as github_client:
             return await _get_content_with_client(request, github_client)
     else:
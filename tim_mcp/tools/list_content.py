@@ -11,7 +11,7 @@ import re
 from ..clients.github_client import GitHubClient
 from ..clients.terraform_client import TerraformClient
 from ..config import Config
-from ..context import get_cache, get_rate_limiter
+from ..context import get_cache, get_etag_cache, get_rate_limiter
 from ..exceptions import (
     ModuleNotFoundError,
     TerraformRegistryError,
@@ -52,13 +52,14 @@ async def list_content_impl(request: ListContentRequest, config: Config) -> str:
     # Initialize clients with shared cache and rate limiter
     cache = get_cache()
     rate_limiter = get_rate_limiter()
+    etag_cache = get_etag_cache()
 
     # Use nested async context managers to ensure proper cleanup
     async with TerraformClient(
-        config, cache=cache, rate_limiter=rate_limiter
+        config, cache=cache, rate_limiter=rate_limiter, etag_cache=etag_cache
     ) as terraform_client:
         async with GitHubClient(
-            config, cache=cache, rate_limiter=rate_limiter
+            config, cache=cache, rate_limiter=rate_limiter, etag_cache=etag_cache
         ) as github_client:
             # Try Registry API first for examples and submodules
             try:
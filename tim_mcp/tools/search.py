@@ -11,19 +11,82 @@ The implementation follows these principles:
 - Data transformation to match the tool specification format
 """
 
-from datetime import datetime
+import asyncio
+import heapq
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
+import httpx
+from pydantic import HttpUrl, TypeAdapter
+
 from ..clients.github_client import GitHubClient
+from ..clients.github_client import create_http_client as create_github_http_client
 from ..clients.terraform_client import TerraformClient
+from ..clients.terraform_client import (
+    create_http_client as create_terraform_http_client,
+)
 from ..config import Config
-from ..context import get_cache, get_rate_limiter
-from ..exceptions import TIMError
+from ..context import (
+    get_cache,
+    get_etag_cache,
+    get_http_client,
+    get_rate_limiter,
+    get_search_response_cache,
+)
+from ..exceptions import ModuleNotFoundError, TIMError
 from ..exceptions import ValidationError as TIMValidationError
 from ..types import ModuleInfo, ModuleSearchRequest, ModuleSearchResponse
 
 # Required topics that must be present in the GitHub repository
-REQUIRED_TOPICS = ["core-team"]
+REQUIRED_TOPICS = frozenset({"core-team"})
+
+# Maximum number of repository validations running at the same time
+MAX_CONCURRENT_REPOSITORY_CHECKS = 10
+
+# Pool limits for the HTTP clients shared across search calls, which carry the
+# concurrent repository validations of every in-flight search
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Fields every module returned by the registry search must provide
+_REQUIRED_FIELDS = (
+    "id",
+    "namespace",
+    "name",
+    "provider",
+    "version",
+    "description",
+    "source",
+)
+_get_required_fields = itemgetter(*_REQUIRED_FIELDS)
+
+# Timestamp shape emitted by the Terraform Registry, e.g. 2025-09-02T08:33:15.000Z
+_REGISTRY_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z\Z"
+)
+
+# Validator for module source URLs, built once instead of per HttpUrl() call
+_SOURCE_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+# Key identifying a search's result: the query and limit, plus every setting
+# that changes which modules are returned
+_SearchKey = tuple[str, int, str | None, frozenset[str], str, str]
+
+# Searches currently running, keyed by the parameters that determine their result;
+# each resolves to the response and whether every lookup behind it succeeded
+_INFLIGHT: dict[_SearchKey, asyncio.Task[tuple[ModuleSearchResponse, bool]]] = {}
+
+
+@dataclass
+class _CachedSearch:
+    """A cached search response and, once serialized, its JSON text."""
+
+    response: ModuleSearchResponse
+    json: str | None = None
 
 
 def _validate_api_response_structure(api_response: Any) -> None:
@@ -68,6 +131,9 @@ async def search_modules_impl(
     This function searches for Terraform modules in the registry using the provided
     search criteria and returns formatted results. It handles API communication,
     validates responses, and transforms data to match the tool specification.
+    Concurrent calls with the same query and limit share a single search. When
+    all of its registry and GitHub lookups succeeded, its response is reused by
+    identical calls for five minutes.
 
     Args:
         request: The validated search request containing query parameters
@@ -81,23 +147,114 @@ async def search_modules_impl(
         RateLimitError: When API rate limits are exceeded
         ValidationError: When the API response format is invalid or malformed
     """
-    from ..logging import get_logger
+    namespace, key = _search_key(request, config)
+    response_cache = get_search_response_cache()
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached.response
+
+    # Concurrent identical searches share a single run against the registry
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_search_modules(request, config, namespace))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+
+    # Shield the shared run so a cancelled caller does not cancel it for the others
+    response, complete = await asyncio.shield(task)
+    # Results degraded by failed lookups are returned but not kept
+    if complete and key not in response_cache:
+        response_cache[key] = _CachedSearch(response)
+    return response
+
+
+async def search_modules_json_impl(request: ModuleSearchRequest, config: Config) -> str:
+    """
+    Search for modules and return the response as indented JSON text.
 
-    logger = get_logger(__name__)
+    The JSON text is kept in the cached response's entry, so repeated searches
+    skip re-serializing an unchanged result and both expire together.
 
+    Args:
+        request: The validated search request containing query parameters
+        config: Configuration instance for client setup and behavior
+
+    Returns:
+        JSON text of the ModuleSearchResponse
+    """
+    _, key = _search_key(request, config)
+    cached = get_search_response_cache().get(key)
+    if cached is not None and cached.json is not None:
+        return cached.json
+
+    response = await search_modules_impl(request, config)
+    text = response.model_dump_json(indent=2)
+
+    # Only keep the text alongside the response it was built from
+    cached = get_search_response_cache().get(key)
+    if cached is not None and cached.response is response:
+        cached.json = text
+    return text
+
+
+def _search_key(
+    request: ModuleSearchRequest, config: Config
+) -> tuple[str | None, _SearchKey]:
+    """Resolve the search namespace and the key identifying the search's result."""
     # Use the configured namespace (always the first allowed namespace)
     namespace = config.allowed_namespaces[0] if config.allowed_namespaces else None
+    return namespace, (
+        request.query,
+        request.limit,
+        namespace,
+        frozenset(config.excluded_modules),
+        str(config.terraform_registry_url),
+        str(config.github_base_url),
+    )
+
+
+async def _search_modules(
+    request: ModuleSearchRequest, config: Config, namespace: str | None
+) -> tuple[ModuleSearchResponse, bool]:
+    """
+    Run a module search in the given namespace; see search_modules_impl.
+
+    Returns:
+        The search response, and whether it was built without any failed
+        version or repository lookup
+    """
+    from ..logging import get_logger
+
+    logger = get_logger(__name__)
 
     # Create and use both Terraform and GitHub clients as async context managers
-    # Use shared cache and rate limiter from context
+    # Use shared cache, rate limiter and connection pools from context, so
+    # leaving the context managers does not close the pooled connections
     cache = get_cache()
     rate_limiter = get_rate_limiter()
+    etag_cache = get_etag_cache()
+    terraform_http = get_http_client(
+        "terraform", lambda: create_terraform_http_client(config, _POOL_LIMITS)
+    )
+    github_http = get_http_client(
+        "github", lambda: create_github_http_client(config, _POOL_LIMITS)
+    )
 
     async with (
         TerraformClient(
-            config, cache=cache, rate_limiter=rate_limiter
+            config,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            etag_cache=etag_cache,
+            http_client=terraform_http,
         ) as terraform_client,
-        GitHubClient(config, cache=cache, rate_limiter=rate_limiter) as github_client,
+        GitHubClient(
+            config,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            etag_cache=etag_cache,
+            http_client=github_http,
+        ) as github_client,
     ):
         try:
             # We need to fetch and validate modules until we have enough valid ones
@@ -106,8 +263,20 @@ async def search_modules_impl(
             batch_size = 50  # Fetch modules in smaller batches
             max_attempts = 10  # Prevent infinite loops
 
-            # Track the total count from the first API response
-            total_count = 0
+            # Total reported by the registry, taken from the first page that has it
+            total_count: int | None = None
+
+            # Bound concurrent repository checks to stay within GitHub rate limits
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPOSITORY_CHECKS)
+
+            # Hash lookups for exclusion checks, built once per search
+            excluded_modules = frozenset(config.excluded_modules)
+
+            # Modules already seen in earlier batches, keyed by (namespace, name, provider)
+            seen_modules: set[tuple[str, str, str]] = set()
+
+            # Cleared when a lookup fails and the result falls back or drops a module
+            complete = True
 
             attempt = 0
             while len(validated_modules) < request.limit and attempt < max_attempts:
@@ -127,10 +296,10 @@ async def search_modules_impl(
                 # Extract metadata from response
                 meta = api_response["meta"]
 
-                # Capture total_count from the first batch only
-                # Subsequent batches might have inconsistent or missing total_count
-                if attempt == 1:
-                    total_count = meta.get("total_count", 0)
+                # Keep the first reported total_count; later batches may omit it
+                # or report inconsistent values, so it is never reassigned
+                if total_count is None:
+                    total_count = meta.get("total_count")
 
                 # If no more modules available, break
                 if not api_response["modules"]:
@@ -147,6 +316,22 @@ async def search_modules_impl(
                     try:
                         module = _transform_module_data(module_data)
 
+                        # Skip modules already handled in an earlier batch
+                        module_key = (module.namespace, module.name, module.provider)
+                        if module_key in seen_modules:
+                            continue
+                        seen_modules.add(module_key)
+
+                        # Apply module exclusion filtering before any version lookups;
+                        # most configurations exclude nothing and skip the check
+                        if excluded_modules and _is_module_excluded(
+                            "/".join(module_key), excluded_modules
+                        ):
+                            logger.info(
+                                "Module excluded from results", module_id=module.id
+                            )
+                            continue
+
                         # Always fetch the latest stable version since the search API
                         # may return outdated versions with stale metadata (description, etc.)
                         try:
@@ -172,19 +357,21 @@ async def search_modules_impl(
                                 latest_description = latest_module_data.get(
                                     "description", module.description
                                 )
+                                if not isinstance(latest_stable, str) or not isinstance(
+                                    latest_description, str
+                                ):
+                                    raise ValueError(
+                                        "Latest version metadata is not a string"
+                                    )
 
-                                # Update the module with latest version and metadata
-                                module = ModuleInfo(
-                                    id=f"{module.namespace}/{module.name}/{module.provider}",
-                                    namespace=module.namespace,
-                                    name=module.name,
-                                    provider=module.provider,
-                                    version=latest_stable,
-                                    description=latest_description,
-                                    source_url=module.source_url,
-                                    downloads=module.downloads,
-                                    verified=module.verified,
-                                    published_at=module.published_at,
+                                # Update the module with latest version and metadata;
+                                # the other fields were validated when transformed
+                                module = module.model_copy(
+                                    update={
+                                        "id": f"{module.namespace}/{module.name}/{module.provider}",
+                                        "version": latest_stable,
+                                        "description": latest_description,
+                                    }
                                 )
 
                                 if module_data["version"] != latest_stable:
@@ -202,19 +389,13 @@ async def search_modules_impl(
                                 )
                                 continue
                         except Exception as e:
+                            complete = False
                             logger.warning(
                                 "Failed to fetch latest version for module, using search result version",
                                 module_id=module.id,
                                 error=str(e),
                             )
 
-                        # Apply module exclusion filtering
-                        if _is_module_excluded(module.id, config.excluded_modules):
-                            logger.info(
-                                "Module excluded from results", module_id=module.id
-                            )
-                            continue
-
                         batch_modules.append(module)
                     except Exception as e:
                         # Include context about which module failed
@@ -224,17 +405,40 @@ async def search_modules_impl(
                         )
                         continue
 
-                # Sort this batch by downloads in descending order
-                batch_modules.sort(key=lambda m: m.downloads, reverse=True)
-
-                # Validate repositories for modules in this batch
-                for module in batch_modules:
-                    if len(validated_modules) >= request.limit:
+                # Validate repositories for modules in this batch, most downloaded
+                # first; only the modules we actually consume get ordered
+                candidates = _iter_by_downloads(batch_modules)
+                while len(validated_modules) < request.limit:
+                    # Check as many repositories concurrently as results are missing
+                    window = list(
+                        islice(candidates, request.limit - len(validated_modules))
+                    )
+                    if not window:
                         break
 
-                    # Check if repository meets our criteria
-                    if await _is_repository_valid(module, github_client, logger):
-                        validated_modules.append(module)
+                    # With a token, look up the window's repositories in a single
+                    # GraphQL request; without one, each check fetches its own
+                    repo_infos = (
+                        await _fetch_repository_infos(window, github_client, logger)
+                        if config.github_token
+                        else None
+                    )
+
+                    results = await asyncio.gather(
+                        *(
+                            _check_repository(
+                                module, github_client, logger, repo_infos, semaphore
+                            )
+                            for module in window
+                        )
+                    )
+                    if None in results:
+                        complete = False
+                    validated_modules.extend(
+                        module
+                        for module, valid in zip(window, results, strict=True)
+                        if valid
+                    )
 
                 # Move to next batch
                 offset += batch_size
@@ -253,7 +457,7 @@ async def search_modules_impl(
             # Since the Terraform Registry API doesn't return total_count,
             # we use the actual number of modules we found and validated
             # If total_count was provided in the API response, use that; otherwise use our count
-            result_total = total_count if total_count > 0 else len(final_modules)
+            result_total = total_count or len(final_modules)
 
             logger.info(
                 "Search completed",
@@ -263,11 +467,12 @@ async def search_modules_impl(
             )
 
             # Create and return the formatted response
-            return ModuleSearchResponse(
+            response = ModuleSearchResponse(
                 query=request.query,
                 total_found=result_total,
                 modules=final_modules,
             )
+            return response, complete
 
         except TIMError:
             # Re-raise TIM errors as-is to preserve error context
@@ -299,19 +504,16 @@ def _transform_module_data(module_data: dict[str, Any]) -> ModuleInfo:
         ValueError: When required fields are missing or invalid
         TypeError: When field types are unexpected
     """
-    # Validate required fields exist
-    required_fields = [
-        "id",
-        "namespace",
-        "name",
-        "provider",
-        "version",
-        "description",
-        "source",
-    ]
-    missing_fields = [field for field in required_fields if field not in module_data]
-    if missing_fields:
-        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+    # Unpack required fields in a single pass, reporting all missing ones on failure
+    try:
+        module_id, namespace, name, provider, version, description, source = (
+            _get_required_fields(module_data)
+        )
+    except KeyError:
+        missing_fields = [f for f in _REQUIRED_FIELDS if f not in module_data]
+        raise ValueError(
+            f"Missing required fields: {', '.join(missing_fields)}"
+        ) from None
 
     # Transform the published_at datetime
     published_at_str = module_data.get("published_at", "")
@@ -319,10 +521,7 @@ def _transform_module_data(module_data: dict[str, Any]) -> ModuleInfo:
         raise ValueError("Missing or empty 'published_at' field")
 
     try:
-        # Handle the ISO format with 'Z' suffix (common in Terraform Registry)
-        if published_at_str.endswith("Z"):
-            published_at_str = published_at_str[:-1] + "+00:00"
-        published_at = datetime.fromisoformat(published_at_str)
+        published_at = _parse_published_at(published_at_str)
     except (ValueError, TypeError) as e:
         raise ValueError(
             f"Invalid published_at format '{published_at_str}': {e}"
@@ -337,32 +536,99 @@ def _transform_module_data(module_data: dict[str, Any]) -> ModuleInfo:
     if not isinstance(verified, bool):
         verified = False  # Fallback to False for invalid verification status
 
-    # Create and return the ModuleInfo object
-    # Pydantic will perform additional validation on the fields
+    text_fields = (module_id, namespace, name, provider, version, description)
+    if not all(isinstance(field, str) for field in text_fields):
+        raise ValueError("Required text fields must be strings")
+
     try:
-        return ModuleInfo(
-            id=module_data["id"],
-            namespace=module_data["namespace"],
-            name=module_data["name"],
-            provider=module_data["provider"],
-            version=module_data["version"],
-            description=module_data["description"],
-            source_url=module_data["source"],  # Pydantic validates as HttpUrl
-            downloads=downloads,
-            verified=verified,
-            published_at=published_at,
-        )
+        source_url = _SOURCE_URL_ADAPTER.validate_python(source)
     except Exception as e:
-        raise ValueError(f"Failed to create ModuleInfo object: {e}") from e
+        raise ValueError(f"Invalid source URL '{source}': {e}") from e
+
+    # Every field has been checked above, so skip a second Pydantic validation pass
+    return ModuleInfo.model_construct(
+        id=module_id,
+        namespace=namespace,
+        name=name,
+        provider=provider,
+        version=version,
+        description=description,
+        source_url=source_url,
+        downloads=downloads,
+        verified=verified,
+        published_at=published_at,
+    )
+
+
+def _parse_published_at(value: str) -> datetime:
+    """
+    Parse a registry publication timestamp.
+
+    The Terraform Registry emits UTC timestamps such as
+    ``2025-09-02T08:33:15.000Z``; those are built directly from the regex groups,
+    anything else goes through ``datetime.fromisoformat``.
+
+    Args:
+        value: Timestamp string from the registry
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: When the timestamp is not a valid ISO 8601 datetime
+    """
+    match = _REGISTRY_TIMESTAMP_RE.match(value)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=UTC,
+        )
+
+    # Handle other ISO formats, including a 'Z' suffix without the fast-path shape
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
 
 
-def _is_module_excluded(module_id: str, excluded_modules: list[str]) -> bool:
+def _iter_by_downloads(modules: list[ModuleInfo]) -> Iterator[ModuleInfo]:
     """
-    Check if a module ID is in the exclusion list.
+    Yield modules by download count in descending order.
+
+    Modules with equal download counts keep their original order. A heap is
+    used instead of a full sort because callers usually stop after a few
+    modules.
+
+    Args:
+        modules: Modules to order
+
+    Yields:
+        Modules from most to least downloaded
+    """
+    # Nothing to order on empty or single-module pages
+    if len(modules) < 2:
+        yield from modules
+        return
+
+    heap = [(-module.downloads, i, module) for i, module in enumerate(modules)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def _is_module_excluded(module_id: str, excluded_modules: frozenset[str]) -> bool:
+    """
+    Check if a module ID is in the exclusion set.
 
     Args:
         module_id: The full module identifier (e.g., "terraform-ibm-modules/vpc/ibm")
-        excluded_modules: List of module IDs to exclude
+        excluded_modules: Set of module IDs to exclude
 
     Returns:
         True if the module should be excluded, False otherwise
@@ -370,75 +636,145 @@ def _is_module_excluded(module_id: str, excluded_modules: list[str]) -> bool:
     return module_id in excluded_modules
 
 
-async def _is_repository_valid(
-    module: ModuleInfo, github_client: GitHubClient, logger
-) -> bool:
+async def _fetch_repository_infos(
+    modules: list[ModuleInfo], github_client: GitHubClient, logger
+) -> dict[tuple[str, str], dict[str, Any]] | None:
     """
-    Validate if a repository meets our criteria (not archived, has required topics).
+    Fetch repository information for a window of modules in one request.
 
     Args:
-        module: Module information containing source URL
+        modules: Modules whose source repositories should be looked up
         github_client: GitHub client to fetch repository info
         logger: Logger instance for logging
 
     Returns:
-        True if the repository meets all criteria, False otherwise
+        Mapping of (owner, repo) to repository information, or None if the
+        batched lookup failed and repositories must be fetched individually
     """
-    try:
-        # Parse GitHub URL from source URL
+    repos = []
+    for module in modules:
         repo_info = github_client.parse_github_url(str(module.source_url))
-        if not repo_info:
+        if repo_info:
+            repos.append(repo_info)
+
+    if not repos:
+        return {}
+
+    try:
+        return await github_client.batch_get_repository_info(repos)
+    except Exception as e:
+        logger.warning(
+            "Batched repository lookup failed, validating repositories individually",
+            repo_count=len(repos),
+            error=str(e),
+        )
+        return None
+
+
+async def _check_repository(
+    module: ModuleInfo,
+    github_client: GitHubClient,
+    logger,
+    repo_infos: dict[tuple[str, str], dict[str, Any]] | None,
+    semaphore: asyncio.Semaphore,
+) -> bool | None:
+    """
+    Run _is_repository_valid while holding a slot of the concurrency limit.
+
+    Returns:
+        Whether the repository is valid, or None if it could not be checked
+    """
+    async with semaphore:
+        try:
+            return await _is_repository_valid(module, github_client, logger, repo_infos)
+        except Exception as e:
             logger.warning(
-                "Could not parse GitHub URL from source",
+                "Failed to validate repository, excluding module",
                 module_id=module.id,
                 source_url=str(module.source_url),
+                error=str(e),
             )
-            return False
+            return None
 
-        owner, repo_name = repo_info
 
-        # Get repository information
-        repo_data = await github_client.get_repository_info(owner, repo_name)
+async def _is_repository_valid(
+    module: ModuleInfo,
+    github_client: GitHubClient,
+    logger,
+    repo_infos: dict[tuple[str, str], dict[str, Any]] | None = None,
+) -> bool:
+    """
+    Validate if a repository meets our criteria (not archived, has required topics).
 
-        # Check if repository is archived
-        if repo_data.get("archived", False):
-            logger.info(
-                "Repository is archived, excluding module",
-                module_id=module.id,
-                repo=f"{owner}/{repo_name}",
-            )
-            return False
+    Args:
+        module: Module information containing source URL
+        github_client: GitHub client to fetch repository info
+        logger: Logger instance for logging
+        repo_infos: Prefetched repository information from
+            _fetch_repository_infos, or None to fetch it from GitHub
 
-        # Check if repository has all required topics
-        repo_topics = repo_data.get("topics", [])
-        missing_topics = [
-            topic for topic in REQUIRED_TOPICS if topic not in repo_topics
-        ]
+    Returns:
+        True if the repository meets all criteria, False otherwise
 
-        if missing_topics:
-            logger.info(
-                "Repository missing required topics, excluding module",
-                module_id=module.id,
-                repo=f"{owner}/{repo_name}",
-                missing_topics=missing_topics,
-                required_topics=REQUIRED_TOPICS,
-                repo_topics=repo_topics,
-            )
-            return False
+    Raises:
+        GitHubError: If the repository information cannot be fetched
+        RateLimitError: If the GitHub API reports rate limiting
+    """
+    # Parse GitHub URL from source URL
+    repo_info = github_client.parse_github_url(str(module.source_url))
+    if not repo_info:
+        logger.warning(
+            "Could not parse GitHub URL from source",
+            module_id=module.id,
+            source_url=str(module.source_url),
+        )
+        return False
+
+    owner, repo_name = repo_info
 
+    # Get repository information
+    if repo_infos is None:
+        try:
+            repo_data = await github_client.get_repository_info(owner, repo_name)
+        except ModuleNotFoundError:
+            repo_data = None
+    else:
+        repo_data = repo_infos.get((owner, repo_name))
+
+    if repo_data is None:
         logger.info(
-            "Repository passed validation",
+            "Repository not found, excluding module",
             module_id=module.id,
             repo=f"{owner}/{repo_name}",
-            repo_topics=repo_topics,
         )
-        return True
+        return False
 
-    except Exception as e:
-        logger.warning(
-            "Failed to validate repository, excluding module",
+    # Check if repository is archived
+    if repo_data.get("archived", False):
+        logger.info(
+            "Repository is archived, excluding module",
             module_id=module.id,
-            source_url=str(module.source_url),
-            error=str(e),
+            repo=f"{owner}/{repo_name}",
         )
         return False
+
+    # Check if repository has all required topics
+    repo_topics = repo_data.get("topics", [])
+    if not REQUIRED_TOPICS.issubset(repo_topics):
+        logger.info(
+            "Repository missing required topics, excluding module",
+            module_id=module.id,
+            repo=f"{owner}/{repo_name}",
+            missing_topics=sorted(REQUIRED_TOPICS.difference(repo_topics)),
+            required_topics=sorted(REQUIRED_TOPICS),
+            repo_topics=repo_topics,
+        )
+        return False
+
+    logger.info(
+        "Repository passed validation",
+        module_id=module.id,
+        repo=f"{owner}/{repo_name}",
+        repo_topics=repo_topics,
+    )
+    return True
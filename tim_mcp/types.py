@@ -8,7 +8,7 @@ the TIM-MCP server for request/response validation and schema generation.
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class ModuleSearchRequest(BaseModel):
@@ -17,6 +17,16 @@ class ModuleSearchRequest(BaseModel):
     query: str = Field(..., min_length=1, description="Search term")
     limit: int = Field(5, ge=1, le=100, description="Maximum results to return")
 
+    @classmethod
+    def from_validated(cls, query: str, limit: int = 5) -> "ModuleSearchRequest":
+        """
+        Build a request from parameters that have already been validated.
+
+        Skips Pydantic validation, so callers must guarantee the field
+        constraints (non-empty query, limit between 1 and 100) themselves.
+        """
+        return cls.model_construct(query=query, limit=limit)
+
 
 class ModuleInfo(BaseModel):
     """Module information from registry search."""
@@ -32,6 +42,9 @@ class ModuleInfo(BaseModel):
     verified: bool = Field(..., description="Verification status")
     published_at: datetime = Field(..., description="Publication date")
 
+    # Search responses are cached and shared between callers, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
 
 class ModuleSearchResponse(BaseModel):
     """Response model for module search."""
@@ -40,6 +53,8 @@ class ModuleSearchResponse(BaseModel):
     total_found: int = Field(..., ge=0, description="Total modules found")
     modules: list[ModuleInfo] = Field(..., description="Module results")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SubmoduleSummary(BaseModel):
     """Brief submodule information for module listing."""
@@ -1,16 +1,22 @@
 """In-memory caching with fresh/stale TTL using cachetools."""
 
+import time
+from collections.abc import Callable
 from threading import RLock
 from typing import Any
 
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 
 
 class InMemoryCache:
     """Thread-safe cache with stale fallback using two TTLCache instances."""
 
     def __init__(
-        self, fresh_ttl: int = 3600, evict_ttl: int = 86400, maxsize: int = 1000
+        self,
+        fresh_ttl: int = 3600,
+        evict_ttl: int = 86400,
+        maxsize: int = 1000,
+        timer: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize the cache.
@@ -19,6 +25,7 @@ class InMemoryCache:
             fresh_ttl: TTL for fresh entries in seconds (default: 1 hour)
             evict_ttl: TTL before eviction in seconds (default: 24 hours)
             maxsize: Maximum cache entries per cache
+            timer: Clock used to expire entries (default: time.monotonic)
 
         Raises:
             ValueError: If evict_ttl is not greater than or equal to fresh_ttl
@@ -27,8 +34,8 @@ class InMemoryCache:
             raise ValueError(
                 f"evict_ttl ({evict_ttl}) must be greater than or equal to fresh_ttl ({fresh_ttl})"
             )
-        self._fresh = TTLCache(maxsize=maxsize, ttl=fresh_ttl)
-        self._stale = TTLCache(maxsize=maxsize, ttl=evict_ttl)
+        self._fresh = TTLCache(maxsize=maxsize, ttl=fresh_ttl, timer=timer)
+        self._stale = TTLCache(maxsize=maxsize, ttl=evict_ttl, timer=timer)
         self._lock = RLock()
 
     def get(self, key: str, allow_stale: bool = False) -> Any:
@@ -62,4 +69,38 @@ class InMemoryCache:
             return True
 
 
+class ETagCache:
+    """Thread-safe LRU store of (etag, raw body) pairs keyed by request URL."""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the ETag store.
+
+        Args:
+            max_bytes: Maximum total size of the stored bodies; least recently
+                used entries are dropped to stay below it
+        """
+        self._entries = LRUCache(maxsize=max_bytes, getsizeof=lambda e: len(e[1]))
+        self._lock = RLock()
+
+    def get(self, url: str) -> tuple[str, bytes] | None:
+        """Get the stored (etag, body) pair for a URL."""
+        with self._lock:
+            return self._entries.get(url)
+
+    def set(self, url: str, etag: str, body: bytes) -> None:
+        """Store the validator and raw body returned for a URL."""
+        with self._lock:
+            try:
+                self._entries[url] = (etag, body)
+            except ValueError:
+                # Bodies larger than the whole store are not kept
+                self._entries.pop(url, None)
+
+    def clear(self) -> None:
+        """Forget all stored validators."""
+        with self._lock:
+            self._entries.clear()
+
+
 Cache = InMemoryCache